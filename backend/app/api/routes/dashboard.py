@@ -1,14 +1,29 @@
-from fastapi import APIRouter, Depends
-from sqlalchemy.orm import Session
+from datetime import datetime
 
-from app.database import get_db
-from app.schemas.event import DashboardStatsResponse
+from fastapi import APIRouter, Depends, HTTPException, Query
+
+from app.database import get_read_db, run_read
+from app.profiling import ProfiledRoute
+from app.schemas.event import DashboardStatsResponse, MonthWindowStats
+from app.services.dashboard_stats_service import DashboardStatsService
 from app.services.event_service import EventService
 
-router = APIRouter(prefix="/dashboard", tags=["dashboard"])
+router = APIRouter(prefix="/dashboard", tags=["dashboard"], route_class=ProfiledRoute)
 
 
 @router.get("/stats", response_model=DashboardStatsResponse)
-def get_dashboard_stats(db: Session = Depends(get_db)):
-    service = EventService(db)
-    return service.get_dashboard_stats()
+async def get_dashboard_stats(db=Depends(get_read_db)):
+    return await run_read(db, lambda session: EventService(session).get_dashboard_stats())
+
+
+@router.get("/months", response_model=list[MonthWindowStats])
+async def get_month_windows(
+    start: str | None = Query(None, pattern=r"^\d{4}-\d{2}$", description="First month, YYYY-MM (default: current)"),
+    months: int = Query(3, ge=1, le=24),
+    db=Depends(get_read_db),
+):
+    try:
+        first = datetime.strptime(start, "%Y-%m").date() if start else datetime.utcnow().date()
+    except ValueError:
+        raise HTTPException(status_code=400, detail="start must be a valid YYYY-MM month")
+    return await run_read(db, lambda session: DashboardStatsService(session).get_month_windows(first, months))
@@ -1,45 +1,56 @@
 from datetime import date
 
 from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy.orm import Session
 
-from app.database import get_db
+from app.database import get_read_db, run_read
+from app.profiling import ProfiledRoute
 from app.schemas.event import EventDetailResponse, EventResponse, PaginatedEventResponse
 from app.services.event_service import EventService
 
-router = APIRouter(prefix="/events", tags=["events"])
+router = APIRouter(prefix="/events", tags=["events"], route_class=ProfiledRoute)
 
 
 @router.get("/", response_model=PaginatedEventResponse)
-def list_events(
-    city: str | None = None,
+async def list_events(
+    city: list[str] | None = Query(None, description="One or more cities; repeat or comma-separate"),
     date_from: date | None = None,
     date_to: date | None = None,
     min_hype: float | None = None,
     min_sales_potential: float | None = None,
-    genre: str | None = None,
+    genre: list[str] | None = Query(None, description="One or more genres; repeat or comma-separate"),
+    state: list[str] | None = Query(None, description="One or more states (UF)"),
+    q: str | None = Query(None, description="Full-text search over title, artist, venue and city"),
     page: int = Query(1, ge=1),
     page_size: int = Query(50, ge=1, le=100),
-    db: Session = Depends(get_db),
+    cursor: str | None = Query(None, description="next_cursor from the previous page; replaces page"),
+    include_total: bool | None = Query(None, description="Count matching events (default: only without cursor)"),
+    count_mode: str = Query("exact", pattern="^(exact|estimated)$", description="'estimated' answers from facet counts when it can"),
+    db=Depends(get_read_db),
 ):
-    service = EventService(db)
-    result = service.list_events(
-        city=city,
-        date_from=date_from,
-        date_to=date_to,
-        min_hype=min_hype,
-        min_sales_potential=min_sales_potential,
-        genre=genre,
-        page=page,
-        page_size=page_size,
-    )
+    try:
+        result = await run_read(db, lambda session: EventService(session).list_events(
+            city=city,
+            date_from=date_from,
+            date_to=date_to,
+            min_hype=min_hype,
+            min_sales_potential=min_sales_potential,
+            genre=genre,
+            state=state,
+            q=q,
+            page=page,
+            page_size=page_size,
+            cursor=cursor,
+            include_total=include_total,
+            count_mode=count_mode,
+        ))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     return result
 
 
 @router.get("/{event_id}", response_model=EventDetailResponse)
-def get_event(event_id: int, db: Session = Depends(get_db)):
-    service = EventService(db)
-    event = service.get_event_detail(event_id)
+async def get_event(event_id: int, db=Depends(get_read_db)):
+    event = await run_read(db, lambda session: EventService(session).get_event_detail(event_id))
     if not event:
         raise HTTPException(status_code=404, detail="Event not found")
     return event
@@ -0,0 +1,83 @@
+from datetime import date
+
+from fastapi import APIRouter, Query
+from fastapi.responses import StreamingResponse
+
+from app.profiling import ProfiledRoute
+from app.services.export_service import FORMATS, stream_export
+
+router = APIRouter(prefix="/export", tags=["export"], route_class=ProfiledRoute)
+
+FORMAT_QUERY = Query("ndjson", pattern="^(ndjson|csv)$", description="ndjson or csv")
+
+
+def _export_response(dataset: str, fmt: str, filters: dict) -> StreamingResponse:
+    return StreamingResponse(
+        stream_export(dataset, fmt, filters),
+        media_type=FORMATS[fmt],
+        headers={"Content-Disposition": f'attachment; filename="{dataset}.{fmt}"'},
+    )
+
+
+@router.get("/events")
+def export_events(
+    format: str = FORMAT_QUERY,
+    city: list[str] | None = Query(None, description="One or more cities; repeat or comma-separate"),
+    date_from: date | None = None,
+    date_to: date | None = None,
+    min_hype: float | None = None,
+    min_sales_potential: float | None = None,
+    genre: list[str] | None = Query(None, description="One or more genres; repeat or comma-separate"),
+    state: list[str] | None = Query(None, description="One or more states (UF)"),
+    q: str | None = Query(None, description="Full-text search over title, artist, venue and city"),
+):
+    """All events matching the /events filters, in date order."""
+    return _export_response("events", format, {
+        "city": city,
+        "date_from": date_from,
+        "date_to": date_to,
+        "min_hype": min_hype,
+        "min_sales_potential": min_sales_potential,
+        "genre": genre,
+        "state": state,
+        "q": q,
+    })
+
+
+@router.get("/snapshots")
+def export_snapshots(
+    format: str = FORMAT_QUERY,
+    event_id: int | None = None,
+    date_from: date | None = Query(None, description="Snapshots taken on or after this day"),
+    date_to: date | None = Query(None, description="Snapshots taken on or before this day"),
+    ticket_status: str | None = None,
+):
+    return _export_response("snapshots", format, {
+        "event_id": event_id,
+        "date_from": date_from,
+        "date_to": date_to,
+        "ticket_status": ticket_status,
+    })
+
+
+@router.get("/products")
+def export_products(
+    format: str = FORMAT_QUERY,
+    platform: str | None = None,
+    related_artist: str | None = None,
+    category: str | None = None,
+    min_price: float | None = None,
+    max_price: float | None = None,
+    min_sold: int | None = None,
+    search: str | None = None,
+):
+    """All products matching the /marketplace/products filters, by id."""
+    return _export_response("products", format, {
+        "platform": platform,
+        "related_artist": related_artist,
+        "category": category,
+        "min_price": min_price,
+        "max_price": max_price,
+        "min_sold": min_sold,
+        "search": search,
+    })
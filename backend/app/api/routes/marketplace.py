@@ -1,22 +1,39 @@
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.orm import Session
 
-from app.database import get_db
+from app.database import get_db, get_read_db, run_read
+from app.forecasting import CostParameters
+from app.profiling import ProfiledRoute
 from app.schemas.marketplace import (
     MarketplaceProductResponse,
     MarketplaceStatsResponse,
     PaginatedMarketplaceResponse,
     SalesProjectionResponse,
+    SimulationRequest,
 )
 from app.schemas.marketplace import ScrapeTriggerRequest
 from app.services.marketplace_scraping_service import MarketplaceScrapingService
-from app.services.marketplace_service import MarketplaceService
+from app.services.marketplace_service import MarketplaceService, forecast_cache, forecast_flight
+from app.services.simulation_service import SimulationService
+from app.simulation import SimulationBusy
 
-router = APIRouter(prefix="/marketplace", tags=["marketplace"])
+router = APIRouter(prefix="/marketplace", tags=["marketplace"], route_class=ProfiledRoute)
+
+
+def cost_parameters(
+    production_cost: float | None = Query(None, gt=0, description="Cost per unit in R$ (default from config)"),
+    marketplace_fee_pct: float | None = Query(None, ge=0, lt=1, description="Marketplace fee as a fraction"),
+    conversion_rate: float | None = Query(None, gt=0, le=1, description="Share of the audience that buys online"),
+) -> CostParameters:
+    return CostParameters.from_settings(
+        production_cost=production_cost,
+        marketplace_fee_pct=marketplace_fee_pct,
+        base_conversion_rate=conversion_rate,
+    )
 
 
 @router.get("/products", response_model=PaginatedMarketplaceResponse)
-def list_products(
+async def list_products(
     platform: str | None = None,
     related_artist: str | None = None,
     category: str | None = None,
@@ -27,42 +44,75 @@ def list_products(
     sort_by: str | None = None,
     page: int = Query(1, ge=1),
     page_size: int = Query(30, ge=1, le=100),
-    db: Session = Depends(get_db),
+    cursor: str | None = Query(None, description="next_cursor from the previous page; replaces page"),
+    include_total: bool | None = Query(None, description="Count matching products (default: only without cursor)"),
+    count_mode: str = Query("exact", pattern="^(exact|estimated)$", description="'estimated' answers from facet counts when it can"),
+    db=Depends(get_read_db),
 ):
-    service = MarketplaceService(db)
-    return service.list_products(
-        platform=platform,
-        related_artist=related_artist,
-        category=category,
-        min_price=min_price,
-        max_price=max_price,
-        min_sold=min_sold,
-        search=search,
-        sort_by=sort_by,
-        page=page,
-        page_size=page_size,
-    )
+    try:
+        return await run_read(db, lambda session: MarketplaceService(session).list_products(
+            platform=platform,
+            related_artist=related_artist,
+            category=category,
+            min_price=min_price,
+            max_price=max_price,
+            min_sold=min_sold,
+            search=search,
+            sort_by=sort_by,
+            page=page,
+            page_size=page_size,
+            cursor=cursor,
+            include_total=include_total,
+            count_mode=count_mode,
+        ))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
 
 
 @router.get("/stats", response_model=MarketplaceStatsResponse)
-def get_marketplace_stats(db: Session = Depends(get_db)):
-    service = MarketplaceService(db)
-    return service.get_stats()
+async def get_marketplace_stats(db=Depends(get_read_db)):
+    return await run_read(db, lambda session: MarketplaceService(session).get_stats())
 
 
 @router.get("/projection", response_model=SalesProjectionResponse)
-def get_sales_projection(db: Session = Depends(get_db)):
+def get_sales_projection(
+    params: CostParameters = Depends(cost_parameters),
+    db: Session = Depends(get_db),
+):
+    # CPU-bound and single-flighted: stays on the threadpool, off the event loop
     service = MarketplaceService(db)
-    return service.get_sales_projection()
+    return service.get_sales_projection(params)
 
 
 @router.get("/event-forecast")
 def get_event_forecast(
     days: int = Query(90, ge=7, le=365),
+    limit: int | None = Query(None, ge=1, le=1000, description="Page size for the events list (default: all)"),
+    cursor: str | None = Query(None, description="next_cursor from the previous page"),
+    params: CostParameters = Depends(cost_parameters),
     db: Session = Depends(get_db),
 ):
     service = MarketplaceService(db)
-    return service.get_event_forecast(days_ahead=days)
+    try:
+        return service.get_event_forecast(days_ahead=days, limit=limit, cursor=cursor, params=params)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
+@router.get("/forecast-stats")
+def get_forecast_stats():
+    """Projection/forecast cache hits and single-flight coalescing counters."""
+    return {"cache": forecast_cache.stats(), "single_flight": forecast_flight.stats()}
+
+
+@router.post("/simulate")
+async def simulate_scenarios(request: SimulationRequest, db: Session = Depends(get_db)):
+    """Monte Carlo revenue/profit percentiles for the upcoming events."""
+    service = SimulationService(db)
+    try:
+        return await service.run(request)
+    except SimulationBusy as e:
+        raise HTTPException(status_code=503, detail=str(e))
 
 
 @router.post("/scrape")
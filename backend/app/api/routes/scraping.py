@@ -1,11 +1,13 @@
 from fastapi import APIRouter, Depends, Query
 from sqlalchemy.orm import Session
 
-from app.database import get_db
+from app.database import get_db, get_read_db, run_read
+from app.profiling import ProfiledRoute
 from app.schemas.event import ScrapingLogResponse, ScrapingTriggerRequest, ScrapingTriggerResponse
+from app.services.ingest_pipeline import pipeline_registry
 from app.services.scraping_service import ScrapingService
 
-router = APIRouter(prefix="/scraping", tags=["scraping"])
+router = APIRouter(prefix="/scraping", tags=["scraping"], route_class=ProfiledRoute)
 
 
 @router.post("/trigger", response_model=ScrapingTriggerResponse)
@@ -21,13 +23,18 @@ async def trigger_scraping(
 
 
 @router.get("/logs", response_model=list[ScrapingLogResponse])
-def get_scraping_logs(
+async def get_scraping_logs(
     platform: str | None = None,
     limit: int = Query(20, ge=1, le=100),
-    db: Session = Depends(get_db),
+    db=Depends(get_read_db),
 ):
-    service = ScrapingService(db)
-    return service.get_logs(platform=platform, limit=limit)
+    return await run_read(db, lambda session: ScrapingService(session).get_logs(platform=platform, limit=limit))
+
+
+@router.get("/pipelines")
+def get_pipeline_stats():
+    """Queue depth and per-stage throughput of the latest ingest pipelines."""
+    return [stats.to_dict() for stats in pipeline_registry.values()]
 
 
 @router.get("/test-fetch")
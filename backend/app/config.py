@@ -7,11 +7,74 @@ class Settings(BaseSettings):
     API_PORT: int = 8000
     API_CORS_ORIGINS: str = "http://localhost:3000,https://*.vercel.app,https://*.railway.app"
 
+    # What `python run.py` starts: "api" (HTTP server), "worker" (one scraping
+    # pass, then exit) or "scheduler" (a scraping pass every SCRAPING_INTERVAL_HOURS)
+    APP_ROLE: str = "api"
+
     SCRAPING_INTERVAL_HOURS: int = 12
     SCRAPING_RATE_LIMIT_SECONDS: float = 2.0
     SCRAPING_TIMEOUT_SECONDS: int = 30
     SCRAPING_MAX_RETRIES: int = 3
 
+    INGEST_QUEUE_SIZE: int = 1000
+    INGEST_BATCH_SIZE: int = 500
+    INGEST_FLUSH_SECONDS: float = 2.0
+
+    DB_WRITER_MAX_COALESCE: int = 64
+    DB_ECHO: bool = False
+    DB_READ_POOL_SIZE: int = 8
+    DB_READ_POOL_OVERFLOW: int = 8
+    # Experimental: serve read routes from an aiosqlite AsyncSession instead of the
+    # threadpool. SQLite only, and slower there so far (benchmarks/async_reads.py)
+    ASYNC_READS: bool = False
+
+    # Prebuilt seed database (python seed_data.py --output PATH), copied into
+    # place on startup when the SQLite database does not exist yet
+    SEED_DATABASE: str | None = None
+
+    # SQLite tuning: pick a profile ("tuned" or "default"), then override single
+    # pragmas. Unset keeps the profile value, an empty string turns it off.
+    SQLITE_PROFILE: str = "tuned"
+    SQLITE_JOURNAL_MODE: str | None = None
+    SQLITE_SYNCHRONOUS: str | None = None
+    SQLITE_MMAP_SIZE: int | str | None = None
+    SQLITE_CACHE_SIZE: int | str | None = None
+    SQLITE_TEMP_STORE: str | None = None
+    SQLITE_BUSY_TIMEOUT_MS: int | str | None = None
+    SQLITE_AUTO_VACUUM: str | None = None
+
+    # Run ANALYZE / PRAGMA optimize / incremental vacuum after this many ingested rows
+    DB_MAINTENANCE_ROWS: int = 5000
+    DB_VACUUM_PAGES: int = 2000
+
+    # Cached list totals and facet counts, invalidated by the data version
+    COUNT_CACHE_SIZE: int = 1024
+
+    # Default cost parameters for projections and forecasts (overridable per request)
+    FORECAST_PRODUCTION_COST: float = 15.0
+    FORECAST_MARKETPLACE_FEE_PCT: float = 0.12
+    FORECAST_BASE_CONVERSION_RATE: float = 0.02
+    FORECAST_CACHE_SIZE: int = 64
+
+    # Whole-response cache of the dashboard/analytics GET endpoints (see app.response_cache)
+    RESPONSE_CACHE_SIZE: int = 256
+    RESPONSE_CACHE_TTL_SECONDS: float = 60.0
+    RESPONSE_CACHE_WARMUP: bool = True
+
+    # Rows fetched and encoded per chunk by the streaming exports
+    EXPORT_BATCH_SIZE: int = 2000
+
+    # Monte Carlo scenarios: worker threads, and the per-request compute budget
+    SIMULATION_WORKERS: int = 2
+    SIMULATION_MAX_DRAWS: int = 10000
+    SIMULATION_MAX_CELLS: int = 4_000_000  # draws x events held in memory
+    SIMULATION_TIME_BUDGET_SECONDS: float = 5.0
+
+    # Per-request Server-Timing, slow-statement log and repeated-statement (N+1) warning
+    PROFILING_ENABLED: bool = True
+    PROFILING_SLOW_QUERY_MS: float = 200.0
+    PROFILING_NPLUS1_THRESHOLD: int = 10
+
     USER_AGENT: str = (
         "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
         "AppleWebKit/537.36 (KHTML, like Gecko) "
@@ -0,0 +1,52 @@
+"""Database-wide data version.
+
+Ingest units call ``bump_data_version`` inside their write transaction, so
+the new version becomes visible together with the data it describes, to
+every process sharing the database. Read-side caches store the version they
+were computed at and treat any other version as a miss.
+
+A second counter moves only with event data (events, scores, venues,
+artists). The materialized dashboard stats are derived from events alone,
+so they compare against that one and product writes do not make them stale.
+"""
+
+from datetime import datetime
+
+from sqlalchemy import select, update
+from sqlalchemy.orm import Session
+
+from app.models.data_version import DataVersion
+
+_ROW_ID = 1
+_EVENTS_ROW_ID = 2
+
+
+def bump_data_version(session: Session, events: bool = True) -> None:
+    """Increment the version as part of ``session``'s transaction.
+
+    Pass ``events=False`` when only marketplace products changed.
+    """
+    for row_id in (_ROW_ID, _EVENTS_ROW_ID) if events else (_ROW_ID,):
+        result = session.execute(
+            update(DataVersion)
+            .where(DataVersion.id == row_id)
+            .values(version=DataVersion.version + 1, updated_at=datetime.utcnow())
+        )
+        if result.rowcount == 0:
+            session.add(DataVersion(id=row_id, version=1))
+            session.flush()
+
+
+def current_data_version(session: Session) -> int:
+    return _version(session, _ROW_ID)
+
+
+def current_events_version(session: Session) -> int:
+    """Version of the event data only; see the module docstring."""
+    return _version(session, _EVENTS_ROW_ID)
+
+
+def _version(session: Session, row_id: int) -> int:
+    return session.execute(
+        select(DataVersion.version).where(DataVersion.id == row_id)
+    ).scalar() or 0
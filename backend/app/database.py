@@ -1,15 +1,135 @@
-from sqlalchemy import create_engine
-from sqlalchemy.orm import DeclarativeBase, sessionmaker
+from sqlalchemy import create_engine, event, inspect, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import DeclarativeBase, Session, sessionmaker
+from starlette.concurrency import run_in_threadpool
 
 from app.config import settings
+from app.utils.logger import setup_logger
 
-engine = create_engine(
-    settings.DATABASE_URL,
-    connect_args={"check_same_thread": False},  # SQLite specific
-    echo=settings.DEBUG,
+logger = setup_logger("database")
+
+IS_SQLITE = settings.DATABASE_URL.startswith("sqlite")
+
+# Named pragma sets; individual SQLITE_* settings override the chosen profile
+SQLITE_PROFILES: dict[str, dict] = {
+    # SQLite's built-in behaviour (rollback journal, FULL sync, 2 MB cache)
+    "default": {},
+    "tuned": {
+        # Must come first: only takes effect before the database file is initialized
+        "auto_vacuum": "INCREMENTAL",
+        # WAL lets readers keep reading the last committed state during a write
+        "journal_mode": "WAL",
+        # Durable at checkpoints; a power loss can only drop the last commits
+        "synchronous": "NORMAL",
+        "mmap_size": 256 * 1024 * 1024,
+        "cache_size": -64 * 1024,  # negative = KiB
+        "temp_store": "MEMORY",
+        "busy_timeout": 5000,
+    },
+}
+
+# Database-wide settings that a query_only connection must not try to change
+_WRITE_ONLY_PRAGMAS = ("journal_mode", "auto_vacuum")
+
+
+def sqlite_pragmas(profile: str | None = None) -> dict:
+    """Pragmas for ``profile`` (default: SQLITE_PROFILE) with per-setting overrides."""
+    pragmas = dict(SQLITE_PROFILES[profile or settings.SQLITE_PROFILE])
+    overrides = {
+        "journal_mode": settings.SQLITE_JOURNAL_MODE,
+        "synchronous": settings.SQLITE_SYNCHRONOUS,
+        "mmap_size": settings.SQLITE_MMAP_SIZE,
+        "cache_size": settings.SQLITE_CACHE_SIZE,
+        "temp_store": settings.SQLITE_TEMP_STORE,
+        "busy_timeout": settings.SQLITE_BUSY_TIMEOUT_MS,
+        "auto_vacuum": settings.SQLITE_AUTO_VACUUM,
+    }
+    for name, value in overrides.items():
+        if value is None:
+            continue
+        if value == "":
+            # Empty string switches a pragma off, leaving SQLite's default
+            pragmas.pop(name, None)
+        else:
+            pragmas[name] = value
+    return pragmas
+
+
+def create_db_engine(
+    url: str, pragmas: dict | None = None, read_only: bool = False, **kwargs
+) -> Engine:
+    """Engine with the SQLite pragmas applied on every new connection.
+
+    SQLite engines begin their transactions explicitly, so SAVEPOINTs nest
+    inside the session's transaction instead of committing on their own.
+    """
+    if not url.startswith("sqlite"):
+        return create_engine(url, echo=settings.DB_ECHO, **kwargs)
+
+    db_engine = create_engine(
+        url,
+        connect_args={"check_same_thread": False},  # SQLite specific
+        echo=settings.DB_ECHO,
+        **kwargs,
+    )
+    _install_pragmas(db_engine, pragmas, read_only)
+    return db_engine
+
+
+def _install_pragmas(db_engine: Engine, pragmas: dict | None, read_only: bool):
+    statements = [
+        f"PRAGMA {name}={value}"
+        for name, value in (pragmas or {}).items()
+        if not (read_only and name in _WRITE_ONLY_PRAGMAS)
+    ]
+    if read_only:
+        statements.append("PRAGMA query_only=ON")
+
+    @event.listens_for(db_engine, "connect")
+    def _apply_pragmas(dbapi_connection, connection_record):
+        # pysqlite only opens a transaction before DML, so a SAVEPOINT issued
+        # first would start (and its RELEASE commit) a transaction of its own.
+        # Turn that off and emit BEGIN ourselves; see SQLAlchemy's "Serializable
+        # isolation / Savepoints / Transactional DDL" notes for pysqlite.
+        dbapi_connection.isolation_level = None
+        cursor = dbapi_connection.cursor()
+        for statement in statements:
+            cursor.execute(statement)
+        cursor.close()
+
+    @event.listens_for(db_engine, "begin")
+    def _begin(conn):
+        conn.exec_driver_sql("BEGIN")
+
+
+def async_database_url(url: str) -> str:
+    """SQLite ``url`` with the aiosqlite driver."""
+    scheme, _, rest = url.partition("://")
+    return f"sqlite+aiosqlite://{rest}"
+
+
+_pragmas = sqlite_pragmas() if IS_SQLITE else {}
+_in_memory = settings.DATABASE_URL in ("sqlite://", "sqlite:///:memory:")
+
+engine = create_db_engine(settings.DATABASE_URL, _pragmas)
+
+# Readers get their own pool of query_only connections so they never queue
+# behind the writer; an in-memory database only exists on the write engine
+read_engine = (
+    create_db_engine(
+        settings.DATABASE_URL,
+        _pragmas,
+        read_only=True,
+        pool_size=settings.DB_READ_POOL_SIZE,
+        max_overflow=settings.DB_READ_POOL_OVERFLOW,
+    )
+    if not _in_memory
+    else engine
 )
 
+# Writes go through app.db_writer, which owns the only SessionLocal that commits
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+ReadSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=read_engine)
 
 
 class Base(DeclarativeBase):
@@ -17,14 +137,191 @@ class Base(DeclarativeBase):
 
 
 def get_db():
-    db = SessionLocal()
+    db = ReadSessionLocal()
     try:
         yield db
     finally:
         db.close()
 
 
+def async_reads_enabled() -> bool:
+    """Whether ASYNC_READS applies: SQLite files only.
+
+    Experimental: aiosqlite still runs each query on a thread, and on SQLite
+    this mode has measured slower than the threadpool path (lower throughput,
+    higher p99; see benchmarks/async_reads.py), so it stays off by default.
+    An in-memory database only exists on the sync write engine.
+    """
+    return settings.ASYNC_READS and IS_SQLITE and not _in_memory
+
+
+_async_read_sessionmaker = None
+
+
+def async_read_sessionmaker():
+    """AsyncSession factory on a pooled async read engine, created on first use.
+
+    aiosqlite is only imported when ASYNC_READS is on.
+    """
+    global _async_read_sessionmaker
+    if _async_read_sessionmaker is None:
+        from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+        async_engine = create_async_engine(
+            async_database_url(settings.DATABASE_URL),
+            echo=settings.DB_ECHO,
+            pool_size=settings.DB_READ_POOL_SIZE,
+            max_overflow=settings.DB_READ_POOL_OVERFLOW,
+        )
+        _install_pragmas(async_engine.sync_engine, _pragmas, read_only=True)
+        _async_read_sessionmaker = async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False)
+    return _async_read_sessionmaker
+
+
+async def get_read_db():
+    """Read session for async routes: an AsyncSession with ASYNC_READS, else a sync Session.
+
+    Pass it to ``run_read`` rather than using it directly.
+    """
+    if async_reads_enabled():
+        async with async_read_sessionmaker()() as db:
+            yield db
+    else:
+        db = ReadSessionLocal()
+        try:
+            yield db
+        finally:
+            db.close()
+
+
+async def run_read(db, work):
+    """Run ``work(session)`` with the sync service code on a ``get_read_db`` session.
+
+    On an AsyncSession it runs in a greenlet that yields to the event loop
+    on every database round trip, so waiting for the database holds no
+    thread; a sync Session runs it on the threadpool, as a ``def`` route
+    would. The AsyncSession path is experimental (see ``async_reads_enabled``).
+    """
+    if isinstance(db, Session):
+        return await run_in_threadpool(work, db)
+    return await db.run_sync(work)
+
+
 def init_db():
-    from app.models import Artist, Event, EventSnapshot, ScrapingLog, Venue  # noqa: F401
+    from app.models import (  # noqa: F401
+        Artist,
+        DashboardStats,
+        DataVersion,
+        Event,
+        EventDayFacet,
+        EventDayStats,
+        EventSnapshot,
+        MarketplaceAggregate,
+        MarketplaceProduct,
+        ScrapingLog,
+        Venue,
+    )
 
     Base.metadata.create_all(bind=engine)
+    _add_missing_columns()
+    deduplicated = _dedupe_marketplace_products()
+
+    # create_all skips tables that already exist, so indexes added later
+    # to an existing table are created here
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(bind=engine, checkfirst=True)
+
+    from app.search_index import ensure_search_index
+
+    ensure_search_index(engine)
+    _backfill_lookup_keys()
+    _backfill_marketplace_aggregates(force=deduplicated)
+
+
+def _dedupe_marketplace_products() -> bool:
+    """Delete all but the newest row per (platform, external_id) before that key's unique index exists.
+
+    Products used to be matched on URL, so an item seen under two URLs could
+    be stored twice. Returns whether any rows were deleted.
+    """
+    inspector = inspect(engine)
+    if not inspector.has_table("marketplace_products") or any(
+        index["name"] == "ix_marketplace_products_platform_external_id"
+        for index in inspector.get_indexes("marketplace_products")
+    ):
+        return False
+    with engine.begin() as conn:
+        duplicates = conn.execute(text("""
+            SELECT platform, external_id, COUNT(*) FROM marketplace_products
+            WHERE external_id IS NOT NULL
+            GROUP BY platform, external_id HAVING COUNT(*) > 1
+        """)).all()
+        if not duplicates:
+            return False
+        keys = ", ".join(f"{platform}:{external_id} x{count}" for platform, external_id, count in duplicates[:20])
+        logger.warning(f"Keeping the newest of {len(duplicates)} duplicated product keys: {keys}")
+        conn.execute(text("""
+            DELETE FROM marketplace_products
+            WHERE external_id IS NOT NULL AND id NOT IN (
+                SELECT MAX(id) FROM marketplace_products
+                WHERE external_id IS NOT NULL
+                GROUP BY platform, external_id
+            )
+        """))
+    return True
+
+
+def _add_missing_columns():
+    """Add nullable columns introduced after a table was first created."""
+    inspector = inspect(engine)
+    with engine.begin() as conn:
+        for table in Base.metadata.sorted_tables:
+            if not inspector.has_table(table.name):
+                continue
+            existing = {column["name"] for column in inspector.get_columns(table.name)}
+            for column in table.columns:
+                if column.name in existing or not column.nullable:
+                    continue
+                column_type = column.type.compile(dialect=engine.dialect)
+                conn.execute(text(f"ALTER TABLE {table.name} ADD COLUMN {column.name} {column_type}"))
+
+
+def _backfill_lookup_keys():
+    """Fill canonical city/state/genre keys on rows written before they existed."""
+    from app.models import Artist, Venue
+    from app.utils.date_utils import canonical_key
+
+    db = SessionLocal()
+    try:
+        for venue in db.query(Venue).filter(
+            (Venue.city_key.is_(None) & Venue.city.isnot(None))
+            | (Venue.state_key.is_(None) & Venue.state.isnot(None))
+        ):
+            venue.city_key = canonical_key(venue.city)
+            venue.state_key = canonical_key(venue.state)
+        for artist in db.query(Artist).filter(Artist.genre_key.is_(None), Artist.genre.isnot(None)):
+            artist.genre_key = canonical_key(artist.genre)
+        db.commit()
+    finally:
+        db.close()
+
+
+def _backfill_marketplace_aggregates(force: bool = False):
+    """Build the marketplace summary rows for products stored before they existed.
+
+    Also rebuilds rows from before exact cent sums, and with ``force``, after
+    products were deleted under them.
+    """
+    from app.models import MarketplaceProduct
+    from app.services.marketplace_aggregate_service import MarketplaceAggregateService
+
+    db = SessionLocal()
+    try:
+        aggregates = MarketplaceAggregateService(db)
+        stale = force or aggregates.is_empty() or aggregates.needs_rebuild()
+        if stale and db.query(MarketplaceProduct.id).first() is not None:
+            aggregates.rebuild()
+            db.commit()
+    finally:
+        db.close()
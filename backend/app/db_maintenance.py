@@ -0,0 +1,54 @@
+"""Planner statistics and free-page cleanup after large ingests (SQLite only)."""
+
+import threading
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.database import IS_SQLITE
+from app.db_writer import db_writer
+from app.utils.logger import setup_logger
+
+logger = setup_logger("db_maintenance")
+
+
+class DatabaseMaintenance:
+    """Count ingested rows and queue maintenance on the writer past a threshold.
+
+    ``ANALYZE`` refreshes the statistics the query planner uses to pick
+    indexes, ``PRAGMA optimize`` lets SQLite re-analyze whatever drifted, and
+    ``PRAGMA incremental_vacuum`` returns freed pages when the database was
+    created with ``auto_vacuum=INCREMENTAL``.
+    """
+
+    def __init__(self, row_threshold: int | None = None, vacuum_pages: int | None = None):
+        self.row_threshold = row_threshold or settings.DB_MAINTENANCE_ROWS
+        self.vacuum_pages = vacuum_pages or settings.DB_VACUUM_PAGES
+        self.pending_rows = 0
+        self.runs = 0
+        self._lock = threading.Lock()
+
+    def record_writes(self, rows: int):
+        """Note ``rows`` ingested rows; schedules a run once the threshold is crossed."""
+        if not IS_SQLITE or rows <= 0:
+            return
+        with self._lock:
+            self.pending_rows += rows
+            if self.pending_rows < self.row_threshold:
+                return
+            rows_since_last = self.pending_rows
+            self.pending_rows = 0
+
+        logger.info(f"Scheduling maintenance after {rows_since_last} ingested rows")
+        db_writer.submit(self.run)
+
+    def run(self, session: Session):
+        """Unit of work for the db_writer."""
+        session.execute(text("ANALYZE"))
+        session.execute(text("PRAGMA optimize"))
+        session.execute(text(f"PRAGMA incremental_vacuum({int(self.vacuum_pages)})"))
+        self.runs += 1
+
+
+maintenance = DatabaseMaintenance()
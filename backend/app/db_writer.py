@@ -0,0 +1,145 @@
+"""Single-writer database actor.
+
+SQLite allows one writer at a time; separate sessions writing concurrently
+end up in "database is locked" retries. Every write path instead submits a
+unit of work - a callable taking a ``Session`` - to one background thread
+that owns the only write session. Units queued together are coalesced into
+one transaction, each inside its own SAVEPOINT so a failing unit does not
+discard the others. Units must not commit and should return plain values,
+since the session is closed once the transaction commits.
+"""
+
+import asyncio
+import queue
+import threading
+from collections.abc import Callable
+from concurrent.futures import Future
+from dataclasses import dataclass
+from typing import Any
+
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.config import settings
+from app.database import SessionLocal
+from app.utils.logger import setup_logger
+
+logger = setup_logger("db_writer")
+
+_STOP = object()
+
+
+@dataclass
+class _WorkItem:
+    work: Callable[[Session], Any]
+    future: Future
+
+
+class DatabaseWriter:
+    def __init__(self, session_factory: sessionmaker, max_coalesce: int | None = None):
+        self.session_factory = session_factory
+        self.max_coalesce = max_coalesce or settings.DB_WRITER_MAX_COALESCE
+        self._queue: queue.Queue = queue.Queue()
+        self._thread: threading.Thread | None = None
+        self._lock = threading.Lock()
+        self.transactions = 0
+        self.units = 0
+
+    def submit(self, work: Callable[[Session], Any]) -> Future:
+        """Queue a unit of work; the future resolves after its transaction commits."""
+        self._ensure_started()
+        future: Future = Future()
+        self._queue.put(_WorkItem(work, future))
+        return future
+
+    async def run(self, work: Callable[[Session], Any]) -> Any:
+        """Submit from async code and await the committed result."""
+        return await asyncio.wrap_future(self.submit(work))
+
+    def run_sync(self, work: Callable[[Session], Any]) -> Any:
+        """Submit from a plain thread or script and block until committed."""
+        return self.submit(work).result()
+
+    def stats(self) -> dict:
+        return {
+            "queued": self._queue.qsize(),
+            "transactions": self.transactions,
+            "units": self.units,
+        }
+
+    def stop(self, timeout: float | None = None):
+        """Finish queued work and stop the writer thread."""
+        with self._lock:
+            thread = self._thread
+            if thread is None:
+                return
+            self._queue.put(_STOP)
+            self._thread = None
+        thread.join(timeout)
+
+    def _ensure_started(self):
+        if self._thread is not None:
+            return
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run_loop, name="db-writer", daemon=True
+                )
+                self._thread.start()
+
+    def _run_loop(self):
+        while True:
+            item = self._queue.get()
+            if item is _STOP:
+                return
+
+            group = [item]
+            stop_after = False
+            while len(group) < self.max_coalesce:
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if item is _STOP:
+                    stop_after = True
+                    break
+                group.append(item)
+
+            self._commit_group(group)
+            if stop_after:
+                return
+
+    def _commit_group(self, group: list[_WorkItem]):
+        session = self.session_factory()
+        outcomes: list[tuple[_WorkItem, Any, BaseException | None]] = []
+        try:
+            for item in group:
+                if not item.future.set_running_or_notify_cancel():
+                    continue
+                savepoint = session.begin_nested()
+                try:
+                    result = item.work(session)
+                    session.flush()
+                    savepoint.commit()
+                    outcomes.append((item, result, None))
+                except Exception as e:
+                    savepoint.rollback()
+                    outcomes.append((item, None, e))
+
+            session.commit()
+            self.transactions += 1
+            self.units += len(outcomes)
+        except Exception as e:
+            logger.error(f"Write transaction of {len(group)} units failed: {e}")
+            session.rollback()
+            outcomes = [(item, None, e) for item, _, _ in outcomes]
+        finally:
+            session.close()
+
+        for item, result, error in outcomes:
+            if error is not None:
+                item.future.set_exception(error)
+            else:
+                item.future.set_result(result)
+
+
+db_writer = DatabaseWriter(SessionLocal)
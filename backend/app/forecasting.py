@@ -0,0 +1,193 @@
+"""Vectorized projection and forecast math.
+
+The per-artist sales projection and the per-event forecast are computed
+for all rows at once from columnar NumPy inputs. Every formula keeps the
+operation order of the original per-row code, and rounding goes through
+``py_round``, so results are bit-for-bit what the row-by-row Python gave.
+"""
+
+from dataclasses import dataclass
+
+import numpy as np
+
+from app.config import settings
+
+# Ticket status -> conversion multiplier; unknown statuses count as "available"
+STATUS_MULTIPLIERS = {"sold_out": 1.8, "selling_fast": 1.4, "available": 1.0}
+FESTIVAL_MULTIPLIER = 1.3
+HYPE_DIVISOR = 200  # 0-100 hype adds 0-50% conversion
+COMPETITOR_DISCOUNT = 0.9  # suggested price: 10% below the average competitor...
+MIN_MARKUP = 2.5  # ...but at least 2.5x the production cost
+MONTHS_OF_SALES = 3  # sold counts are assumed to cover ~3 months
+
+
+@dataclass(frozen=True)
+class CostParameters:
+    """Cost and conversion inputs; hashable, so it can key a cache."""
+
+    production_cost: float  # cost per unit (blank + print), R$
+    marketplace_fee_pct: float  # marketplace fee as a fraction of the price
+    base_conversion_rate: float  # share of a show's audience that buys online
+
+    @classmethod
+    def from_settings(
+        cls,
+        production_cost: float | None = None,
+        marketplace_fee_pct: float | None = None,
+        base_conversion_rate: float | None = None,
+    ) -> "CostParameters":
+        """The configured defaults, with any non-None argument overriding its field."""
+        return cls(
+            production_cost=float(
+                settings.FORECAST_PRODUCTION_COST if production_cost is None else production_cost
+            ),
+            marketplace_fee_pct=float(
+                settings.FORECAST_MARKETPLACE_FEE_PCT if marketplace_fee_pct is None else marketplace_fee_pct
+            ),
+            base_conversion_rate=float(
+                settings.FORECAST_BASE_CONVERSION_RATE if base_conversion_rate is None else base_conversion_rate
+            ),
+        )
+
+
+def py_round(values, ndigits: int) -> np.ndarray:
+    """Elementwise ``round(x, ndigits)`` with Python's semantics.
+
+    ``np.round`` scales in binary floating point, which can put a value that
+    is (almost) exactly halfway on the wrong side; Python rounds the exact
+    decimal value half-to-even. Values that close to a half are rare and are
+    passed to ``round`` one by one; for all others both agree.
+    """
+    values = np.asarray(values, dtype=np.float64)
+    scale = 10.0 ** ndigits
+    scaled = values * scale
+    result = np.round(scaled) / scale
+    distance = np.abs(scaled - np.floor(scaled) - 0.5)
+    suspect = np.flatnonzero(
+        (distance <= 4 * np.spacing(np.abs(scaled))) | (np.abs(scaled) >= 2.0 ** 52)
+    )
+    for i in suspect:
+        result.flat[i] = round(float(values.flat[i]), ndigits)
+    return result
+
+
+def suggested_prices(avg_price: np.ndarray, params: CostParameters) -> np.ndarray:
+    """Competitive but profitable price per row, from the competitors' average."""
+    floor = params.production_cost * MIN_MARKUP
+    return py_round(np.maximum(avg_price * COMPETITOR_DISCOUNT, floor), 2)
+
+
+def net_per_unit(price: np.ndarray, params: CostParameters) -> np.ndarray:
+    return price - params.production_cost - (price * params.marketplace_fee_pct)
+
+
+def project_artists(
+    products: np.ndarray, price_sum: np.ndarray, sold_sum: np.ndarray, params: CostParameters
+) -> dict[str, np.ndarray]:
+    """Monthly sales projection per artist from its product count and sums.
+
+    Returns unrounded figures (except the prices); callers round for display.
+    """
+    products = np.asarray(products, dtype=np.int64)
+    total_sold = np.asarray(sold_sum, dtype=np.int64)
+    avg_price = py_round(np.asarray(price_sum, dtype=np.float64) / products, 2)
+
+    grand_total_sold = int(total_sold.sum())
+    if grand_total_sold > 0:
+        market_share = total_sold / grand_total_sold * 100
+    else:
+        market_share = np.zeros(len(total_sold))
+
+    est_monthly_units = np.trunc(total_sold / MONTHS_OF_SALES).astype(np.int64)
+    est_monthly_revenue = est_monthly_units * avg_price
+
+    suggested_price = suggested_prices(avg_price, params)
+    net = net_per_unit(suggested_price, params)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        profit_margin = np.where(suggested_price > 0, net / suggested_price * 100, 0.0)
+
+    growth = np.select(
+        [
+            (total_sold > 10000) & (products >= 3),
+            (total_sold > 5000) | (products >= 3),
+        ],
+        ["alto", "medio"],
+        default="baixo",
+    )
+
+    return {
+        "avg_price": avg_price,
+        "market_share_pct": market_share,
+        "estimated_units_per_month": est_monthly_units,
+        "estimated_monthly_revenue": est_monthly_revenue,
+        "suggested_price": suggested_price,
+        "profit_margin_pct": profit_margin,
+        "growth_potential": growth,
+    }
+
+
+def conversion_multipliers(
+    hype_score: np.ndarray, ticket_status: list, is_festival: np.ndarray
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """(status, festival, hype) multipliers per event, applied to the base rate in that order."""
+    status_mult = np.array(
+        [STATUS_MULTIPLIERS.get(status or "", 1.0) for status in ticket_status], dtype=np.float64
+    )
+    festival_mult = np.where(np.asarray(is_festival, dtype=bool), FESTIVAL_MULTIPLIER, 1.0)
+    hype_mult = 1.0 + (np.asarray(hype_score, dtype=np.float64) / HYPE_DIVISOR)
+    return status_mult, festival_mult, hype_mult
+
+
+def project_events(
+    audience: np.ndarray,
+    hype_score: np.ndarray,
+    ticket_status: list,
+    is_festival: np.ndarray,
+    avg_price: np.ndarray,
+    params: CostParameters,
+) -> dict[str, np.ndarray]:
+    """Conversion, units, price, revenue and profit per event.
+
+    ``avg_price`` is the average price of the event's matching products, 0
+    when there are none (the suggested price then falls back to the floor).
+    Returns unrounded figures; callers round for display.
+    """
+    audience = np.asarray(audience, dtype=np.int64)
+    avg_price = np.asarray(avg_price, dtype=np.float64)
+
+    status_mult, festival_mult, hype_mult = conversion_multipliers(hype_score, ticket_status, is_festival)
+    conversion_rate = params.base_conversion_rate * status_mult * festival_mult * hype_mult
+    projected_units = np.trunc(audience * conversion_rate).astype(np.int64)
+
+    suggested_price = suggested_prices(avg_price, params)
+    projected_revenue = projected_units * suggested_price
+    projected_profit = projected_units * net_per_unit(suggested_price, params)
+
+    return {
+        "conversion_rate": conversion_rate,
+        "projected_units": projected_units,
+        "suggested_price": suggested_price,
+        "projected_revenue": projected_revenue,
+        "projected_profit": projected_profit,
+    }
+
+
+def weekly_rollup(weeks: list[str], columns: dict[str, np.ndarray]) -> list[dict]:
+    """Per-week event count and column sums, weeks ascending.
+
+    Sums accumulate in row order (``np.add.at`` is unbuffered), matching a
+    running ``+=`` per week.
+    """
+    if not weeks:
+        return []
+    labels, index = np.unique(np.asarray(weeks, dtype=object), return_inverse=True)
+    rollup = {"events": np.bincount(index, minlength=len(labels))}
+    for name, values in columns.items():
+        totals = np.zeros(len(labels), dtype=values.dtype)
+        np.add.at(totals, index, values)
+        rollup[name] = totals
+    lists = {name: values.tolist() for name, values in rollup.items()}
+    return [
+        {"week": str(label), **{name: values[i] for name, values in lists.items()}}
+        for i, label in enumerate(labels)
+    ]
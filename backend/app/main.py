@@ -1,39 +1,29 @@
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
+from fastapi.responses import JSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 
-from app.api.routes import dashboard, events, marketplace, rankings, scraping
+from app.api.routes import dashboard, events, exports, marketplace, rankings, scraping
 from app.config import settings
 from app.database import init_db
+from app.db_writer import db_writer
+from app.profiling import ProfilingMiddleware
+from app.response_cache import ResponseCacheMiddleware
+from app.seeding import install_seed_database, readiness, start_seeding
+from app.simulation import simulation_pool
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
+    install_seed_database()
     init_db()
-    # Auto-seed if database is empty
-    _auto_seed()
+    # Seed an empty database in the background; /ready reports when it is done
+    seeding = start_seeding()
     yield
-
-
-def _auto_seed():
-    """Seed database with initial data if empty."""
-    from app.database import SessionLocal
-    from app.models.event import Event
-    from app.models.marketplace_product import MarketplaceProduct
-
-    db = SessionLocal()
-    try:
-        if db.query(Event).count() == 0:
-            db.close()
-            import subprocess
-            import sys
-            subprocess.run([sys.executable, "seed_data.py"], check=True)
-            subprocess.run([sys.executable, "seed_marketplace.py"], check=True)
-        else:
-            db.close()
-    except Exception:
-        db.close()
+    await seeding
+    simulation_pool.stop()
+    db_writer.stop(timeout=30)
 
 
 app = FastAPI(
@@ -43,6 +33,8 @@ app = FastAPI(
     lifespan=lifespan,
 )
 
+# Added first so it sits inside CORS, which then also decorates cached responses
+app.add_middleware(ResponseCacheMiddleware)
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["*"],
@@ -50,14 +42,23 @@ app.add_middleware(
     allow_methods=["*"],
     allow_headers=["*"],
 )
+# Outermost, so Server-Timing covers the cache and CORS layers too
+app.add_middleware(ProfilingMiddleware)
 
 app.include_router(events.router, prefix="/api/v1")
 app.include_router(rankings.router, prefix="/api/v1")
 app.include_router(dashboard.router, prefix="/api/v1")
 app.include_router(scraping.router, prefix="/api/v1")
 app.include_router(marketplace.router, prefix="/api/v1")
+app.include_router(exports.router, prefix="/api/v1")
 
 
 @app.get("/health")
 def health_check():
     return {"status": "ok"}
+
+
+@app.get("/ready")
+def readiness_check():
+    state = readiness()
+    return JSONResponse(state, status_code=200 if state["ready"] else 503)
@@ -4,5 +4,20 @@ from app.models.event import Event
 from app.models.event_snapshot import EventSnapshot
 from app.models.scraping_log import ScrapingLog
 from app.models.marketplace_product import MarketplaceProduct
+from app.models.marketplace_aggregate import MarketplaceAggregate
+from app.models.data_version import DataVersion
+from app.models.event_stats import DashboardStats, EventDayFacet, EventDayStats
 
-__all__ = ["Artist", "Venue", "Event", "EventSnapshot", "ScrapingLog", "MarketplaceProduct"]
+__all__ = [
+    "Artist",
+    "Venue",
+    "Event",
+    "EventSnapshot",
+    "ScrapingLog",
+    "MarketplaceProduct",
+    "MarketplaceAggregate",
+    "DataVersion",
+    "DashboardStats",
+    "EventDayFacet",
+    "EventDayStats",
+]
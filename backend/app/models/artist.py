@@ -1,9 +1,10 @@
 from datetime import datetime
 
 from sqlalchemy import DateTime, Float, Integer, String
-from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy.orm import Mapped, mapped_column, relationship, validates
 
 from app.database import Base
+from app.utils.date_utils import canonical_key
 
 
 class Artist(Base):
@@ -13,6 +14,7 @@ class Artist(Base):
     name: Mapped[str] = mapped_column(String, unique=True, index=True, nullable=False)
     normalized_name: Mapped[str] = mapped_column(String, index=True, nullable=False)
     genre: Mapped[str | None] = mapped_column(String, nullable=True)
+    genre_key: Mapped[str | None] = mapped_column(String, index=True, nullable=True)
     popularity_score: Mapped[float] = mapped_column(Float, default=0.0)
 
     events: Mapped[list["Event"]] = relationship("Event", back_populates="artist")
@@ -21,3 +23,8 @@ class Artist(Base):
     updated_at: Mapped[datetime] = mapped_column(
         DateTime, default=datetime.utcnow, onupdate=datetime.utcnow
     )
+
+    @validates("genre")
+    def _fill_genre_key(self, field: str, value: str | None) -> str | None:
+        self.genre_key = canonical_key(value)
+        return value
@@ -7,6 +7,7 @@ from sqlalchemy import (
     DateTime,
     Float,
     ForeignKey,
+    Index,
     Integer,
     String,
 )
@@ -42,12 +43,12 @@ class Event(Base):
     is_festival: Mapped[bool] = mapped_column(Boolean, default=False)
     headliners: Mapped[dict | None] = mapped_column(JSON, nullable=True)
 
-    hype_score: Mapped[float] = mapped_column(Float, default=0.0, index=True)
-    sales_potential_score: Mapped[float] = mapped_column(Float, default=0.0, index=True)
+    hype_score: Mapped[float] = mapped_column(Float, default=0.0)
+    sales_potential_score: Mapped[float] = mapped_column(Float, default=0.0)
     production_start_date: Mapped[date | None] = mapped_column(Date, nullable=True)
     production_deadline: Mapped[date | None] = mapped_column(Date, nullable=True)
 
-    is_active: Mapped[bool] = mapped_column(Boolean, default=True, index=True)
+    is_active: Mapped[bool] = mapped_column(Boolean, default=True)
     first_seen_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
     last_scraped_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
 
@@ -61,3 +62,27 @@ class Event(Base):
     updated_at: Mapped[datetime] = mapped_column(
         DateTime, default=datetime.utcnow, onupdate=datetime.utcnow
     )
+
+
+# Partial indexes over active events. Nearly every read filters on
+# ``is_active IS 1`` and orders by date or a score; the predicate is built
+# from the same expression the services use so SQLite can match it.
+_active = Event.is_active.is_(True)
+Index(
+    "ix_events_active_date",
+    Event.event_date,
+    sqlite_where=_active,
+    postgresql_where=_active,
+)
+Index(
+    "ix_events_active_sales_potential",
+    Event.sales_potential_score,
+    sqlite_where=_active,
+    postgresql_where=_active,
+)
+Index(
+    "ix_events_active_hype",
+    Event.hype_score,
+    sqlite_where=_active,
+    postgresql_where=_active,
+)
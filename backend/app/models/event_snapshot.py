@@ -1,6 +1,6 @@
 from datetime import datetime
 
-from sqlalchemy import DateTime, Float, ForeignKey, Integer, String
+from sqlalchemy import DateTime, Float, ForeignKey, Index, Integer, String
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.database import Base
@@ -8,10 +8,14 @@ from app.database import Base
 
 class EventSnapshot(Base):
     __tablename__ = "event_snapshots"
+    __table_args__ = (
+        # Snapshot history per event in time order (rescoring, last-status lookup)
+        Index("ix_event_snapshots_event_snapshot_at", "event_id", "snapshot_at"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
     event_id: Mapped[int] = mapped_column(
-        Integer, ForeignKey("events.id"), index=True, nullable=False
+        Integer, ForeignKey("events.id"), nullable=False
     )
 
     ticket_status: Mapped[str | None] = mapped_column(String)
@@ -0,0 +1,40 @@
+from datetime import date, datetime
+
+from sqlalchemy import JSON, Date, DateTime, Integer, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.database import Base
+
+
+class EventDayStats(Base):
+    """Active upcoming events per calendar day; any date window is a sum of rows."""
+
+    __tablename__ = "event_day_stats"
+
+    day: Mapped[date] = mapped_column(Date, primary_key=True)
+    total: Mapped[int] = mapped_column(Integer, default=0)
+    high_hype: Mapped[int] = mapped_column(Integer, default=0)
+    high_potential: Mapped[int] = mapped_column(Integer, default=0)
+
+
+class EventDayFacet(Base):
+    """Per-day event counts by city or genre, for top lists over a window."""
+
+    __tablename__ = "event_day_facets"
+
+    day: Mapped[date] = mapped_column(Date, primary_key=True)
+    facet: Mapped[str] = mapped_column(String, primary_key=True)  # city, genre
+    value: Mapped[str] = mapped_column(String, primary_key=True)
+    count: Mapped[int] = mapped_column(Integer, default=0)
+
+
+class DashboardStats(Base):
+    """The /dashboard/stats payload, as of ``as_of`` and ``data_version``."""
+
+    __tablename__ = "dashboard_stats"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    as_of: Mapped[date] = mapped_column(Date, nullable=False)
+    data_version: Mapped[int] = mapped_column(Integer, default=0)
+    payload: Mapped[dict] = mapped_column(JSON, nullable=False)
+    computed_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
@@ -0,0 +1,38 @@
+from datetime import datetime
+
+from sqlalchemy import DateTime, Float, Index, Integer, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.database import Base
+
+
+class MarketplaceAggregate(Base):
+    """Product totals per artist, seller, category or platform.
+
+    Kept current by ProductUpsertService as products are written. ``key`` is
+    "" for products without a value in that dimension. The extremes
+    (price_min, price_max, sold_max) are only maintained on the named rows
+    of the "artist" and "platform" dimensions, where the endpoints read them.
+    Prices are summed exactly in integer ``price_cents``; ``price_sum`` is
+    that total in currency units.
+    """
+
+    __tablename__ = "marketplace_aggregates"
+    __table_args__ = (
+        # Top-N lists: one dimension ordered by units sold
+        Index("ix_marketplace_aggregates_dimension_sold", "dimension", "sold_sum"),
+    )
+
+    dimension: Mapped[str] = mapped_column(String, primary_key=True)  # artist, seller, category, platform
+    key: Mapped[str] = mapped_column(String, primary_key=True)
+    products: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    price_sum: Mapped[float] = mapped_column(Float, default=0.0, nullable=False)
+    # NULL only on rows written before the column existed; init_db rebuilds those
+    price_cents: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    sold_sum: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    sold_max: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    price_min: Mapped[float | None] = mapped_column(Float, nullable=True)
+    price_max: Mapped[float | None] = mapped_column(Float, nullable=True)
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime, default=datetime.utcnow, onupdate=datetime.utcnow
+    )
@@ -1,6 +1,6 @@
 from datetime import datetime
 
-from sqlalchemy import DateTime, Float, Integer, String, Text
+from sqlalchemy import DateTime, Float, Index, Integer, String, Text
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.database import Base
@@ -8,6 +8,23 @@ from app.database import Base
 
 class MarketplaceProduct(Base):
     __tablename__ = "marketplace_products"
+    __table_args__ = (
+        # Upsert key for scraped products; URL stays unique as the fallback key
+        Index(
+            "ix_marketplace_products_platform_external_id",
+            "platform",
+            "external_id",
+            unique=True,
+        ),
+        # list_products: optional platform filter, then price range or sort column
+        Index("ix_marketplace_products_platform_sold", "platform", "sold_count"),
+        Index("ix_marketplace_products_platform_price", "platform", "price"),
+        Index("ix_marketplace_products_sold", "sold_count"),
+        Index("ix_marketplace_products_price", "price"),
+        Index("ix_marketplace_products_rating", "rating"),
+        # Event forecast: an artist's best seller is one seek at its max sold_count
+        Index("ix_marketplace_products_artist_sold", "related_artist", "sold_count"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
 
@@ -32,7 +49,7 @@ class MarketplaceProduct(Base):
     seller_location: Mapped[str | None] = mapped_column(String, nullable=True)
 
     # Classification
-    platform: Mapped[str] = mapped_column(String, index=True, nullable=False)  # shopee, mercadolivre
+    platform: Mapped[str] = mapped_column(String, nullable=False)  # shopee, mercadolivre
     category: Mapped[str | None] = mapped_column(String, index=True, nullable=True)
     related_artist: Mapped[str | None] = mapped_column(String, index=True, nullable=True)
     related_event: Mapped[str | None] = mapped_column(String, nullable=True)
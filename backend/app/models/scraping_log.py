@@ -1,6 +1,6 @@
 from datetime import datetime
 
-from sqlalchemy import DateTime, Float, Integer, String, Text
+from sqlalchemy import DateTime, Float, Index, Integer, String, Text
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.database import Base
@@ -8,9 +8,14 @@ from app.database import Base
 
 class ScrapingLog(Base):
     __tablename__ = "scraping_logs"
+    __table_args__ = (
+        # get_logs: newest first, optionally for one platform
+        Index("ix_scraping_logs_platform_started", "platform", "started_at"),
+        Index("ix_scraping_logs_started", "started_at"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
-    platform: Mapped[str] = mapped_column(String, index=True, nullable=False)
+    platform: Mapped[str] = mapped_column(String, nullable=False)
     status: Mapped[str | None] = mapped_column(String)  # success, partial, failed
     events_found: Mapped[int] = mapped_column(Integer, default=0)
     events_new: Mapped[int] = mapped_column(Integer, default=0)
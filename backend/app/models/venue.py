@@ -1,9 +1,10 @@
 from datetime import datetime
 
 from sqlalchemy import DateTime, Integer, String
-from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy.orm import Mapped, mapped_column, relationship, validates
 
 from app.database import Base
+from app.utils.date_utils import canonical_key
 
 
 class Venue(Base):
@@ -16,9 +17,18 @@ class Venue(Base):
     capacity: Mapped[int | None] = mapped_column(Integer, nullable=True)
     venue_type: Mapped[str | None] = mapped_column(String, nullable=True)
 
+    # Accent-folded lookup keys, kept in step with city/state on assignment
+    city_key: Mapped[str | None] = mapped_column(String, index=True, nullable=True)
+    state_key: Mapped[str | None] = mapped_column(String, index=True, nullable=True)
+
     events: Mapped[list["Event"]] = relationship("Event", back_populates="venue")
 
     created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
     updated_at: Mapped[datetime] = mapped_column(
         DateTime, default=datetime.utcnow, onupdate=datetime.utcnow
     )
+
+    @validates("city", "state")
+    def _fill_keys(self, field: str, value: str | None) -> str | None:
+        setattr(self, f"{field}_key", canonical_key(value))
+        return value
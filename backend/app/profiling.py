@@ -0,0 +1,186 @@
+"""Per-request profiling: Server-Timing, a slow-query log and N+1 warnings.
+
+``ProfilingMiddleware`` opens a ``RequestProfile`` per HTTP request, and
+SQLAlchemy cursor events (``install_query_hooks``) add every statement's
+time to it. Threadpool and greenlet calls carry the profile along in the
+context. ``ProfiledRoute``, the routers' route class, times the endpoint
+function itself. The response then carries:
+
+    Server-Timing: total;dur=41.2, db;dur=12.8;desc="9 queries", endpoint;dur=30.1, serialize;dur=8.4
+
+``endpoint`` includes its database time. ``serialize`` runs from the
+endpoint's return to the response headers, which covers response-model
+validation and JSON encoding. Statements slower than
+PROFILING_SLOW_QUERY_MS go to the ``slow_query`` log, inside requests or
+not. A request that runs one statement shape more than
+PROFILING_NPLUS1_THRESHOLD times (literals and IN lists folded) is logged
+as a likely N+1.
+"""
+
+import functools
+import inspect
+import re
+import time
+from collections import Counter
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+
+from fastapi.routing import APIRoute
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.config import settings
+from app.utils.logger import setup_logger
+
+logger = setup_logger("profiling")
+slow_query_logger = setup_logger("slow_query")
+
+_IN_LIST = re.compile(r"\(\s*\?(?:\s*,\s*\?)+\s*\)")
+_LITERAL = re.compile(r"'(?:[^']|'')*'|\b\d+(?:\.\d+)?\b")
+_SPACE = re.compile(r"\s+")
+
+
+@dataclass
+class RequestProfile:
+    label: str
+    start: float = field(default_factory=time.perf_counter)
+    db_seconds: float = 0.0
+    statements: int = 0
+    shapes: Counter = field(default_factory=Counter)
+    endpoint_seconds: float | None = None
+    endpoint_end: float | None = None
+
+    def server_timing(self, now: float) -> bytes:
+        metrics = [
+            f"total;dur={(now - self.start) * 1000:.1f}",
+            f'db;dur={self.db_seconds * 1000:.1f};desc="{self.statements} queries"',
+        ]
+        if self.endpoint_seconds is not None:
+            metrics.append(f"endpoint;dur={self.endpoint_seconds * 1000:.1f}")
+            metrics.append(f"serialize;dur={(now - self.endpoint_end) * 1000:.1f}")
+        return ", ".join(metrics).encode()
+
+
+_profile: ContextVar[RequestProfile | None] = ContextVar("request_profile", default=None)
+
+
+def current_profile() -> RequestProfile | None:
+    return _profile.get()
+
+
+def statement_shape(statement: str) -> str:
+    """``statement`` with literals and IN lists folded, for grouping repeats."""
+    shape = _IN_LIST.sub("(?)", _SPACE.sub(" ", statement).strip())
+    return _LITERAL.sub("?", shape)
+
+
+_hooks_installed = False
+
+
+def install_query_hooks():
+    """Time every statement on every engine (idempotent)."""
+    global _hooks_installed
+    if _hooks_installed:
+        return
+    _hooks_installed = True
+
+    # The start time lives on the statement's execution context, so a statement
+    # that raises leaves nothing behind on the pooled connection
+    @event.listens_for(Engine, "before_cursor_execute")
+    def _before(conn, cursor, statement, parameters, context, executemany):
+        if context is not None:
+            context._profiling_start = time.perf_counter()
+
+    @event.listens_for(Engine, "after_cursor_execute")
+    def _after(conn, cursor, statement, parameters, context, executemany):
+        start = getattr(context, "_profiling_start", None)
+        if start is None:
+            return
+        elapsed = time.perf_counter() - start
+        profile = _profile.get()
+        if profile is not None:
+            profile.db_seconds += elapsed
+            profile.statements += 1
+            profile.shapes[statement_shape(statement)] += 1
+        if elapsed * 1000 >= settings.PROFILING_SLOW_QUERY_MS:
+            slow_query_logger.warning(
+                f"{elapsed * 1000:.1f} ms [{profile.label if profile else 'no request'}] "
+                f"{_SPACE.sub(' ', statement).strip()[:1000]}"
+            )
+
+
+class ProfiledRoute(APIRoute):
+    """APIRoute whose endpoint records its own run time in the request profile."""
+
+    def __init__(self, path: str, endpoint, **kwargs):
+        super().__init__(path, _timed(endpoint), **kwargs)
+
+
+def _timed(endpoint):
+    if inspect.isgeneratorfunction(endpoint) or inspect.isasyncgenfunction(endpoint):
+        return endpoint
+
+    def record(start: float):
+        profile = _profile.get()
+        if profile is not None:
+            end = time.perf_counter()
+            profile.endpoint_seconds = end - start
+            profile.endpoint_end = end
+
+    # functools.wraps keeps the signature FastAPI reads the parameters from
+    if inspect.iscoroutinefunction(endpoint):
+        @functools.wraps(endpoint)
+        async def timed(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return await endpoint(*args, **kwargs)
+            finally:
+                record(start)
+    else:
+        @functools.wraps(endpoint)
+        def timed(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return endpoint(*args, **kwargs)
+            finally:
+                record(start)
+    return timed
+
+
+class ProfilingMiddleware:
+    def __init__(self, app: ASGIApp):
+        self.app = app
+        install_query_hooks()
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http" or not settings.PROFILING_ENABLED:
+            await self.app(scope, receive, send)
+            return
+
+        profile = RequestProfile(label=f"{scope['method']} {scope['path']}")
+        token = _profile.set(profile)
+
+        async def send_with_timing(message: Message):
+            if message["type"] == "http.response.start":
+                headers = list(message.get("headers", []))
+                headers.append((b"server-timing", profile.server_timing(time.perf_counter())))
+                message = {**message, "headers": headers}
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            _profile.reset(token)
+            # After the body, so statements run while streaming are included
+            _check_repeats(profile)
+
+
+def _check_repeats(profile: RequestProfile):
+    if not profile.shapes:
+        return
+    shape, count = profile.shapes.most_common(1)[0]
+    if count > settings.PROFILING_NPLUS1_THRESHOLD:
+        logger.warning(
+            f"Possible N+1 in {profile.label}: {count} of {profile.statements} statements are {shape[:500]}"
+        )
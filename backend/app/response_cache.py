@@ -0,0 +1,180 @@
+"""Response cache for the read-heavy GET endpoints.
+
+Whole responses of ``CACHED_PATHS`` are kept per route and normalized
+query string, tagged with the database data version (and a TTL, since some
+of them depend on the current date). Every response carries a strong ETag
+over its body, and a matching ``If-None-Match`` is answered with 304. After
+an ingest, ``schedule_warmup`` re-requests ``WARMUP_PATHS`` in the
+background so the next dashboard load is a cache hit.
+"""
+
+import asyncio
+import contextvars
+import hashlib
+from urllib.parse import parse_qsl, urlencode
+
+from starlette.concurrency import run_in_threadpool
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.cache import VersionedLRUCache
+from app.config import settings
+from app.data_version import current_data_version
+from app.database import ReadSessionLocal
+from app.utils.logger import setup_logger
+
+logger = setup_logger("response_cache")
+
+CACHED_PATHS = (
+    "/api/v1/dashboard/stats",
+    "/api/v1/rankings/",
+    "/api/v1/marketplace/stats",
+    "/api/v1/marketplace/projection",
+    "/api/v1/marketplace/event-forecast",
+)
+# Requested again in the background after each ingest
+WARMUP_PATHS = (
+    "/api/v1/dashboard/stats",
+    "/api/v1/rankings/",
+    "/api/v1/marketplace/stats",
+    "/api/v1/marketplace/projection",
+    "/api/v1/marketplace/event-forecast",
+    "/api/v1/marketplace/event-forecast?days=365",
+)
+# Response headers stored with the body; ETag and Cache-Control are added on send
+_STORED_HEADERS = (b"content-type",)
+
+response_cache = VersionedLRUCache(settings.RESPONSE_CACHE_SIZE, ttl=settings.RESPONSE_CACHE_TTL_SECONDS)
+
+_middlewares: list["ResponseCacheMiddleware"] = []
+_warmup: asyncio.Task | None = None
+
+
+def cache_key(path: str, query_string: bytes) -> tuple[str, str]:
+    """Route plus its query parameters in sorted order, blank ones dropped."""
+    params = sorted(parse_qsl(query_string.decode("latin-1")))
+    return path, urlencode(params)
+
+
+def etag_for(body: bytes) -> bytes:
+    return b'"' + hashlib.blake2b(body, digest_size=16).hexdigest().encode() + b'"'
+
+
+def _read_data_version() -> int:
+    db = ReadSessionLocal()
+    try:
+        return current_data_version(db)
+    finally:
+        db.close()
+
+
+def schedule_warmup():
+    """Warm the heavy endpoints in the background; a warmup already queued covers this call."""
+    global _warmup
+    if not settings.RESPONSE_CACHE_WARMUP or not _middlewares:
+        return
+    if _warmup is not None and not _warmup.done():
+        return
+    # A fresh context, so the warmup's queries are not profiled as the triggering request's
+    _warmup = asyncio.get_running_loop().create_task(
+        _middlewares[-1].warm(WARMUP_PATHS), context=contextvars.Context()
+    )
+
+
+class ResponseCacheMiddleware:
+    def __init__(self, app: ASGIApp):
+        self.app = app
+        _middlewares.append(self)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http" or scope["method"] != "GET" or scope["path"] not in CACHED_PATHS:
+            await self.app(scope, receive, send)
+            return
+
+        key = cache_key(scope["path"], scope["query_string"])
+        version = await run_in_threadpool(_read_data_version)
+        cached = response_cache.get(key, version)
+        if cached is None:
+            cached = await self._render(scope, receive, send)
+            if cached is None:
+                return  # not cacheable; already sent as is
+            response_cache.set(key, version, cached)
+            state = b"MISS"
+        else:
+            state = b"HIT"
+
+        status, headers, body, etag = cached
+        headers = headers + [
+            (b"etag", etag),
+            (b"cache-control", b"no-cache"),
+            (b"x-cache", state),
+        ]
+        if _if_none_match(scope) & {etag, b"*"}:
+            await send({"type": "http.response.start", "status": 304, "headers": headers})
+            await send({"type": "http.response.body", "body": b""})
+            return
+        headers.append((b"content-length", str(len(body)).encode()))
+        await send({"type": "http.response.start", "status": status, "headers": headers})
+        await send({"type": "http.response.body", "body": body})
+
+    async def warm(self, paths: tuple[str, ...]):
+        """Request ``paths`` through this middleware, discarding the responses."""
+        for target in paths:
+            path, _, query = target.partition("?")
+            scope = {
+                "type": "http",
+                "asgi": {"version": "3.0"},
+                "http_version": "1.1",
+                "method": "GET",
+                "scheme": "http",
+                "server": ("warmup", 80),
+                "client": None,
+                "root_path": "",
+                "path": path,
+                "raw_path": path.encode(),
+                "query_string": query.encode(),
+                "headers": [],
+            }
+
+            async def receive() -> Message:
+                return {"type": "http.request", "body": b"", "more_body": False}
+
+            async def discard(message: Message):
+                pass
+
+            try:
+                await self(scope, receive, discard)
+            except Exception as e:
+                logger.warning(f"Warmup of {target} failed: {e}")
+        logger.info(f"Warmed {len(paths)} cached endpoints")
+
+    async def _render(self, scope: Scope, receive: Receive, send: Send) -> tuple | None:
+        """Run the route and capture a 200 response; anything else is passed through."""
+        start: Message | None = None
+        chunks: list[bytes] = []
+        passthrough = False
+
+        async def capture(message: Message):
+            nonlocal start, passthrough
+            if message["type"] == "http.response.start":
+                start = message
+                if message["status"] != 200:
+                    passthrough = True
+                    await send(message)
+            elif passthrough:
+                await send(message)
+            else:
+                chunks.append(message.get("body", b""))
+
+        await self.app(scope, receive, capture)
+        if passthrough or start is None:
+            return None
+        body = b"".join(chunks)
+        headers = [(name, value) for name, value in start["headers"] if name.lower() in _STORED_HEADERS]
+        return start["status"], headers, body, etag_for(body)
+
+
+def _if_none_match(scope: Scope) -> set[bytes]:
+    for name, value in scope["headers"]:
+        if name == b"if-none-match":
+            return {tag.strip() for tag in value.split(b",")}
+    return set()
@@ -70,9 +70,11 @@ class SnapshotResponse(BaseModel):
 
 class PaginatedEventResponse(BaseModel):
     events: list[EventResponse]
-    total: int
+    total: int | None = None  # omitted on cursor pages unless include_total=true
+    total_estimated: bool = False
     page: int
     page_size: int
+    next_cursor: str | None = None
 
 
 class RankingResponse(BaseModel):
@@ -90,6 +92,15 @@ class DashboardStatsResponse(BaseModel):
     top_genres: list[dict]
 
 
+class MonthWindowStats(BaseModel):
+    month: str
+    total_events: int
+    high_hype_count: int
+    high_potential_count: int
+    top_cities: list[dict]
+    top_genres: list[dict]
+
+
 class ScrapingTriggerRequest(BaseModel):
     platforms: list[str] | None = None
 
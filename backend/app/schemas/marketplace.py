@@ -1,6 +1,7 @@
 from datetime import datetime
+from typing import Literal
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field, field_validator, model_validator
 
 
 class MarketplaceProductResponse(BaseModel):
@@ -29,9 +30,11 @@ class MarketplaceProductResponse(BaseModel):
 
 class PaginatedMarketplaceResponse(BaseModel):
     products: list[MarketplaceProductResponse]
-    total: int
+    total: int | None = None  # omitted on cursor pages unless include_total=true
+    total_estimated: bool = False
     page: int
     page_size: int
+    next_cursor: str | None = None
 
 
 class MarketplaceStatsResponse(BaseModel):
@@ -81,3 +84,55 @@ class SalesProjectionResponse(BaseModel):
     projections: list[ArtistProjection]
     category_breakdown: list[dict]
     opportunity_score: dict
+
+
+class Distribution(BaseModel):
+    """A scenario input: a fixed value or a distribution to draw it from.
+
+    fixed: ``value``; uniform: ``low``..``high``; normal: ``mean``/``std``;
+    triangular: ``low``/``mode``/``high``.
+    """
+
+    kind: Literal["fixed", "uniform", "normal", "triangular"] = "fixed"
+    value: float | None = None
+    low: float | None = None
+    high: float | None = None
+    mean: float | None = None
+    std: float | None = Field(None, ge=0)
+    mode: float | None = None
+
+    @model_validator(mode="after")
+    def _check_parameters(self):
+        required = {
+            "fixed": ("value",),
+            "uniform": ("low", "high"),
+            "normal": ("mean", "std"),
+            "triangular": ("low", "mode", "high"),
+        }[self.kind]
+        missing = [name for name in required if getattr(self, name) is None]
+        if missing:
+            raise ValueError(f"{self.kind} distribution needs {', '.join(missing)}")
+        if self.kind in ("uniform", "triangular") and self.low > self.high:
+            raise ValueError("low must not exceed high")
+        if self.kind == "triangular" and not self.low <= self.mode <= self.high:
+            raise ValueError("mode must lie between low and high")
+        return self
+
+
+class SimulationRequest(BaseModel):
+    days: int = Field(90, ge=7, le=365)
+    draws: int = Field(1000, ge=1)
+    seed: int | None = Field(None, ge=0)
+    # Unset inputs stay at the configured forecast defaults
+    conversion_rate: Distribution | None = None  # base share of the audience buying online
+    price_factor: Distribution | None = None  # multiplier on each event's suggested price
+    production_cost: Distribution | None = None  # R$ per unit
+    marketplace_fee_pct: Distribution | None = None  # fraction of the price
+    percentiles: list[float] = Field(default_factory=lambda: [5, 50, 95], min_length=1, max_length=9)
+
+    @field_validator("percentiles")
+    @classmethod
+    def _check_percentiles(cls, values: list[float]) -> list[float]:
+        if any(not 0 <= value <= 100 for value in values):
+            raise ValueError("percentiles must be between 0 and 100")
+        return sorted(set(values))
@@ -0,0 +1,14 @@
+"""Scrapers, imported on first use.
+
+The scraper modules pull in httpx, BeautifulSoup and lxml, which a process
+serving only reads never needs. Registries refer to scrapers by
+``"module:Class"`` path and resolve them with ``load_scraper``.
+"""
+
+import importlib
+
+
+def load_scraper(path: str) -> type:
+    """The scraper class at ``"module:Class"``, importing its module now."""
+    module, _, name = path.partition(":")
+    return getattr(importlib.import_module(module), name)
@@ -1,5 +1,6 @@
 import logging
 from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator
 
 import httpx
 
@@ -41,6 +42,15 @@ class BaseScraper(ABC):
         """Main scraping method. Returns list of normalized event dicts."""
         ...
 
+    async def stream(self) -> AsyncIterator[dict]:
+        """Yield normalized records as they are parsed.
+
+        Scrapers that fetch several pages override this so the ingest
+        pipeline can start writing before the last page is downloaded.
+        """
+        for record in await self.scrape():
+            yield record
+
     def normalize_event(self, raw: dict) -> dict:
         """Ensure event dict has all expected keys."""
         return {
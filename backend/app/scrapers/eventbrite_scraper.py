@@ -2,6 +2,7 @@
 
 import json
 import re
+from collections.abc import AsyncIterator
 from datetime import datetime
 
 from bs4 import BeautifulSoup
@@ -64,7 +65,10 @@ class EventbriteScraper(BaseScraper):
 
     async def scrape(self) -> list[dict]:
         """Scrape all Eventbrite search pages for music events."""
-        all_events = []
+        return [event async for event in self.stream()]
+
+    async def stream(self) -> AsyncIterator[dict]:
+        """Yield unique music events page by page."""
         seen_urls = set()
 
         for url in self.SEARCH_URLS:
@@ -72,17 +76,18 @@ class EventbriteScraper(BaseScraper):
                 html = await self.fetch_page(url)
                 self.logger.info(f"Eventbrite [{url.split('/')[-2]}]: fetched {len(html)} chars")
                 events = self._parse_ld_json(html)
-                for ev in events:
-                    source_url = ev.get("source_url", "")
-                    if source_url and source_url not in seen_urls:
-                        seen_urls.add(source_url)
-                        all_events.append(ev)
                 self.logger.info(f"Eventbrite [{url.split('/')[-2]}]: {len(events)} music events")
             except Exception as e:
                 self.logger.error(f"Eventbrite scraping failed for {url}: {e}")
+                continue
+
+            for ev in events:
+                source_url = ev.get("source_url", "")
+                if source_url and source_url not in seen_urls:
+                    seen_urls.add(source_url)
+                    yield ev
 
-        self.logger.info(f"Eventbrite total: {len(all_events)} unique events")
-        return all_events
+        self.logger.info(f"Eventbrite total: {len(seen_urls)} unique events")
 
     def _parse_ld_json(self, html: str) -> list[dict]:
         """Extract events from LD+JSON structured data."""
@@ -5,6 +5,7 @@ Uses Shopee's internal search API with retry and fallback.
 
 import asyncio
 import re
+from collections.abc import AsyncIterator
 from urllib.parse import quote
 
 import httpx
@@ -65,12 +66,21 @@ class ShopeeScraper(BaseScraper):
         """Scrape all default search terms. Returns list of product dicts."""
         return await self.scrape_all_terms(DEFAULT_SEARCH_TERMS)
 
+    async def stream(self) -> AsyncIterator[dict]:
+        async for product in self.stream_terms(DEFAULT_SEARCH_TERMS):
+            yield product
+
     async def scrape_all_terms(
         self, terms: list[tuple[str, str | None]] | None = None
     ) -> list[dict]:
         """Scrape multiple search terms with deduplication."""
+        return [product async for product in self.stream_terms(terms)]
+
+    async def stream_terms(
+        self, terms: list[tuple[str, str | None]] | None = None
+    ) -> AsyncIterator[dict]:
+        """Yield unique priced products term by term."""
         search_terms = terms or DEFAULT_SEARCH_TERMS
-        all_products = []
         seen_urls = set()
         total_api_ok = 0
         total_api_blocked = 0
@@ -82,7 +92,7 @@ class ShopeeScraper(BaseScraper):
                 url = p.get("product_url", "")
                 if url and url not in seen_urls and p.get("price", 0) > 0:
                     seen_urls.add(url)
-                    all_products.append(p)
+                    yield p
 
             if products:
                 total_api_ok += 1
@@ -92,10 +102,9 @@ class ShopeeScraper(BaseScraper):
             await asyncio.sleep(2)  # Rate limit between searches
 
         self.logger.info(
-            f"Shopee: {len(all_products)} products | "
+            f"Shopee: {len(seen_urls)} products | "
             f"API ok: {total_api_ok}, blocked: {total_api_blocked}"
         )
-        return all_products
 
     async def scrape_term(
         self, search_term: str, related_artist: str | None = None
@@ -0,0 +1,161 @@
+"""Full-text search over product and event titles (SQLite FTS5).
+
+Two FTS5 tables mirror the searchable text and are kept in sync by
+triggers, so every write path (ingest, seeds, scripts) updates them
+without extra code. ``unicode61 remove_diacritics 2`` folds accents at both
+index and query time ("sao paulo" finds "São Paulo"). The ``compact``
+column stores the text with in-word punctuation removed, so "acdc" also
+finds "AC/DC" and "guns n roses" finds "Guns N' Roses".
+"""
+
+import re
+
+from sqlalchemy import column, func, literal_column, select, table, text
+from sqlalchemy.engine import Engine
+
+PRODUCTS_FTS = "marketplace_products_fts"
+EVENTS_FTS = "events_fts"
+
+TOKENIZER = "unicode61 remove_diacritics 2"
+
+# BM25 column weights: title, search_term, related_artist, compact
+PRODUCT_WEIGHTS = (10.0, 2.0, 5.0, 4.0)
+
+TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+
+
+def _compact(expr: str) -> str:
+    """SQL expression stripping in-word punctuation from ``expr``."""
+    for char in ("/", "-", ".", "''", "&"):
+        expr = f"replace({expr}, '{char}', '')"
+    return expr
+
+
+_PRODUCT_TEXT = "coalesce(new.title, '') || ' ' || coalesce(new.related_artist, '')"
+_EVENT_ARTIST = "(SELECT name FROM artists WHERE id = new.artist_id)"
+_EVENT_VENUE = "(SELECT name FROM venues WHERE id = new.venue_id)"
+_EVENT_CITY = "(SELECT city FROM venues WHERE id = new.venue_id)"
+
+_PRODUCT_INSERT = f"""
+    INSERT INTO {PRODUCTS_FTS}(rowid, title, search_term, related_artist, compact)
+    VALUES (new.id, new.title, new.search_term, new.related_artist, {_compact(_PRODUCT_TEXT)});
+"""
+_EVENT_INSERT = f"""
+    INSERT INTO {EVENTS_FTS}(rowid, title, artist, venue, city, compact)
+    VALUES (
+        new.id, new.title, {_EVENT_ARTIST}, {_EVENT_VENUE}, {_EVENT_CITY},
+        {_compact(f"coalesce(new.title, '') || ' ' || coalesce({_EVENT_ARTIST}, '')")}
+    );
+"""
+
+
+def _event_rows(where: str) -> str:
+    """INSERT of the ``events`` rows matching ``where`` into the events FTS table."""
+    artist = "(SELECT name FROM artists WHERE id = events.artist_id)"
+    return f"""
+        INSERT INTO {EVENTS_FTS}(rowid, title, artist, venue, city, compact)
+        SELECT
+            id, title, {artist},
+            (SELECT name FROM venues WHERE id = events.venue_id),
+            (SELECT city FROM venues WHERE id = events.venue_id),
+            {_compact(f"coalesce(title, '') || ' ' || coalesce({artist}, '')")}
+        FROM events {where}
+    """
+
+
+SEARCH_DDL = [
+    f"""CREATE VIRTUAL TABLE IF NOT EXISTS {PRODUCTS_FTS} USING fts5(
+        title, search_term, related_artist, compact, tokenize = '{TOKENIZER}'
+    )""",
+    f"""CREATE TRIGGER IF NOT EXISTS {PRODUCTS_FTS}_ai
+        AFTER INSERT ON marketplace_products BEGIN {_PRODUCT_INSERT} END""",
+    f"""CREATE TRIGGER IF NOT EXISTS {PRODUCTS_FTS}_ad
+        AFTER DELETE ON marketplace_products BEGIN
+            DELETE FROM {PRODUCTS_FTS} WHERE rowid = old.id;
+        END""",
+    f"""CREATE TRIGGER IF NOT EXISTS {PRODUCTS_FTS}_au
+        AFTER UPDATE OF title, search_term, related_artist ON marketplace_products BEGIN
+            DELETE FROM {PRODUCTS_FTS} WHERE rowid = old.id;
+            {_PRODUCT_INSERT}
+        END""",
+    f"""CREATE VIRTUAL TABLE IF NOT EXISTS {EVENTS_FTS} USING fts5(
+        title, artist, venue, city, compact, tokenize = '{TOKENIZER}'
+    )""",
+    f"""CREATE TRIGGER IF NOT EXISTS {EVENTS_FTS}_ai
+        AFTER INSERT ON events BEGIN {_EVENT_INSERT} END""",
+    f"""CREATE TRIGGER IF NOT EXISTS {EVENTS_FTS}_ad
+        AFTER DELETE ON events BEGIN
+            DELETE FROM {EVENTS_FTS} WHERE rowid = old.id;
+        END""",
+    f"""CREATE TRIGGER IF NOT EXISTS {EVENTS_FTS}_au
+        AFTER UPDATE OF title, artist_id, venue_id ON events BEGIN
+            DELETE FROM {EVENTS_FTS} WHERE rowid = old.id;
+            {_EVENT_INSERT}
+        END""",
+    # Renaming an artist or venue reindexes its events
+    f"""CREATE TRIGGER IF NOT EXISTS {EVENTS_FTS}_artist_au
+        AFTER UPDATE OF name ON artists WHEN old.name IS NOT new.name BEGIN
+            DELETE FROM {EVENTS_FTS} WHERE rowid IN (SELECT id FROM events WHERE artist_id = new.id);
+            {_event_rows("WHERE artist_id = new.id")};
+        END""",
+    f"""CREATE TRIGGER IF NOT EXISTS {EVENTS_FTS}_venue_au
+        AFTER UPDATE OF name, city ON venues
+        WHEN old.name IS NOT new.name OR old.city IS NOT new.city BEGIN
+            DELETE FROM {EVENTS_FTS} WHERE rowid IN (SELECT id FROM events WHERE venue_id = new.id);
+            {_event_rows("WHERE venue_id = new.id")};
+        END""",
+]
+
+
+def ensure_search_index(engine: Engine):
+    """Create the FTS tables and triggers, backfilling rows that predate them."""
+    if engine.dialect.name != "sqlite":
+        return
+    with engine.begin() as conn:
+        for statement in SEARCH_DDL:
+            conn.execute(text(statement))
+
+        for fts_table, source_table in ((PRODUCTS_FTS, "marketplace_products"), (EVENTS_FTS, "events")):
+            indexed = conn.execute(text(f"SELECT count(*) FROM {fts_table}")).scalar()
+            if indexed or not conn.execute(text(f"SELECT 1 FROM {source_table} LIMIT 1")).first():
+                continue
+            conn.execute(text(_backfill_sql(fts_table)))
+
+
+def _backfill_sql(fts_table: str) -> str:
+    """Bulk copy of the base table into ``fts_table``, same columns as the triggers."""
+    if fts_table == PRODUCTS_FTS:
+        product_text = _PRODUCT_TEXT.replace("new.", "")
+        return f"""
+            INSERT INTO {PRODUCTS_FTS}(rowid, title, search_term, related_artist, compact)
+            SELECT id, title, search_term, related_artist, {_compact(product_text)}
+            FROM marketplace_products
+        """
+    return _event_rows("")
+
+
+def build_match_query(search: str) -> str | None:
+    """Turn free text into an FTS5 query: every word must match, as a prefix."""
+    tokens = TOKEN_RE.findall(search)
+    if not tokens:
+        return None
+    return " ".join(f'"{token}"*' for token in tokens)
+
+
+def product_matches(match_query: str):
+    """Subquery of (id, rank) for products matching ``match_query``; lower rank is better."""
+    fts = table(PRODUCTS_FTS, column("rowid"))
+    return (
+        select(
+            fts.c.rowid.label("id"),
+            func.bm25(literal_column(PRODUCTS_FTS), *PRODUCT_WEIGHTS).label("rank"),
+        )
+        .where(literal_column(PRODUCTS_FTS).op("MATCH")(match_query))
+        .subquery("product_matches")
+    )
+
+
+def event_match_ids(match_query: str):
+    """Select of event ids matching ``match_query``."""
+    fts = table(EVENTS_FTS, column("rowid"))
+    return select(fts.c.rowid).where(literal_column(EVENTS_FTS).op("MATCH")(match_query))
@@ -0,0 +1,160 @@
+"""Seeding of an empty database at startup, off the request path.
+
+``lifespan`` calls ``install_seed_database`` before ``init_db``. When
+SEED_DATABASE names a prebuilt file (``python seed_data.py --output``)
+built from the current seed data, and the SQLite database does not exist
+yet, the file is copied into place. ``start_seeding`` then runs in the
+background: an empty database is bulk-loaded in one db_writer unit, and a
+copied one is rescored for today. ``/ready`` answers 503 until it is done,
+and keeps answering 503 if seeding failed; ``/health`` stays a plain
+liveness check.
+
+The seed data itself lives in ``seed_data.py`` and ``seed_marketplace.py``
+next to the app (the working directory the server runs from).
+"""
+
+import asyncio
+import json
+import os
+import shutil
+import sqlite3
+import zlib
+
+from app.config import settings
+from app.database import IS_SQLITE, SQLITE_PROFILES, Base, create_db_engine, engine
+from app.db_writer import db_writer
+from app.utils.logger import setup_logger
+
+logger = setup_logger("seeding")
+
+_state = {"status": "starting", "source": None, "error": None}
+_task: asyncio.Task | None = None
+
+
+def seed_data() -> tuple[list, list, list]:
+    """The bundled venues, events and marketplace products."""
+    from seed_data import EVENTS_DATA, VENUES_DATA
+    from seed_marketplace import PRODUCTS
+
+    return VENUES_DATA, EVENTS_DATA, PRODUCTS
+
+
+def seed_version() -> int:
+    """Fingerprint of the seed data, stored as the seed file's ``user_version``."""
+    payload = json.dumps(seed_data(), sort_keys=True, ensure_ascii=False).encode()
+    return zlib.crc32(payload) & 0x7FFFFFFF
+
+
+def readiness() -> dict:
+    """``ready`` once startup seeding has succeeded (or was not needed); never after a failure."""
+    return {"ready": _state["status"] == "ready", **_state}
+
+
+def install_seed_database() -> bool:
+    """Copy SEED_DATABASE into place if the SQLite database does not exist yet."""
+    source = settings.SEED_DATABASE
+    target = engine.url.database
+    if not source or not IS_SQLITE or not target or target == ":memory:" or os.path.exists(target):
+        return False
+    if not os.path.exists(source):
+        logger.warning(f"Seed database {source} not found; seeding in-process")
+        return False
+
+    with sqlite3.connect(f"file:{source}?mode=ro", uri=True) as conn:
+        version = conn.execute("PRAGMA user_version").fetchone()[0]
+    if version != seed_version():
+        logger.warning(f"Seed database {source} is out of date ({version} != {seed_version()}); seeding in-process")
+        return False
+
+    os.makedirs(os.path.dirname(os.path.abspath(target)), exist_ok=True)
+    shutil.copyfile(source, target + ".seed")
+    os.replace(target + ".seed", target)
+    _state["source"] = "file"
+    logger.info(f"Installed seed database {source}")
+    return True
+
+
+def start_seeding() -> asyncio.Task:
+    """Run ``seed`` in the background; ``readiness`` reports when it is done."""
+    global _task
+    _state.update(status="seeding", error=None)
+    _task = asyncio.get_running_loop().create_task(_seed_in_background())
+    return _task
+
+
+async def _seed_in_background():
+    try:
+        result = await db_writer.run(_seed_unit(rescore=_state["source"] == "file"))
+    except Exception as e:
+        logger.error(f"Startup seeding failed: {e}")
+        # /ready stays 503 so the instance gets no traffic; /health still answers
+        _state.update(status="failed", error=str(e))
+        return
+    if result is not None:
+        _state["source"] = _state["source"] or "bulk"
+        logger.info(f"Seeded {result}")
+        from app.response_cache import schedule_warmup
+
+        schedule_warmup()
+    _state["status"] = "ready"
+
+
+def _seed_unit(rescore: bool):
+    """Unit of work: bulk-load an empty database, or rescore a copied seed file."""
+
+    def work(session):
+        from app.services.analysis_service import AnalysisService
+        from app.services.seed_service import SeedService
+
+        if rescore:
+            # Scores depend on today's date, and the file was built earlier
+            AnalysisService(session).recalculate_all()
+            return {"source": "file"}
+
+        seeder = SeedService(session)
+        if not seeder.is_empty():
+            return None
+        venues, events, products = seed_data()
+        counts = seeder.seed_events(venues, events)
+        counts["products"] = seeder.seed_products(products)
+        return counts
+
+    return work
+
+
+def build_seed_database(path: str) -> dict:
+    """Write a fresh seed database to ``path``, stamped with ``seed_version``."""
+    from sqlalchemy.orm import sessionmaker
+
+    from app import models  # noqa: F401
+    from app.search_index import ensure_search_index
+    from app.services.seed_service import SeedService
+
+    if os.path.exists(path):
+        os.remove(path)
+    seed_engine = create_db_engine(f"sqlite:///{path}", SQLITE_PROFILES["tuned"])
+    try:
+        Base.metadata.create_all(bind=seed_engine)
+        ensure_search_index(seed_engine)
+        session = sessionmaker(bind=seed_engine, autoflush=False)()
+        try:
+            venues, events, products = seed_data()
+            seeder = SeedService(session)
+            counts = seeder.seed_events(venues, events)
+            counts["products"] = seeder.seed_products(products)
+            session.commit()
+        finally:
+            session.close()
+    finally:
+        seed_engine.dispose()
+
+    # A single self-contained file: no WAL beside it, free pages dropped
+    with sqlite3.connect(path) as conn:
+        conn.execute("PRAGMA journal_mode=DELETE")
+        conn.execute(f"PRAGMA user_version={seed_version()}")
+    conn = sqlite3.connect(path)
+    try:
+        conn.execute("VACUUM")
+    finally:
+        conn.close()
+    return counts
@@ -5,12 +5,16 @@ from sqlalchemy.orm import Session
 from app.analysis.hype_calculator import HypeCalculator
 from app.analysis.production_window import ProductionWindowCalculator
 from app.analysis.sales_predictor import SalesPotentialCalculator
+from app.data_version import bump_data_version
 from app.models.event import Event
 from app.models.event_snapshot import EventSnapshot
+from app.services.dashboard_stats_service import DashboardStatsService
 from app.utils.logger import setup_logger
 
 logger = setup_logger("analysis_service")
 
+SNAPSHOT_CHUNK_SIZE = 500
+
 
 class AnalysisService:
     def __init__(self, db: Session):
@@ -20,20 +24,33 @@ class AnalysisService:
         self.production_calc = ProductionWindowCalculator()
 
     def recalculate_all(self):
-        """Recalculate scores for all active future events."""
+        """Recalculate scores for all active future events.
+
+        Runs as a unit of work: ``db_writer.run_sync(lambda s: AnalysisService(s).recalculate_all())``.
+        """
         events = (
             self.db.query(Event)
             .filter(Event.is_active.is_(True), Event.event_date >= datetime.utcnow())
             .all()
         )
 
+        self.rescore_events(events)
+        bump_data_version(self.db)
+        DashboardStatsService(self.db).refresh()
+
+        logger.info(f"Recalculated scores for {len(events)} events")
+
+    def rescore_events(
+        self,
+        events: list[Event],
+        snapshots_by_event: dict[int, list[EventSnapshot]] | None = None,
+    ):
+        """Recalculate scores for a batch of events with one snapshot query."""
+        if snapshots_by_event is None:
+            snapshots_by_event = self.load_snapshots([e.id for e in events])
+
         for event in events:
-            snapshots = (
-                self.db.query(EventSnapshot)
-                .filter(EventSnapshot.event_id == event.id)
-                .order_by(EventSnapshot.snapshot_at.asc())
-                .all()
-            )
+            snapshots = snapshots_by_event.get(event.id, [])
 
             hype = self.hype_calc.calculate(event, snapshots)
             event.hype_score = hype
@@ -45,5 +62,16 @@ class AnalysisService:
             event.production_start_date = start
             event.production_deadline = deadline
 
-        self.db.commit()
-        logger.info(f"Recalculated scores for {len(events)} events")
+    def load_snapshots(self, event_ids: list[int]) -> dict[int, list[EventSnapshot]]:
+        """Snapshots per event, oldest first."""
+        snapshots_by_event: dict[int, list[EventSnapshot]] = {}
+        for start in range(0, len(event_ids), SNAPSHOT_CHUNK_SIZE):
+            snapshots = (
+                self.db.query(EventSnapshot)
+                .filter(EventSnapshot.event_id.in_(event_ids[start:start + SNAPSHOT_CHUNK_SIZE]))
+                .order_by(EventSnapshot.event_id, EventSnapshot.snapshot_at.asc())
+                .all()
+            )
+            for snap in snapshots:
+                snapshots_by_event.setdefault(snap.event_id, []).append(snap)
+        return snapshots_by_event
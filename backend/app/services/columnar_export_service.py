@@ -0,0 +1,209 @@
+"""Partitioned Parquet export of the fact tables for offline analysis.
+
+Each table is written under ``<root>/<table>/month=YYYY-MM/platform=<p>/``
+as zstd-compressed Parquet (hive-style partitions, readable by pyarrow,
+DuckDB, Spark or pandas as one dataset). ``manifest.json`` at the root
+lists every file and keeps a per-table watermark. The next run only
+appends rows changed past it: ``updated_at`` for events and products and
+``snapshot_at`` for snapshots, with the id breaking ties. Logs are inserted
+only when a run finishes, long after their ``started_at``, so they are
+tracked by ``id`` alone. Updated rows are appended again, so readers keep
+the latest row per ``id``.
+
+pyarrow is imported only here, so the API and workers never load it.
+"""
+
+import json
+import os
+from datetime import datetime
+
+from sqlalchemy import JSON, Boolean, Date, DateTime, Float, Integer, and_, or_, select
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.models.event import Event
+from app.models.event_snapshot import EventSnapshot
+from app.models.marketplace_product import MarketplaceProduct
+from app.models.scraping_log import ScrapingLog
+from app.utils.logger import setup_logger
+
+logger = setup_logger("columnar_export")
+
+MANIFEST = "manifest.json"
+MANIFEST_VERSION = 1
+UNKNOWN_PLATFORM = "unknown"
+
+# table -> (model, watermark column, month column)
+TABLES = {
+    "events": (Event, Event.updated_at, Event.event_date),
+    "event_snapshots": (EventSnapshot, EventSnapshot.snapshot_at, EventSnapshot.snapshot_at),
+    "marketplace_products": (MarketplaceProduct, MarketplaceProduct.updated_at, MarketplaceProduct.first_seen_at),
+    "scraping_logs": (ScrapingLog, ScrapingLog.id, ScrapingLog.started_at),
+}
+
+
+class ColumnarExportService:
+    def __init__(self, db: Session, root: str, compression: str = "zstd"):
+        self.db = db
+        self.root = root
+        self.compression = compression
+
+    def export(self, tables: list[str] | None = None, full: bool = False) -> dict:
+        """Append rows changed since the manifest's watermarks (everything with ``full``).
+
+        ``full`` starts the selected tables over, deleting their files.
+        Returns the number of rows written per table.
+        """
+        pa, pq = _pyarrow()
+        manifest = self._load_manifest()
+        run_id = datetime.utcnow().strftime("%Y%m%dT%H%M%S%f")
+        written = {}
+        for name in tables or list(TABLES):
+            entry = manifest["tables"].get(name)
+            column = TABLES[name][1].name
+            # A watermark on another column than the table now uses cannot be resumed from
+            moved = bool(entry and entry["watermark"] and entry["watermark"]["column"] != column)
+            if moved:
+                logger.info(f"{name} is now tracked by {column}; exporting it again")
+            if full or moved or entry is None:
+                if entry is not None:
+                    self._remove_files(entry)
+                entry = {"watermark": None, "files": [], "rows": 0}
+            written[name] = self._export_table(pa, pq, name, entry, run_id)
+            manifest["tables"][name] = entry
+            # Saved per table, so a failure later keeps the tables already done
+            manifest["generated_at"] = datetime.utcnow().isoformat()
+            self._save_manifest(manifest)
+        return written
+
+    def _export_table(self, pa, pq, name: str, entry: dict, run_id: str) -> int:
+        model, watermark_column, month_column = TABLES[name]
+        table = model.__table__
+        schema = pa.schema([(column.name, _arrow_type(pa, column.type)) for column in table.columns])
+        json_columns = [column.name for column in table.columns if isinstance(column.type, JSON)]
+
+        platform = _platform_column(model)
+        statement = select(table, platform.label("_platform"))
+        if model is EventSnapshot:
+            statement = statement.outerjoin(Event, EventSnapshot.event_id == Event.id)
+        watermark = entry["watermark"]
+        by_id = watermark_column is model.id
+        if watermark is not None and by_id:
+            statement = statement.where(model.id > watermark["id"])
+        elif watermark is not None:
+            value = datetime.fromisoformat(watermark["value"])
+            statement = statement.where(or_(
+                watermark_column > value,
+                and_(watermark_column == value, model.id > watermark["id"]),
+            ))
+        statement = statement.order_by(model.id) if by_id else statement.order_by(watermark_column, model.id)
+
+        names = schema.names
+        month_index = names.index(month_column.name)
+        watermark_index = names.index(watermark_column.name)
+        id_index = names.index("id")
+        json_indexes = [names.index(column) for column in json_columns]
+
+        writers: dict[tuple[str, str], tuple] = {}
+        rows_written = 0
+        last = None
+        result = self.db.execute(statement.execution_options(yield_per=settings.EXPORT_BATCH_SIZE))
+        try:
+            for batch in result.partitions():
+                partitions: dict[tuple[str, str], list] = {}
+                for row in batch:
+                    month = row[month_index]
+                    key = (month.strftime("%Y-%m") if month else "unknown", row[-1] or UNKNOWN_PLATFORM)
+                    partitions.setdefault(key, []).append(row)
+                last = (batch[-1][watermark_index], batch[-1][id_index])
+
+                for key, rows in partitions.items():
+                    # Row tuples to columns; the trailing _platform is dropped
+                    columns = list(zip(*rows))[:len(names)]
+                    for index in json_indexes:
+                        columns[index] = [None if v is None else json.dumps(v) for v in columns[index]]
+                    if key not in writers:
+                        path = os.path.join(name, f"month={key[0]}", f"platform={_safe(key[1])}", f"part-{run_id}.parquet")
+                        os.makedirs(os.path.dirname(os.path.join(self.root, path)), exist_ok=True)
+                        writer = pq.ParquetWriter(os.path.join(self.root, path), schema, compression=self.compression)
+                        writers[key] = (path, writer, [0])
+                    path, writer, count = writers[key]
+                    writer.write_table(pa.Table.from_arrays(
+                        [pa.array(column, type=field.type) for column, field in zip(columns, schema)], schema=schema
+                    ))
+                    count[0] += len(rows)
+                rows_written += len(batch)
+        finally:
+            for path, writer, count in writers.values():
+                writer.close()
+
+        for (month, platform_key), (path, writer, count) in sorted(writers.items()):
+            entry["files"].append({
+                "path": path,
+                "month": month,
+                "platform": platform_key,
+                "rows": count[0],
+                "run": run_id,
+            })
+        entry["rows"] += rows_written
+        if last is not None and last[0] is not None:
+            value = last[0] if by_id else last[0].isoformat()
+            entry["watermark"] = {"column": watermark_column.name, "value": value, "id": last[1]}
+        logger.info(f"Exported {rows_written} {name} rows into {len(writers)} files")
+        return rows_written
+
+    def _load_manifest(self) -> dict:
+        path = os.path.join(self.root, MANIFEST)
+        if not os.path.exists(path):
+            return {"version": MANIFEST_VERSION, "format": "parquet", "partitioning": ["month", "platform"], "tables": {}}
+        with open(path) as f:
+            return json.load(f)
+
+    def _save_manifest(self, manifest: dict):
+        os.makedirs(self.root, exist_ok=True)
+        path = os.path.join(self.root, MANIFEST)
+        with open(path + ".tmp", "w") as f:
+            json.dump(manifest, f, indent=2)
+        os.replace(path + ".tmp", path)
+
+    def _remove_files(self, entry: dict):
+        for file in entry["files"]:
+            try:
+                os.remove(os.path.join(self.root, file["path"]))
+            except FileNotFoundError:
+                pass
+
+
+def _pyarrow():
+    try:
+        import pyarrow
+        import pyarrow.parquet
+    except ImportError as e:
+        raise RuntimeError("Parquet export needs pyarrow: pip install -r requirements.txt") from e
+    return pyarrow, pyarrow.parquet
+
+
+def _platform_column(model):
+    """Partition platform: the event's source for events and their snapshots."""
+    if model in (Event, EventSnapshot):
+        return Event.source_platform
+    return model.platform
+
+
+def _arrow_type(pa, column_type):
+    if isinstance(column_type, Boolean):
+        return pa.bool_()
+    if isinstance(column_type, Integer):
+        return pa.int64()
+    if isinstance(column_type, Float):
+        return pa.float64()
+    if isinstance(column_type, DateTime):
+        return pa.timestamp("us")
+    if isinstance(column_type, Date):
+        return pa.date32()
+    return pa.string()
+
+
+def _safe(value: str) -> str:
+    """A partition value usable as a path segment."""
+    return "".join(c if c.isalnum() or c in "-_." else "_" for c in value)
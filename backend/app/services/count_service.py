@@ -0,0 +1,134 @@
+from collections.abc import Hashable
+from datetime import datetime
+
+from sqlalchemy import func
+from sqlalchemy.orm import Query, Session
+
+from app.cache import VersionedLRUCache
+from app.config import settings
+from app.data_version import current_data_version
+from app.models.artist import Artist
+from app.models.event import Event
+from app.models.marketplace_product import MarketplaceProduct
+from app.models.venue import Venue
+
+# Filters each scope can estimate from facet counts; anything else is counted exactly
+EVENT_FACETS = ("city", "state", "genre")
+PRODUCT_FACETS = ("platform", "category", "related_artist")
+
+count_cache = VersionedLRUCache(settings.COUNT_CACHE_SIZE)
+
+
+class CountService:
+    """Total counts for the list endpoints.
+
+    Exact counts are cached per normalized filter set and data version, so
+    paging through one result set counts it once. The "estimated" mode
+    answers from per-facet counts (one GROUP BY per facet, also computed
+    once per data version): exact for a single facet, and assuming the
+    facets are independent when several are combined.
+    """
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def count(self, scope: str, filters: dict, query: Query, mode: str = "exact") -> tuple[int, bool]:
+        """(total, is_estimate) for ``query``, whose filters are ``filters``."""
+        version = current_data_version(self.db)
+        active = {name: value for name, value in filters.items() if value not in (None, [], "")}
+
+        if mode == "estimated":
+            estimate = self._estimate(scope, active, version)
+            if estimate is not None:
+                return estimate, True
+
+        key = ("count", scope, _day(scope), _freeze(active))
+        total = count_cache.get(key, version)
+        if total is None:
+            total = query.count()
+            count_cache.set(key, version, total)
+        return total, False
+
+    def _estimate(self, scope: str, filters: dict, version: int) -> int | None:
+        facet_names = EVENT_FACETS if scope == "events" else PRODUCT_FACETS
+        if any(name not in facet_names for name in filters):
+            return None
+
+        facets = self._facet_counts(scope, version)
+        total = facets["total"]
+        if total == 0:
+            return 0
+
+        estimate = float(total)
+        for name, wanted in filters.items():
+            counts = facets[name]
+            if scope == "events":
+                # Event filters are canonical keys matched by equality
+                matched = sum(counts.get(key, 0) for key in wanted)
+            else:
+                # Product filters other than platform are substring matches
+                needle = str(wanted).lower()
+                matched = sum(
+                    count for value, count in counts.items()
+                    if value is not None
+                    and (value.lower() == needle if name == "platform" else needle in value.lower())
+                )
+            estimate *= matched / total
+        return round(estimate)
+
+    def _facet_counts(self, scope: str, version: int) -> dict:
+        key = ("facets", scope, _day(scope))
+        facets = count_cache.get(key, version)
+        if facets is None:
+            facets = self._event_facets() if scope == "events" else self._product_facets()
+            count_cache.set(key, version, facets)
+        return facets
+
+    def _event_facets(self) -> dict:
+        today = datetime.combine(datetime.utcnow().date(), datetime.min.time())
+        upcoming = (Event.is_active.is_(True), Event.event_date >= today)
+
+        def by(column, join_on):
+            rows = (
+                self.db.query(column, func.count(Event.id))
+                .select_from(Event)
+                .join(join_on)
+                .filter(*upcoming)
+                .group_by(column)
+                .all()
+            )
+            return dict(rows)
+
+        return {
+            "total": self.db.query(func.count(Event.id)).filter(*upcoming).scalar() or 0,
+            "city": by(Venue.city_key, Event.venue),
+            "state": by(Venue.state_key, Event.venue),
+            "genre": by(Artist.genre_key, Event.artist),
+        }
+
+    def _product_facets(self) -> dict:
+        def by(column):
+            return dict(
+                self.db.query(column, func.count(MarketplaceProduct.id)).group_by(column).all()
+            )
+
+        return {
+            "total": self.db.query(func.count(MarketplaceProduct.id)).scalar() or 0,
+            "platform": by(MarketplaceProduct.platform),
+            "category": by(MarketplaceProduct.category),
+            "related_artist": by(MarketplaceProduct.related_artist),
+        }
+
+
+def _day(scope: str):
+    """Event lists default to upcoming events, whose set shifts at midnight."""
+    return datetime.utcnow().date() if scope == "events" else None
+
+
+def _freeze(value) -> Hashable:
+    """Hashable, order-independent form of a filter dict."""
+    if isinstance(value, dict):
+        return tuple(sorted((name, _freeze(item)) for name, item in value.items()))
+    if isinstance(value, (list, tuple, set)):
+        return tuple(sorted(_freeze(item) for item in value))
+    return value
@@ -0,0 +1,216 @@
+import threading
+from collections import defaultdict
+from datetime import date, datetime
+
+from sqlalchemy import case, func, insert
+from sqlalchemy.orm import Session
+
+from app.data_version import current_events_version
+from app.db_writer import db_writer
+from app.models.artist import Artist
+from app.models.event import Event
+from app.models.event_stats import DashboardStats, EventDayFacet, EventDayStats
+from app.models.venue import Venue
+from app.utils.logger import setup_logger
+
+logger = setup_logger("dashboard_stats")
+
+HIGH_SCORE = 70
+TOP_N = 5
+_ROW_ID = 1
+
+_refresh_pending = threading.Event()
+
+
+class DashboardStatsService:
+    """Dashboard statistics from one aggregation pass, materialized per day.
+
+    ``refresh`` groups the active upcoming events by (day, city, genre) in a
+    single query with conditional sums for the score thresholds, stores the
+    per-day totals and facets, and stores the finished dashboard payload.
+    Event ingest and rescoring refresh in the same transaction. Reads return
+    the stored payload while it is from today; if the event data version
+    moved on since (another writer), it is still served while a refresh is
+    queued. Product-only writes leave it current. A
+    missing or day-old row is answered from a live pass.
+
+    "Upcoming" counts whole days from the start of today (UTC).
+    """
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def get_dashboard_stats(self) -> dict:
+        today = datetime.utcnow().date()
+        row = self.db.get(DashboardStats, _ROW_ID)
+        if self._is_usable(row, today):
+            return row.payload
+        return _summarize(*self.compute(today), today)
+
+    def get_month_windows(self, start: date, months: int) -> list[dict]:
+        """Upcoming-event stats for each of ``months`` calendar months from ``start``."""
+        today = datetime.utcnow().date()
+        first = start.replace(day=1)
+        bounds = [_add_months(first, i) for i in range(months + 1)]
+
+        if self._is_usable(self.db.get(DashboardStats, _ROW_ID), today):
+            days = {
+                row.day: (row.total, row.high_hype, row.high_potential)
+                for row in self.db.query(EventDayStats).filter(
+                    EventDayStats.day >= max(first, today), EventDayStats.day < bounds[-1]
+                )
+            }
+            facets = {
+                (row.day, row.facet, row.value): row.count
+                for row in self.db.query(EventDayFacet).filter(
+                    EventDayFacet.day >= max(first, today), EventDayFacet.day < bounds[-1]
+                )
+            }
+        else:
+            days, facets = self.compute(today)
+
+        return [
+            {
+                "month": bounds[i].strftime("%Y-%m"),
+                **_window(days, facets, max(bounds[i], today), bounds[i + 1]),
+            }
+            for i in range(months)
+        ]
+
+    def refresh(self) -> dict:
+        """Recompute the materialized tables. Unit of work for the db_writer."""
+        today = datetime.utcnow().date()
+        days, facets = self.compute(today)
+
+        self.db.query(EventDayStats).delete()
+        self.db.query(EventDayFacet).delete()
+        if days:
+            self.db.execute(insert(EventDayStats), [
+                {"day": day, "total": total, "high_hype": high_hype, "high_potential": high_potential}
+                for day, (total, high_hype, high_potential) in days.items()
+            ])
+        if facets:
+            self.db.execute(insert(EventDayFacet), [
+                {"day": day, "facet": facet, "value": value, "count": count}
+                for (day, facet, value), count in facets.items()
+            ])
+
+        payload = _summarize(days, facets, today)
+        row = self.db.get(DashboardStats, _ROW_ID) or DashboardStats(id=_ROW_ID)
+        row.as_of = today
+        row.data_version = current_events_version(self.db)
+        row.payload = payload
+        row.computed_at = datetime.utcnow()
+        self.db.add(row)
+        return payload
+
+    def compute(self, today: date) -> tuple[dict, dict]:
+        """One grouped pass over active events from ``today``: per-day counts and facets."""
+        day = func.date(Event.event_date)
+        rows = (
+            self.db.query(
+                day,
+                Venue.city,
+                Artist.genre,
+                func.count(Event.id),
+                func.sum(case((Event.hype_score >= HIGH_SCORE, 1), else_=0)),
+                func.sum(case((Event.sales_potential_score >= HIGH_SCORE, 1), else_=0)),
+            )
+            .select_from(Event)
+            .outerjoin(Venue, Event.venue_id == Venue.id)
+            .outerjoin(Artist, Event.artist_id == Artist.id)
+            .filter(
+                Event.is_active.is_(True),
+                Event.event_date >= datetime.combine(today, datetime.min.time()),
+            )
+            .group_by(day, Venue.city, Artist.genre)
+            .all()
+        )
+
+        days: dict[date, list[int]] = defaultdict(lambda: [0, 0, 0])
+        facets: dict[tuple, int] = defaultdict(int)
+        for raw_day, city, genre, count, high_hype, high_potential in rows:
+            event_day = date.fromisoformat(raw_day) if isinstance(raw_day, str) else raw_day
+            totals = days[event_day]
+            totals[0] += count
+            totals[1] += high_hype or 0
+            totals[2] += high_potential or 0
+            if city is not None:
+                facets[(event_day, "city", city)] += count
+            if genre is not None:
+                facets[(event_day, "genre", genre)] += count
+        return {day: tuple(totals) for day, totals in days.items()}, dict(facets)
+
+    def _is_usable(self, row: DashboardStats | None, today: date) -> bool:
+        """True when ``row`` can be served; queues a refresh when it is not current."""
+        if row is None or row.as_of != today:
+            schedule_refresh()
+            return False
+        if row.data_version != current_events_version(self.db):
+            schedule_refresh()
+        return True
+
+
+def schedule_refresh():
+    """Queue one refresh on the db_writer unless one is already pending."""
+    if _refresh_pending.is_set():
+        return
+    _refresh_pending.set()
+    future = db_writer.submit(lambda session: DashboardStatsService(session).refresh())
+
+    def _done(done):
+        _refresh_pending.clear()
+        if done.exception() is not None:
+            logger.error(f"Dashboard stats refresh failed: {done.exception()}")
+
+    future.add_done_callback(_done)
+
+
+def _summarize(days: dict, facets: dict, today: date) -> dict:
+    month_end = _add_months(today.replace(day=1), 1)
+    next_month_end = _add_months(month_end, 1)
+    window = _window(days, facets, today, None)
+    return {
+        "total_events": window["total_events"],
+        "high_hype_count": window["high_hype_count"],
+        "high_potential_count": window["high_potential_count"],
+        "events_this_month": _window(days, {}, today, month_end)["total_events"],
+        "events_next_month": _window(days, {}, month_end, next_month_end)["total_events"],
+        "top_cities": window["top_cities"],
+        "top_genres": window["top_genres"],
+    }
+
+
+def _window(days: dict, facets: dict, start: date, end: date | None) -> dict:
+    """Sum the per-day rows in [start, end); ``end=None`` is open-ended."""
+
+    def inside(day: date) -> bool:
+        return day >= start and (end is None or day < end)
+
+    totals = [0, 0, 0]
+    for day, counts in days.items():
+        if inside(day):
+            for i in range(3):
+                totals[i] += counts[i]
+
+    by_facet: dict[str, dict[str, int]] = {"city": defaultdict(int), "genre": defaultdict(int)}
+    for (day, facet, value), count in facets.items():
+        if inside(day):
+            by_facet[facet][value] += count
+
+    def top(facet: str) -> list[dict]:
+        ranked = sorted(by_facet[facet].items(), key=lambda item: (-item[1], item[0]))
+        return [{facet: value, "count": count} for value, count in ranked[:TOP_N]]
+
+    return {
+        "total_events": totals[0],
+        "high_hype_count": totals[1],
+        "high_potential_count": totals[2],
+        "top_cities": top("city"),
+        "top_genres": top("genre"),
+    }
+
+
+def _add_months(first_of_month: date, months: int) -> date:
+    month_index = first_of_month.month - 1 + months
+    return date(first_of_month.year + month_index // 12, month_index % 12 + 1, 1)
@@ -1,11 +1,19 @@
 from datetime import date, datetime
 
-from sqlalchemy import func
+from sqlalchemy import false
 from sqlalchemy.orm import Session, joinedload
 
+from app.database import IS_SQLITE
 from app.models.artist import Artist
 from app.models.event import Event
 from app.models.venue import Venue
+from app.search_index import build_match_query, event_match_ids
+from app.services.count_service import CountService
+from app.services.dashboard_stats_service import DashboardStatsService
+from app.utils.date_utils import canonical_key
+from app.utils.pagination import Keyset
+
+EVENT_DATE_KEYSET = Keyset("event_date", Event.event_date, Event.id)
 
 
 class EventService:
@@ -14,27 +22,99 @@ class EventService:
 
     def list_events(
         self,
-        city: str | None = None,
+        city: str | list[str] | None = None,
         date_from: date | None = None,
         date_to: date | None = None,
         min_hype: float | None = None,
         min_sales_potential: float | None = None,
-        genre: str | None = None,
+        genre: str | list[str] | None = None,
+        state: str | list[str] | None = None,
+        q: str | None = None,
         page: int = 1,
         page_size: int = 50,
+        cursor: str | None = None,
+        include_total: bool | None = None,
+        count_mode: str = "exact",
     ) -> dict:
-        query = (
-            self.db.query(Event)
-            .options(joinedload(Event.artist), joinedload(Event.venue))
-            .filter(Event.is_active.is_(True))
+        """One page of upcoming events by date, by ``page`` offset or by ``cursor``.
+
+        ``total`` is skipped (None) for cursor pages unless ``include_total``
+        is set; ``count_mode="estimated"`` may answer it from facet counts.
+        Raises ValueError for a malformed cursor.
+        """
+        query = self.filter_events(
+            self.db.query(Event, Event.event_date).options(joinedload(Event.artist), joinedload(Event.venue)),
+            city=city,
+            date_from=date_from,
+            date_to=date_to,
+            min_hype=min_hype,
+            min_sales_potential=min_sales_potential,
+            genre=genre,
+            state=state,
+            q=q,
+        )
+        city_keys = _lookup_keys(city)
+        state_keys = _lookup_keys(state)
+        genre_keys = _lookup_keys(genre)
+
+        if include_total is None:
+            include_total = cursor is None
+        total, estimated = None, False
+        if include_total:
+            filters = {
+                "city": city_keys,
+                "state": state_keys,
+                "genre": genre_keys,
+                "date_from": date_from,
+                "date_to": date_to,
+                "min_hype": min_hype,
+                "min_sales_potential": min_sales_potential,
+                "q": q.strip().lower() if q else None,
+            }
+            total, estimated = CountService(self.db).count("events", filters, query, count_mode)
+
+        events, next_cursor = EVENT_DATE_KEYSET.paginate(
+            query, cursor, page_size, offset=(page - 1) * page_size
         )
 
+        return {
+            "events": events,
+            "total": total,
+            "total_estimated": estimated,
+            "page": page,
+            "page_size": page_size,
+            "next_cursor": next_cursor,
+        }
+
+    def filter_events(
+        self,
+        query,
+        city: str | list[str] | None = None,
+        date_from: date | None = None,
+        date_to: date | None = None,
+        min_hype: float | None = None,
+        min_sales_potential: float | None = None,
+        genre: str | list[str] | None = None,
+        state: str | list[str] | None = None,
+        q: str | None = None,
+    ):
+        """Apply the ``list_events`` filters to a query over Event (active, upcoming by default)."""
+        query = query.filter(Event.is_active.is_(True))
+
         # By default, exclude past events (only show today and future)
         if not date_from:
             query = query.filter(Event.event_date >= datetime.utcnow().replace(hour=0, minute=0, second=0))
 
-        if city:
-            query = query.join(Venue).filter(Venue.city.ilike(f"%{city}%"))
+        city_keys = _lookup_keys(city)
+        state_keys = _lookup_keys(state)
+        genre_keys = _lookup_keys(genre)
+
+        if city_keys or state_keys:
+            query = query.join(Venue, Event.venue_id == Venue.id)
+            if city_keys:
+                query = query.filter(Venue.city_key.in_(city_keys))
+            if state_keys:
+                query = query.filter(Venue.state_key.in_(state_keys))
         if date_from:
             query = query.filter(Event.event_date >= datetime.combine(date_from, datetime.min.time()))
         if date_to:
@@ -43,27 +123,18 @@ class EventService:
             query = query.filter(Event.hype_score >= min_hype)
         if min_sales_potential is not None:
             query = query.filter(Event.sales_potential_score >= min_sales_potential)
-        if genre:
-            if not city:
-                query = query.join(Event.artist)
-            else:
-                query = query.join(Artist)
-            query = query.filter(Artist.genre.ilike(f"%{genre}%"))
-
-        total = query.count()
-        events = (
-            query.order_by(Event.event_date.asc())
-            .offset((page - 1) * page_size)
-            .limit(page_size)
-            .all()
-        )
+        if genre_keys:
+            query = query.join(Artist, Event.artist_id == Artist.id).filter(
+                Artist.genre_key.in_(genre_keys)
+            )
+        if q and IS_SQLITE:
+            match_query = build_match_query(q)
+            # Text without any word (e.g. "--") matches nothing rather than everything
+            query = query.filter(Event.id.in_(event_match_ids(match_query)) if match_query else false())
+        elif q:
+            query = query.filter(Event.title.ilike(f"%{q}%"))
 
-        return {
-            "events": events,
-            "total": total,
-            "page": page,
-            "page_size": page_size,
-        }
+        return query
 
     def get_event_detail(self, event_id: int) -> Event | None:
         return (
@@ -94,60 +165,15 @@ class EventService:
         )
 
     def get_dashboard_stats(self) -> dict:
-        now = datetime.utcnow()
-        base = self.db.query(Event).filter(
-            Event.is_active.is_(True), Event.event_date >= now
-        )
-
-        total = base.count()
-        high_hype = base.filter(Event.hype_score >= 70).count()
-        high_potential = base.filter(Event.sales_potential_score >= 70).count()
-
-        current_month_end = datetime(now.year, now.month + 1, 1) if now.month < 12 else datetime(now.year + 1, 1, 1)
-        events_this_month = base.filter(Event.event_date < current_month_end).count()
-
-        next_month_start = current_month_end
-        next_month_end = datetime(
-            next_month_start.year,
-            next_month_start.month + 1 if next_month_start.month < 12 else 1,
-            1,
-            0, 0, 0,
-        )
-        if next_month_start.month == 12:
-            next_month_end = datetime(next_month_start.year + 1, 1, 1)
-        events_next_month = base.filter(
-            Event.event_date >= next_month_start,
-            Event.event_date < next_month_end,
-        ).count()
-
-        top_cities_rows = (
-            self.db.query(Venue.city, func.count(Event.id).label("count"))
-            .join(Event, Event.venue_id == Venue.id)
-            .filter(Event.is_active.is_(True), Event.event_date >= now)
-            .group_by(Venue.city)
-            .order_by(func.count(Event.id).desc())
-            .limit(5)
-            .all()
-        )
-        top_cities = [{"city": row[0], "count": row[1]} for row in top_cities_rows]
-
-        top_genres_rows = (
-            self.db.query(Artist.genre, func.count(Event.id).label("count"))
-            .join(Event, Event.artist_id == Artist.id)
-            .filter(Event.is_active.is_(True), Event.event_date >= now, Artist.genre.isnot(None))
-            .group_by(Artist.genre)
-            .order_by(func.count(Event.id).desc())
-            .limit(5)
-            .all()
-        )
-        top_genres = [{"genre": row[0], "count": row[1]} for row in top_genres_rows]
-
-        return {
-            "total_events": total,
-            "high_hype_count": high_hype,
-            "high_potential_count": high_potential,
-            "events_this_month": events_this_month,
-            "events_next_month": events_next_month,
-            "top_cities": top_cities,
-            "top_genres": top_genres,
-        }
+        return DashboardStatsService(self.db).get_dashboard_stats()
+
+
+def _lookup_keys(values: str | list[str] | None) -> list[str]:
+    """Canonical keys for one or more filter values; commas also separate values."""
+    if not values:
+        return []
+    if isinstance(values, str):
+        values = [values]
+    keys = {canonical_key(part) for value in values for part in value.split(",")}
+    keys.discard(None)
+    return sorted(keys)
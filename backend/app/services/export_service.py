@@ -0,0 +1,183 @@
+"""Streaming export of events, snapshots and marketplace products.
+
+Rows are read with ``yield_per``, so the driver hands them over in batches
+instead of loading the whole result, and are encoded one batch per chunk.
+Memory stays flat whatever the table size. The filters are those of the
+list endpoints.
+"""
+
+import csv
+import io
+import json
+from collections.abc import Iterator
+from datetime import date, datetime
+
+from sqlalchemy.orm import Session, aliased
+
+from app.config import settings
+from app.database import ReadSessionLocal
+from app.models.artist import Artist
+from app.models.event import Event
+from app.models.event_snapshot import EventSnapshot
+from app.models.marketplace_product import MarketplaceProduct
+from app.models.venue import Venue
+from app.services.event_service import EventService
+from app.services.marketplace_service import MarketplaceService
+
+DATASETS = ("events", "snapshots", "products")
+# format -> media type
+FORMATS = {"ndjson": "application/x-ndjson", "csv": "text/csv"}
+
+_artist = aliased(Artist)
+_venue = aliased(Venue)
+
+EVENT_COLUMNS = {
+    "id": Event.id,
+    "title": Event.title,
+    "artist": _artist.name,
+    "genre": _artist.genre,
+    "venue": _venue.name,
+    "city": _venue.city,
+    "state": _venue.state,
+    "event_date": Event.event_date,
+    "event_type": Event.event_type,
+    "is_festival": Event.is_festival,
+    "ticket_status": Event.ticket_status,
+    "estimated_audience": Event.estimated_audience,
+    "ticket_price_min": Event.ticket_price_min,
+    "ticket_price_max": Event.ticket_price_max,
+    "hype_score": Event.hype_score,
+    "sales_potential_score": Event.sales_potential_score,
+    "production_start_date": Event.production_start_date,
+    "production_deadline": Event.production_deadline,
+    "source_platform": Event.source_platform,
+    "source_url": Event.source_url,
+    "first_seen_at": Event.first_seen_at,
+    "updated_at": Event.updated_at,
+}
+SNAPSHOT_COLUMNS = {
+    "id": EventSnapshot.id,
+    "event_id": EventSnapshot.event_id,
+    "snapshot_at": EventSnapshot.snapshot_at,
+    "ticket_status": EventSnapshot.ticket_status,
+    "estimated_audience": EventSnapshot.estimated_audience,
+    "ticket_price_min": EventSnapshot.ticket_price_min,
+    "ticket_price_max": EventSnapshot.ticket_price_max,
+}
+PRODUCT_COLUMNS = {
+    "id": MarketplaceProduct.id,
+    "title": MarketplaceProduct.title,
+    "platform": MarketplaceProduct.platform,
+    "external_id": MarketplaceProduct.external_id,
+    "product_url": MarketplaceProduct.product_url,
+    "price": MarketplaceProduct.price,
+    "original_price": MarketplaceProduct.original_price,
+    "sold_count": MarketplaceProduct.sold_count,
+    "rating": MarketplaceProduct.rating,
+    "review_count": MarketplaceProduct.review_count,
+    "seller_name": MarketplaceProduct.seller_name,
+    "seller_location": MarketplaceProduct.seller_location,
+    "category": MarketplaceProduct.category,
+    "related_artist": MarketplaceProduct.related_artist,
+    "related_event": MarketplaceProduct.related_event,
+    "first_seen_at": MarketplaceProduct.first_seen_at,
+    "updated_at": MarketplaceProduct.updated_at,
+}
+
+
+class ExportService:
+    def __init__(self, db: Session):
+        self.db = db
+
+    def rows(self, dataset: str, filters: dict) -> tuple[list[str], Iterator[tuple]]:
+        """Column names and a lazy row iterator of ``dataset`` under ``filters``."""
+        if dataset == "events":
+            columns = EVENT_COLUMNS
+            query = EventService(self.db).filter_events(
+                self.db.query(*columns.values())
+                .select_from(Event)
+                .outerjoin(_artist, Event.artist_id == _artist.id)
+                .outerjoin(_venue, Event.venue_id == _venue.id),
+                **filters,
+            ).order_by(Event.event_date, Event.id)
+        elif dataset == "snapshots":
+            columns = SNAPSHOT_COLUMNS
+            query = self._filter_snapshots(
+                self.db.query(*columns.values()), **filters
+            ).order_by(EventSnapshot.id)
+        elif dataset == "products":
+            columns = PRODUCT_COLUMNS
+            query, _ = MarketplaceService(self.db).filter_products(
+                self.db.query(*columns.values()), **filters
+            )
+            query = query.order_by(MarketplaceProduct.id)
+        else:
+            raise ValueError(f"Unknown dataset: {dataset}")
+        return list(columns), iter(query.yield_per(settings.EXPORT_BATCH_SIZE))
+
+    def stream(self, dataset: str, fmt: str, filters: dict) -> Iterator[bytes]:
+        """The export encoded as NDJSON or CSV, one chunk per batch of rows."""
+        if fmt not in FORMATS:
+            raise ValueError(f"Unknown format: {fmt}")
+        names, rows = self.rows(dataset, filters)
+        encode = _ndjson_chunk if fmt == "ndjson" else _csv_chunk
+        if fmt == "csv":
+            yield _csv_chunk([names], names)
+        batch = []
+        for row in rows:
+            batch.append(row)
+            if len(batch) >= settings.EXPORT_BATCH_SIZE:
+                yield encode(batch, names)
+                batch = []
+        if batch:
+            yield encode(batch, names)
+
+    def _filter_snapshots(
+        self,
+        query,
+        event_id: int | None = None,
+        date_from: date | None = None,
+        date_to: date | None = None,
+        ticket_status: str | None = None,
+    ):
+        if event_id is not None:
+            query = query.filter(EventSnapshot.event_id == event_id)
+        if date_from:
+            query = query.filter(EventSnapshot.snapshot_at >= datetime.combine(date_from, datetime.min.time()))
+        if date_to:
+            query = query.filter(EventSnapshot.snapshot_at <= datetime.combine(date_to, datetime.max.time()))
+        if ticket_status:
+            query = query.filter(EventSnapshot.ticket_status == ticket_status)
+        return query
+
+
+def stream_export(dataset: str, fmt: str, filters: dict) -> Iterator[bytes]:
+    """``ExportService.stream`` on its own read session, closed when the stream ends.
+
+    Meant for a streaming response, which outlives the request's session.
+    """
+    db = ReadSessionLocal()
+    try:
+        yield from ExportService(db).stream(dataset, fmt, filters)
+    finally:
+        db.close()
+
+
+def _plain(value):
+    return value.isoformat() if isinstance(value, (datetime, date)) else value
+
+
+def _ndjson_chunk(rows: list[tuple], names: list[str]) -> bytes:
+    lines = [
+        json.dumps(dict(zip(names, row)), ensure_ascii=False, default=_plain)
+        for row in rows
+    ]
+    lines.append("")
+    return "\n".join(lines).encode()
+
+
+def _csv_chunk(rows: list, names: list[str]) -> bytes:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerows([_plain(value) for value in row] for row in rows)
+    return buffer.getvalue().encode()
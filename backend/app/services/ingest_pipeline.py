@@ -0,0 +1,198 @@
+"""Streaming ingest: scrapers feed a bounded queue drained by a batching writer task."""
+
+import asyncio
+import time
+from collections.abc import AsyncIterator, Callable
+from typing import Any
+from dataclasses import dataclass, field
+from datetime import datetime
+
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.data_version import bump_data_version
+from app.db_maintenance import maintenance
+from app.db_writer import db_writer
+from app.utils.logger import setup_logger
+
+logger = setup_logger("ingest_pipeline")
+
+_DONE = object()
+
+
+@dataclass
+class StageStats:
+    items: int = 0
+    batches: int = 0
+    busy_seconds: float = 0.0
+    started_at: float | None = None
+    finished_at: float | None = None
+
+    def to_dict(self) -> dict:
+        end = self.finished_at or time.time()
+        elapsed = end - self.started_at if self.started_at else 0.0
+        return {
+            "items": self.items,
+            "batches": self.batches,
+            "busy_seconds": round(self.busy_seconds, 3),
+            "elapsed_seconds": round(elapsed, 3),
+            "items_per_second": round(self.items / elapsed, 1) if elapsed > 0 else 0.0,
+        }
+
+
+@dataclass
+class PipelineStats:
+    name: str
+    status: str = "running"
+    queue_size: int = 0
+    queue_max_depth: int = 0
+    queue_capacity: int = 0
+    fetch: StageStats = field(default_factory=StageStats)
+    write: StageStats = field(default_factory=StageStats)
+    error: str | None = None
+    started_at: datetime = field(default_factory=datetime.utcnow)
+
+    def to_dict(self) -> dict:
+        return {
+            "name": self.name,
+            "status": self.status,
+            "queue": {
+                "depth": self.queue_size,
+                "max_depth": self.queue_max_depth,
+                "capacity": self.queue_capacity,
+            },
+            "stages": {"fetch": self.fetch.to_dict(), "write": self.write.to_dict()},
+            "error": self.error,
+            "started_at": self.started_at.isoformat(),
+        }
+
+
+# Latest run per pipeline name, exposed through /scraping/pipelines
+pipeline_registry: dict[str, PipelineStats] = {}
+
+
+class IngestPipeline:
+    """Overlap fetching and writing with bounded memory.
+
+    Producers push records into an ``asyncio.Queue`` of fixed capacity, so a
+    slow writer blocks the scrapers instead of growing a list. The writer task
+    hands ``write_batch`` a batch whenever ``batch_size`` records are queued or
+    ``flush_seconds`` have passed since the first record of the batch.
+    ``write_batch(session, batch)`` runs as a unit of work on the single
+    database writer, together with a data version bump (``events=False`` for
+    product-only pipelines); its return value is passed to ``on_written``
+    once the batch is committed.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        write_batch: Callable[[Session, list[dict]], Any],
+        on_written: Callable[[Any], None] | None = None,
+        batch_size: int | None = None,
+        flush_seconds: float | None = None,
+        queue_size: int | None = None,
+        events: bool = True,
+    ):
+        self.name = name
+        self.events = events
+        self.write_batch = write_batch
+        self.on_written = on_written
+        self.batch_size = batch_size or settings.INGEST_BATCH_SIZE
+        self.flush_seconds = flush_seconds or settings.INGEST_FLUSH_SECONDS
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=queue_size or settings.INGEST_QUEUE_SIZE)
+        self.stats = PipelineStats(name=name, queue_capacity=self.queue.maxsize)
+        self._error: BaseException | None = None
+
+    async def run(self, sources: list[AsyncIterator[dict]]) -> PipelineStats:
+        """Drain every source through the writer. Raises the writer's error, if any."""
+        pipeline_registry[self.name] = self.stats
+        self.stats.fetch.started_at = self.stats.write.started_at = time.time()
+
+        writer = asyncio.create_task(self._write_loop())
+        fetch_error = None
+        try:
+            await asyncio.gather(*(self._produce(source) for source in sources))
+        except Exception as e:
+            # Whatever was fetched before the failure still gets written
+            fetch_error = e
+        finally:
+            self.stats.fetch.finished_at = time.time()
+            await self.queue.put(_DONE)
+            await writer
+            self.stats.write.finished_at = time.time()
+            self.stats.queue_size = self.queue.qsize()
+            maintenance.record_writes(self.stats.write.items)
+
+        error = self._error or fetch_error
+        if error is not None:
+            self.stats.status = "failed"
+            self.stats.error = str(error)
+            raise error
+
+        self.stats.status = "completed"
+        logger.info(
+            f"Pipeline [{self.name}]: {self.stats.fetch.items} fetched, "
+            f"{self.stats.write.items} written in {self.stats.write.batches} batches"
+        )
+        return self.stats
+
+    async def _produce(self, source: AsyncIterator[dict]):
+        async for record in source:
+            await self.queue.put(record)
+            self.stats.fetch.items += 1
+            depth = self.queue.qsize()
+            self.stats.queue_size = depth
+            if depth > self.stats.queue_max_depth:
+                self.stats.queue_max_depth = depth
+
+    async def _write_loop(self):
+        loop = asyncio.get_running_loop()
+        batch: list[dict] = []
+        deadline = 0.0
+
+        while True:
+            timeout = max(deadline - loop.time(), 0) if batch else None
+            try:
+                record = await asyncio.wait_for(self.queue.get(), timeout)
+            except asyncio.TimeoutError:
+                await self._flush(batch)
+                batch = []
+                continue
+
+            self.stats.queue_size = self.queue.qsize()
+            if record is _DONE:
+                break
+            if self._error is not None:
+                # Keep draining so producers never block on a dead writer
+                continue
+
+            if not batch:
+                deadline = loop.time() + self.flush_seconds
+            batch.append(record)
+            if len(batch) >= self.batch_size:
+                await self._flush(batch)
+                batch = []
+
+        await self._flush(batch)
+
+    async def _flush(self, batch: list[dict]):
+        if not batch or self._error is not None:
+            return
+        start = time.perf_counter()
+        try:
+            result = await db_writer.run(lambda session: self._write_unit(session, batch))
+        except Exception as e:
+            logger.error(f"Pipeline [{self.name}] writer failed: {e}")
+            self._error = e
+            return
+        if self.on_written is not None:
+            self.on_written(result)
+        self.stats.write.busy_seconds += time.perf_counter() - start
+        self.stats.write.items += len(batch)
+        self.stats.write.batches += 1
+
+    def _write_unit(self, session: Session, batch: list[dict]) -> Any:
+        result = self.write_batch(session, batch)
+        bump_data_version(session, events=self.events)
+        return result
@@ -0,0 +1,224 @@
+"""Incrementally maintained marketplace summary rows.
+
+Each product contributes to four rows of ``marketplace_aggregates``: its
+artist, seller, category and platform. Counts and sums are maintained as
+deltas (``+new - old``) in the same transaction as the product write;
+prices are added in integer cents so the sums never drift. Extremes cannot
+be maintained that way, so the touched artist and platform rows get theirs
+recomputed through the per-artist and per-platform indexes.
+"""
+
+from collections import defaultdict
+from collections.abc import Iterable
+
+from sqlalchemy import Integer, cast, func, insert, select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Session
+
+from app.models.marketplace_aggregate import MarketplaceAggregate
+from app.models.marketplace_product import MarketplaceProduct
+
+# dimension -> product column it groups by
+DIMENSIONS = {
+    "artist": MarketplaceProduct.related_artist,
+    "seller": MarketplaceProduct.seller_name,
+    "category": MarketplaceProduct.category,
+    "platform": MarketplaceProduct.platform,
+}
+# Dimensions whose rows also carry price/sold extremes
+EXTREME_DIMENSIONS = ("artist", "platform")
+# Product fields a summary row is derived from
+SOURCE_FIELDS = ("related_artist", "seller_name", "category", "platform", "price", "sold_count")
+_FIELD_BY_DIMENSION = {
+    "artist": "related_artist",
+    "seller": "seller_name",
+    "category": "category",
+    "platform": "platform",
+}
+
+
+class MarketplaceAggregateService:
+    def __init__(self, db: Session):
+        self.db = db
+
+    def apply(self, added: Iterable[dict] = (), removed: Iterable[dict] = ()):
+        """Fold product rows in (``added``) or out (``removed``) of the summaries.
+
+        An updated product is its old row in ``removed`` and its new row in
+        ``added``. Rows need the SOURCE_FIELDS keys.
+        """
+        deltas: dict[tuple[str, str], list] = defaultdict(lambda: [0, 0, 0])
+        for sign, rows in ((1, added), (-1, removed)):
+            for row in rows:
+                for dimension, field in _FIELD_BY_DIMENSION.items():
+                    delta = deltas[(dimension, row.get(field) or "")]
+                    delta[0] += sign
+                    delta[1] += sign * to_cents(row.get("price"))
+                    delta[2] += sign * (row.get("sold_count") or 0)
+
+        changed = {key: delta for key, delta in deltas.items() if any(delta)}
+        if not changed:
+            return
+
+        statement = self._upsert_statement()
+        self.db.execute(statement, [
+            {"dimension": dimension, "key": key, "products": products,
+             "price_cents": price_cents, "price_sum": price_cents / 100, "sold_sum": sold_sum}
+            for (dimension, key), (products, price_cents, sold_sum) in changed.items()
+        ])
+        self.db.query(MarketplaceAggregate).filter(MarketplaceAggregate.products <= 0).delete()
+
+        self._refresh_extremes(
+            artists={key for dimension, key in changed if dimension == "artist" and key},
+            platforms={key for dimension, key in changed if dimension == "platform" and key},
+        )
+
+    def rebuild(self, keys: Iterable[tuple[str, str]] | None = None):
+        """Recompute summary rows from the products table.
+
+        Every row by default, or only the (dimension, key) rows in ``keys``.
+        """
+        keys = None if keys is None else set(keys)
+        for dimension, column in DIMENSIONS.items():
+            query = select(
+                column,
+                func.count(MarketplaceProduct.id),
+                func.coalesce(func.sum(cast(func.round(MarketplaceProduct.price * 100), Integer)), 0),
+                func.coalesce(func.sum(MarketplaceProduct.sold_count), 0),
+                func.max(MarketplaceProduct.sold_count),
+                func.min(MarketplaceProduct.price),
+                func.max(MarketplaceProduct.price),
+            ).group_by(column)
+            stale = self.db.query(MarketplaceAggregate).filter(MarketplaceAggregate.dimension == dimension)
+            if keys is not None:
+                values = {key for key_dimension, key in keys if key_dimension == dimension}
+                if not values:
+                    continue
+                condition = column.in_(values)
+                if "" in values:
+                    condition = condition | column.is_(None)
+                query = query.where(condition)
+                stale = stale.filter(MarketplaceAggregate.key.in_(values))
+            stale.delete(synchronize_session=False)
+
+            merged: dict[str, list] = {}
+            for key, products, price_cents, sold_sum, sold_max, price_min, price_max in self.db.execute(query):
+                # NULL and "" both map to the "" key
+                entry = merged.setdefault(key or "", [0, 0, 0, None, None, None])
+                entry[0] += products
+                entry[1] += price_cents
+                entry[2] += sold_sum
+                entry[3] = _pick(max, entry[3], sold_max)
+                entry[4] = _pick(min, entry[4], price_min)
+                entry[5] = _pick(max, entry[5], price_max)
+            for key, entry in merged.items():
+                # Same rows as apply() maintains extremes for
+                if dimension not in EXTREME_DIMENSIONS or not key:
+                    entry[3:] = [None, None, None]
+            if merged:
+                self.db.execute(insert(MarketplaceAggregate), [
+                    {"dimension": dimension, "key": key, "products": v[0], "price_cents": v[1],
+                     "price_sum": v[1] / 100, "sold_sum": v[2], "sold_max": v[3], "price_min": v[4],
+                     "price_max": v[5]}
+                    for key, v in merged.items()
+                ])
+
+    def is_empty(self) -> bool:
+        return self.db.query(MarketplaceAggregate.key).first() is None
+
+    def needs_rebuild(self) -> bool:
+        """Whether any row predates exact cent sums."""
+        stale = self.db.query(MarketplaceAggregate.key).filter(MarketplaceAggregate.price_cents.is_(None))
+        return stale.first() is not None
+
+    def rows(self, dimension: str, order_by_sold: bool = False, limit: int | None = None) -> list:
+        query = self.db.query(MarketplaceAggregate).filter(MarketplaceAggregate.dimension == dimension)
+        if order_by_sold:
+            query = query.order_by(MarketplaceAggregate.sold_sum.desc(), MarketplaceAggregate.key)
+        if limit is not None:
+            query = query.limit(limit)
+        return query.all()
+
+    def totals(self) -> dict:
+        """Catalog-wide totals, summed over the platform rows (every product has one)."""
+        rows = self.rows("platform")
+        prices_min = [row.price_min for row in rows if row.price_min is not None]
+        prices_max = [row.price_max for row in rows if row.price_max is not None]
+        return {
+            "products": sum(row.products for row in rows),
+            "price_sum": sum(row.price_sum for row in rows),
+            "sold_sum": sum(row.sold_sum for row in rows),
+            "price_min": min(prices_min, default=None),
+            "price_max": max(prices_max, default=None),
+        }
+
+    def _refresh_extremes(self, artists: set[str], platforms: set[str]):
+        if artists:
+            extremes = self.db.execute(
+                select(
+                    MarketplaceProduct.related_artist,
+                    func.max(MarketplaceProduct.sold_count),
+                    func.min(MarketplaceProduct.price),
+                    func.max(MarketplaceProduct.price),
+                )
+                .where(MarketplaceProduct.related_artist.in_(artists))
+                .group_by(MarketplaceProduct.related_artist)
+            ).all()
+            self._set_extremes("artist", extremes)
+
+        # One scalar query per extreme, so each is a single seek on a (platform, x) index
+        extremes = []
+        for platform in platforms:
+            by_platform = MarketplaceProduct.platform == platform
+            extremes.append((
+                platform,
+                self.db.query(func.max(MarketplaceProduct.sold_count)).filter(by_platform).scalar(),
+                self.db.query(func.min(MarketplaceProduct.price)).filter(by_platform).scalar(),
+                self.db.query(func.max(MarketplaceProduct.price)).filter(by_platform).scalar(),
+            ))
+        self._set_extremes("platform", extremes)
+
+    def _set_extremes(self, dimension: str, extremes: list):
+        for key, sold_max, price_min, price_max in extremes:
+            self.db.execute(
+                update(MarketplaceAggregate)
+                .where(MarketplaceAggregate.dimension == dimension, MarketplaceAggregate.key == key)
+                .values(sold_max=sold_max, price_min=price_min, price_max=price_max)
+            )
+
+    def _upsert_statement(self):
+        """INSERT that adds the deltas onto an existing summary row."""
+        dialect = self.db.get_bind().dialect.name
+        module_insert = pg_insert if dialect == "postgresql" else sqlite_insert
+        statement = module_insert(MarketplaceAggregate)
+        table = MarketplaceAggregate.__table__
+        return statement.on_conflict_do_update(
+            index_elements=[table.c.dimension, table.c.key],
+            set_={
+                "products": table.c.products + statement.excluded.products,
+                "price_cents": table.c.price_cents + statement.excluded.price_cents,
+                "price_sum": (table.c.price_cents + statement.excluded.price_cents) / 100.0,
+                "sold_sum": table.c.sold_sum + statement.excluded.sold_sum,
+                "updated_at": func.now(),
+            },
+        )
+
+
+def summary_keys(rows: Iterable[dict]) -> set[tuple[str, str]]:
+    """The (dimension, key) summary rows that product ``rows`` count towards."""
+    return {
+        (dimension, row.get(field) or "")
+        for row in rows
+        for dimension, field in _FIELD_BY_DIMENSION.items()
+    }
+
+
+def to_cents(price: float | None) -> int:
+    return round((price or 0) * 100)
+
+
+def _pick(choose, current, value):
+    if value is None:
+        return current
+    return value if current is None else choose(current, value)
@@ -1,15 +1,19 @@
 """Service to scrape marketplace products for artists related to upcoming events."""
 
+import asyncio
 import time
 from datetime import datetime
 
 from sqlalchemy.orm import Session
 
+from app.db_writer import db_writer
 from app.models.artist import Artist
 from app.models.event import Event
-from app.models.marketplace_product import MarketplaceProduct
 from app.models.scraping_log import ScrapingLog
-from app.scrapers.shopee_scraper import ShopeeScraper
+from app.response_cache import schedule_warmup
+from app.scrapers import load_scraper
+from app.services.ingest_pipeline import IngestPipeline
+from app.services.product_upsert_service import ProductUpsertService
 from app.utils.logger import setup_logger
 
 logger = setup_logger("marketplace_scraping")
@@ -23,7 +27,7 @@ DEFAULT_SEARCH_TEMPLATES = [
 class MarketplaceScrapingService:
     def __init__(self, db: Session):
         self.db = db
-        self.scraper = ShopeeScraper()
+        self.scraper = load_scraper("app.scrapers.shopee_scraper:ShopeeScraper")()
 
     async def scrape_for_events(self, custom_terms: list[str] | None = None) -> dict:
         """Scrape Shopee for t-shirts related to upcoming events."""
@@ -32,19 +36,10 @@ class MarketplaceScrapingService:
         if custom_terms:
             search_terms = [(term, None) for term in custom_terms]
         else:
-            # Get distinct artists from upcoming events
-            artists = (
-                self.db.query(Artist)
-                .join(Event, Event.artist_id == Artist.id)
-                .filter(Event.is_active.is_(True))
-                .filter(Event.event_date >= datetime.utcnow())
-                .distinct()
-                .all()
-            )
-            for artist in artists:
+            for artist_name in await asyncio.to_thread(self._upcoming_artist_names):
                 for template in DEFAULT_SEARCH_TEMPLATES:
-                    term = template.format(artist=artist.name)
-                    search_terms.append((term, artist.name))
+                    term = template.format(artist=artist_name)
+                    search_terms.append((term, artist_name))
 
         total_found = 0
         total_new = 0
@@ -55,16 +50,21 @@ class MarketplaceScrapingService:
         )
         start_time = time.time()
 
-        try:
-            for term, artist_name in search_terms:
-                products = await self.scraper.scrape_term(term, artist_name)
-                for product_data in products:
-                    created = self._save_product(product_data)
-                    total_found += 1
-                    if created:
-                        total_new += 1
+        def count(result: tuple[int, int]):
+            nonlocal total_new
+            total_new += result[0]
+
+        pipeline = IngestPipeline(
+            "marketplace:shopee",
+            lambda session, batch: ProductUpsertService(session).upsert(batch),
+            on_written=count,
+            events=False,
+        )
+        sources = [self.scraper.stream_terms(search_terms)] if search_terms else []
 
-                self.db.commit()
+        try:
+            stats = await pipeline.run(sources)
+            total_found = stats.fetch.items
 
             log.status = "success"
             log.events_found = total_found
@@ -72,64 +72,32 @@ class MarketplaceScrapingService:
             log.events_updated = total_found - total_new
 
         except Exception as e:
-            log.status = "failed"
+            total_found = pipeline.stats.fetch.items
+            log.status = "partial" if pipeline.stats.write.batches else "failed"
             log.error_message = str(e)
             logger.error(f"Marketplace scraping failed: {e}")
-            self.db.rollback()
 
         finally:
             log.duration_seconds = round(time.time() - start_time, 2)
             log.completed_at = datetime.utcnow()
-            self.db.add(log)
-            self.db.commit()
+            await db_writer.run(lambda session: session.add(log))
+            if pipeline.stats.write.batches:
+                schedule_warmup()
 
         return {
             "status": "completed",
             "message": f"Found {total_found} products, {total_new} new",
+            "pipeline": pipeline.stats.to_dict(),
         }
 
-    def _save_product(self, data: dict) -> bool:
-        """Save or update a product. Returns True if new."""
-        url = data.get("product_url")
-        if not url:
-            return False
-
-        existing = (
-            self.db.query(MarketplaceProduct)
-            .filter(MarketplaceProduct.product_url == url)
-            .first()
-        )
-
-        if existing:
-            # Update metrics
-            if data.get("sold_count") and data["sold_count"] > 0:
-                existing.sold_count = data["sold_count"]
-            if data.get("price") and data["price"] > 0:
-                existing.price = data["price"]
-            if data.get("rating"):
-                existing.rating = data["rating"]
-            if data.get("image_url"):
-                existing.image_url = data["image_url"]
-            existing.last_scraped_at = datetime.utcnow()
-            return False
-
-        product = MarketplaceProduct(
-            title=data.get("title", ""),
-            product_url=url,
-            price=data.get("price", 0),
-            original_price=data.get("original_price"),
-            sold_count=data.get("sold_count", 0),
-            rating=data.get("rating"),
-            review_count=data.get("review_count", 0),
-            seller_name=data.get("seller_name"),
-            seller_location=data.get("seller_location"),
-            platform=data.get("platform", "shopee"),
-            category=data.get("category"),
-            related_artist=data.get("related_artist"),
-            related_event=data.get("related_event"),
-            search_term=data.get("search_term"),
-            image_url=data.get("image_url"),
+    def _upcoming_artist_names(self) -> list[str]:
+        """Distinct artists with upcoming events."""
+        rows = (
+            self.db.query(Artist.name)
+            .join(Event, Event.artist_id == Artist.id)
+            .filter(Event.is_active.is_(True))
+            .filter(Event.event_date >= datetime.utcnow())
+            .distinct()
+            .all()
         )
-        self.db.add(product)
-        self.db.flush()
-        return True
+        return [row[0] for row in rows]
@@ -1,12 +1,32 @@
+from bisect import bisect_right
 from datetime import datetime, timedelta
 
-from sqlalchemy import func
+import numpy as np
+from sqlalchemy import String, false, func, select, type_coerce
 from sqlalchemy.orm import Session
 
+from app import forecasting
+from app.cache import SingleFlight, VersionedLRUCache
+from app.config import settings
+from app.data_version import current_data_version
+from app.database import IS_SQLITE
+from app.forecasting import CostParameters, py_round
 from app.models.artist import Artist
 from app.models.event import Event
+from app.models.marketplace_aggregate import MarketplaceAggregate
 from app.models.marketplace_product import MarketplaceProduct
 from app.models.venue import Venue
+from app.search_index import build_match_query, product_matches
+from app.services.count_service import CountService
+from app.services.marketplace_aggregate_service import MarketplaceAggregateService
+from app.utils.pagination import Keyset, decode_cursor, encode_cursor
+
+TOP_LIMIT = 10
+FORECAST_BATCH_SIZE = 1000
+
+forecast_cache = VersionedLRUCache(settings.FORECAST_CACHE_SIZE)
+# Concurrent cache misses on the same projection/forecast share one computation
+forecast_flight = SingleFlight()
 
 
 class MarketplaceService:
@@ -25,9 +45,91 @@ class MarketplaceService:
         sort_by: str | None = None,
         page: int = 1,
         page_size: int = 30,
+        cursor: str | None = None,
+        include_total: bool | None = None,
+        count_mode: str = "exact",
     ) -> dict:
-        query = self.db.query(MarketplaceProduct)
+        """One page of products, by ``page`` offset or by a ``cursor`` from the previous page.
+
+        ``total`` is counted for offset pages and skipped (None) for cursor
+        pages unless ``include_total`` says otherwise; ``count_mode="estimated"``
+        may answer it from facet counts. Raises ValueError for a cursor that
+        does not match ``sort_by``.
+        """
+        query, matches = self.filter_products(
+            self.db.query(MarketplaceProduct),
+            platform=platform,
+            related_artist=related_artist,
+            category=category,
+            min_price=min_price,
+            max_price=max_price,
+            min_sold=min_sold,
+            search=search,
+        )
+
+        keyset = self._keyset(sort_by, matches)
+        query = query.add_columns(keyset.column)
+
+        if include_total is None:
+            include_total = cursor is None
+        total, estimated = None, False
+        if include_total:
+            filters = {
+                "platform": platform,
+                "related_artist": related_artist,
+                "category": category,
+                "min_price": min_price,
+                "max_price": max_price,
+                "min_sold": min_sold,
+                "search": search.strip().lower() if search else None,
+            }
+            total, estimated = CountService(self.db).count("products", filters, query, count_mode)
+
+        products, next_cursor = keyset.paginate(
+            query, cursor, page_size, offset=(page - 1) * page_size
+        )
 
+        return {
+            "products": products,
+            "total": total,
+            "total_estimated": estimated,
+            "page": page,
+            "page_size": page_size,
+            "next_cursor": next_cursor,
+        }
+
+    @staticmethod
+    def _keyset(sort_by: str | None, matches=None) -> Keyset:
+        product_id = MarketplaceProduct.id
+        # A full-text search without an explicit sort ranks by BM25
+        if matches is not None and sort_by in (None, "relevance"):
+            return Keyset("relevance", matches.c.rank, product_id)
+        if sort_by == "price_asc":
+            return Keyset(sort_by, MarketplaceProduct.price, product_id)
+        if sort_by == "price_desc":
+            return Keyset(sort_by, MarketplaceProduct.price, product_id, descending=True)
+        if sort_by == "rating":
+            return Keyset(
+                sort_by, MarketplaceProduct.rating, product_id, descending=True, nullable=True
+            )
+        return Keyset("sold_count", MarketplaceProduct.sold_count, product_id, descending=True)
+
+    def filter_products(
+        self,
+        query,
+        platform: str | None = None,
+        related_artist: str | None = None,
+        category: str | None = None,
+        min_price: float | None = None,
+        max_price: float | None = None,
+        min_sold: int | None = None,
+        search: str | None = None,
+    ) -> tuple:
+        """Apply the ``list_products`` filters to a query over MarketplaceProduct.
+
+        Returns the query and the full-text match subquery it joined (None
+        without a SQLite search), which carries the relevance rank.
+        """
         if platform:
             query = query.filter(MarketplaceProduct.platform == platform)
         if related_artist:
@@ -42,101 +144,51 @@ class MarketplaceService:
             query = query.filter(MarketplaceProduct.price <= max_price)
         if min_sold is not None:
             query = query.filter(MarketplaceProduct.sold_count >= min_sold)
-        if search:
+        matches = None
+        if search and IS_SQLITE:
+            match_query = build_match_query(search)
+            if match_query:
+                matches = product_matches(match_query)
+                query = query.join(matches, matches.c.id == MarketplaceProduct.id)
+            else:
+                # Text without any word (e.g. "--") matches nothing rather than everything
+                query = query.filter(false())
+        elif search:
             query = query.filter(MarketplaceProduct.title.ilike(f"%{search}%"))
 
-        total = query.count()
-
-        # Sorting
-        if sort_by == "price_asc":
-            query = query.order_by(MarketplaceProduct.price.asc())
-        elif sort_by == "price_desc":
-            query = query.order_by(MarketplaceProduct.price.desc())
-        elif sort_by == "sold_count":
-            query = query.order_by(MarketplaceProduct.sold_count.desc())
-        elif sort_by == "rating":
-            query = query.order_by(MarketplaceProduct.rating.desc().nullslast())
-        else:
-            query = query.order_by(MarketplaceProduct.sold_count.desc())
-
-        products = query.offset((page - 1) * page_size).limit(page_size).all()
-
-        return {
-            "products": products,
-            "total": total,
-            "page": page,
-            "page_size": page_size,
-        }
+        return query, matches
 
     def get_stats(self) -> dict:
-        base = self.db.query(MarketplaceProduct)
-        total = base.count()
+        aggregates = MarketplaceAggregateService(self.db)
+        totals = aggregates.totals()
+        total = totals["products"]
+        avg_price_val = totals["price_sum"] / total if total else 0
 
-        avg_price_val = (
-            self.db.query(func.avg(MarketplaceProduct.price)).scalar() or 0
-        )
-
-        # Top sellers by product count
-        top_sellers_rows = (
-            self.db.query(
-                MarketplaceProduct.seller_name,
-                func.count(MarketplaceProduct.id).label("count"),
-                func.avg(MarketplaceProduct.sold_count).label("avg_sold"),
-            )
-            .filter(MarketplaceProduct.seller_name.isnot(None))
-            .group_by(MarketplaceProduct.seller_name)
-            .order_by(func.sum(MarketplaceProduct.sold_count).desc())
-            .limit(10)
-            .all()
-        )
+        # Top sellers by units sold
         top_sellers = [
             {
-                "seller": row[0],
-                "products": row[1],
-                "avg_sold": round(row[2] or 0, 0),
+                "seller": row.key,
+                "products": row.products,
+                "avg_sold": round(row.sold_sum / row.products, 0),
             }
-            for row in top_sellers_rows
-        ]
+            for row in _named(aggregates.rows("seller", order_by_sold=True, limit=TOP_LIMIT + 1))
+        ][:TOP_LIMIT]
 
-        # Top artists by product count
-        top_artists_rows = (
-            self.db.query(
-                MarketplaceProduct.related_artist,
-                func.count(MarketplaceProduct.id).label("count"),
-                func.avg(MarketplaceProduct.price).label("avg_price"),
-                func.sum(MarketplaceProduct.sold_count).label("total_sold"),
-            )
-            .filter(MarketplaceProduct.related_artist.isnot(None))
-            .group_by(MarketplaceProduct.related_artist)
-            .order_by(func.sum(MarketplaceProduct.sold_count).desc())
-            .limit(10)
-            .all()
-        )
+        # Top artists by units sold
         top_artists = [
             {
-                "artist": row[0],
-                "products": row[1],
-                "avg_price": round(row[2] or 0, 2),
-                "total_sold": row[3] or 0,
+                "artist": row.key,
+                "products": row.products,
+                "avg_price": round(row.price_sum / row.products, 2),
+                "total_sold": row.sold_sum,
             }
-            for row in top_artists_rows
-        ]
-
-        # Price range
-        min_price = self.db.query(func.min(MarketplaceProduct.price)).scalar() or 0
-        max_price = self.db.query(func.max(MarketplaceProduct.price)).scalar() or 0
+            for row in _named(aggregates.rows("artist", order_by_sold=True, limit=TOP_LIMIT + 1))
+        ][:TOP_LIMIT]
 
         # Platform breakdown
-        platform_rows = (
-            self.db.query(
-                MarketplaceProduct.platform,
-                func.count(MarketplaceProduct.id).label("count"),
-            )
-            .group_by(MarketplaceProduct.platform)
-            .all()
-        )
         platform_breakdown = [
-            {"platform": row[0], "count": row[1]} for row in platform_rows
+            {"platform": row.key or None, "count": row.products}
+            for row in aggregates.rows("platform")
         ]
 
         return {
@@ -144,97 +196,56 @@ class MarketplaceService:
             "avg_price": round(avg_price_val, 2),
             "top_sellers": top_sellers,
             "top_artists": top_artists,
-            "price_range": {"min": min_price, "max": max_price},
+            "price_range": {"min": totals["price_min"] or 0, "max": totals["price_max"] or 0},
             "platform_breakdown": platform_breakdown,
         }
 
-    def get_sales_projection(self) -> dict:
-        """Calculate sales projections and revenue forecast per artist."""
+    def get_sales_projection(self, params: CostParameters | None = None) -> dict:
+        """Calculate sales projections and revenue forecast per artist.
 
-        # Production cost estimates (R$)
-        PRODUCTION_COST = 15.0  # cost per unit (blank + print)
-        MARKETPLACE_FEE_PCT = 0.12  # 12% Shopee fee
-        MONTHLY_GROWTH_FACTOR = 1.15  # 15% monthly growth for event-related products
-
-        # Get all products grouped by artist
-        artist_rows = (
-            self.db.query(
-                MarketplaceProduct.related_artist,
-                func.count(MarketplaceProduct.id).label("count"),
-                func.avg(MarketplaceProduct.price).label("avg_price"),
-                func.sum(MarketplaceProduct.sold_count).label("total_sold"),
-                func.max(MarketplaceProduct.sold_count).label("max_sold"),
-                func.min(MarketplaceProduct.price).label("min_price"),
-                func.max(MarketplaceProduct.price).label("max_price"),
-            )
-            .filter(MarketplaceProduct.related_artist.isnot(None))
-            .group_by(MarketplaceProduct.related_artist)
-            .order_by(func.sum(MarketplaceProduct.sold_count).desc())
-            .all()
-        )
+        Cached per cost parameter set until the data version changes;
+        concurrent identical requests share one computation.
+        """
+        params = params or CostParameters.from_settings()
+        version = current_data_version(self.db)
+        key = ("projection", params)
+        return _cached(key, version, lambda: self._sales_projection(params))
+
+    def _sales_projection(self, params: CostParameters) -> dict:
+        # Products grouped by artist, best selling first
+        aggregates = MarketplaceAggregateService(self.db)
+        artist_rows = _named(aggregates.rows("artist", order_by_sold=True))
+
+        # Category breakdown: (category, count, total_sold, avg_price)
+        category_rows = [
+            (row.key or None, row.products, row.sold_sum, row.price_sum / row.products)
+            for row in aggregates.rows("category", order_by_sold=True)
+        ]
 
-        # Category breakdown
-        category_rows = (
-            self.db.query(
-                MarketplaceProduct.category,
-                func.count(MarketplaceProduct.id).label("count"),
-                func.sum(MarketplaceProduct.sold_count).label("total_sold"),
-                func.avg(MarketplaceProduct.price).label("avg_price"),
-            )
-            .group_by(MarketplaceProduct.category)
-            .order_by(func.sum(MarketplaceProduct.sold_count).desc())
-            .all()
+        products_count = np.array([row.products for row in artist_rows], dtype=np.int64)
+        total_sold = np.array([row.sold_sum for row in artist_rows], dtype=np.int64)
+        projected = forecasting.project_artists(
+            products_count,
+            np.array([row.price_sum for row in artist_rows], dtype=np.float64),
+            total_sold,
+            params,
         )
-
-        grand_total_sold = sum(row[3] or 0 for row in artist_rows)
-        total_market_revenue = 0
-        projections = []
-
-        for row in artist_rows:
-            artist_name = row[0]
-            products_count = row[1]
-            avg_price = round(row[2] or 0, 2)
-            total_sold = row[3] or 0
-            max_sold = row[4] or 0
-
-            # Market share
-            market_share = (total_sold / grand_total_sold * 100) if grand_total_sold > 0 else 0
-
-            # Estimate monthly units (assume data represents ~3 months of sales)
-            est_monthly_units = int(total_sold / 3)
-
-            # Revenue calculation
-            est_monthly_revenue = est_monthly_units * avg_price
-
-            # Suggested price: competitive but profitable
-            suggested_price = round(max(avg_price * 0.9, PRODUCTION_COST * 2.5), 2)
-
-            # Profit margin
-            net_per_unit = suggested_price - PRODUCTION_COST - (suggested_price * MARKETPLACE_FEE_PCT)
-            profit_margin = (net_per_unit / suggested_price * 100) if suggested_price > 0 else 0
-
-            # Growth potential based on sold volume and product count
-            if total_sold > 10000 and products_count >= 3:
-                growth = "alto"
-            elif total_sold > 5000 or products_count >= 3:
-                growth = "medio"
-            else:
-                growth = "baixo"
-
-            total_market_revenue += est_monthly_revenue
-
-            projections.append({
-                "artist": artist_name,
-                "total_sold": total_sold,
-                "avg_price": avg_price,
-                "products_count": products_count,
-                "estimated_monthly_revenue": round(est_monthly_revenue, 2),
-                "estimated_units_per_month": est_monthly_units,
-                "market_share_pct": round(market_share, 1),
-                "growth_potential": growth,
-                "suggested_price": suggested_price,
-                "profit_margin_pct": round(profit_margin, 1),
-            })
+        # Running sum in artist order, as the per-row loop added it up
+        total_market_revenue = sum(projected["estimated_monthly_revenue"].tolist())
+
+        columns = {
+            "artist": [row.key for row in artist_rows],
+            "total_sold": total_sold.tolist(),
+            "avg_price": projected["avg_price"].tolist(),
+            "products_count": products_count.tolist(),
+            "estimated_monthly_revenue": py_round(projected["estimated_monthly_revenue"], 2).tolist(),
+            "estimated_units_per_month": projected["estimated_units_per_month"].tolist(),
+            "market_share_pct": py_round(projected["market_share_pct"], 1).tolist(),
+            "growth_potential": projected["growth_potential"].tolist(),
+            "suggested_price": projected["suggested_price"].tolist(),
+            "profit_margin_pct": py_round(projected["profit_margin_pct"], 1).tolist(),
+        }
+        projections = [dict(zip(columns, values)) for values in zip(*columns.values())]
 
         # Category breakdown result
         category_breakdown = [
@@ -243,27 +254,28 @@ class MarketplaceService:
                 "products": row[1],
                 "total_sold": row[2] or 0,
                 "avg_price": round(row[3] or 0, 2),
-                "revenue_estimate": round((row[2] or 0) / 3 * (row[3] or 0), 2),
+                "revenue_estimate": round((row[2] or 0) / forecasting.MONTHS_OF_SALES * (row[3] or 0), 2),
             }
             for row in category_rows
         ]
 
         # Opportunity score
-        total_products = self.db.query(MarketplaceProduct).count()
-        avg_price_all = self.db.query(func.avg(MarketplaceProduct.price)).scalar() or 0
-        total_sold_all = self.db.query(func.sum(MarketplaceProduct.sold_count)).scalar() or 0
+        totals = aggregates.totals()
+        total_products = totals["products"]
+        avg_price_all = totals["price_sum"] / total_products if total_products else 0
+        total_sold_all = totals["sold_sum"]
 
         opportunity_score = {
             "market_size": "grande" if total_sold_all > 50000 else "medio" if total_sold_all > 20000 else "pequeno",
             "competition_level": "alta" if total_products > 50 else "media" if total_products > 20 else "baixa",
             "avg_profit_margin": round(
-                ((avg_price_all - PRODUCTION_COST - avg_price_all * MARKETPLACE_FEE_PCT) / avg_price_all * 100)
+                ((avg_price_all - params.production_cost - avg_price_all * params.marketplace_fee_pct) / avg_price_all * 100)
                 if avg_price_all > 0 else 0, 1
             ),
-            "recommended_investment": round(PRODUCTION_COST * 50 * len(projections), 2),  # 50 units per artist
+            "recommended_investment": round(params.production_cost * 50 * len(projections), 2),  # 50 units per artist
             "projected_roi_pct": round(
-                ((avg_price_all - PRODUCTION_COST - avg_price_all * MARKETPLACE_FEE_PCT) / PRODUCTION_COST * 100)
-                if PRODUCTION_COST > 0 else 0, 1
+                ((avg_price_all - params.production_cost - avg_price_all * params.marketplace_fee_pct) / params.production_cost * 100)
+                if params.production_cost > 0 else 0, 1
             ),
         }
 
@@ -276,160 +288,120 @@ class MarketplaceService:
             "opportunity_score": opportunity_score,
         }
 
-    def get_event_forecast(self, days_ahead: int = 90) -> dict:
+    def get_event_forecast(
+        self,
+        days_ahead: int = 90,
+        limit: int | None = None,
+        cursor: str | None = None,
+        params: CostParameters | None = None,
+    ) -> dict:
         """
         Cross-reference events with marketplace products to create:
         - Products linked to each event/show
         - Volume projection for the next X days
         - Conversion rate (camisetas per show attendee)
         - Revenue forecast per event
-        """
-        PRODUCTION_COST = 15.0
-        MARKETPLACE_FEE_PCT = 0.12
-        # Estimated conversion: % of show audience that buys a t-shirt online
-        BASE_CONVERSION_RATE = 0.02  # 2% of audience buys online
 
+        Totals and the weekly timeline always cover the whole horizon;
+        ``limit`` and ``cursor`` page through the ``events`` list (date
+        order). Results are cached per cost parameter set and page for the
+        current minute and data version, and concurrent identical requests
+        share one computation. Raises ValueError for a malformed
+        cursor.
+        """
+        params = params or CostParameters.from_settings()
+        after = decode_cursor(cursor, "event_date") if cursor else None
         now = datetime.utcnow()
-        cutoff = now + timedelta(days=days_ahead)
 
-        # Get upcoming events with artist info
-        events = (
-            self.db.query(Event)
-            .join(Artist, Event.artist_id == Artist.id)
-            .outerjoin(Venue, Event.venue_id == Venue.id)
-            .filter(Event.event_date >= now, Event.event_date <= cutoff)
-            .filter(Event.is_active == True)
-            .order_by(Event.event_date.asc())
-            .all()
-        )
-
-        # Get all marketplace products indexed by artist name (lowered)
-        all_products = self.db.query(MarketplaceProduct).all()
-        products_by_artist: dict[str, list] = {}
-        for p in all_products:
-            if p.related_artist:
-                key = p.related_artist.lower().strip()
-                products_by_artist.setdefault(key, []).append(p)
-
-        event_forecasts = []
-        total_projected_units = 0
-        total_projected_revenue = 0
-        total_projected_profit = 0
-
-        for event in events:
-            artist_name = event.artist.name if event.artist else ""
-            artist_key = artist_name.lower().strip()
-            venue_name = event.venue.name if event.venue else ""
-            city = event.venue.city if event.venue else ""
-            audience = event.estimated_audience or 0
-
-            # Find matching products
-            matching = products_by_artist.get(artist_key, [])
-
-            # Also check headliners for festivals
-            if event.is_festival and event.headliners:
-                headliner_list = event.headliners if isinstance(event.headliners, list) else []
-                for h in headliner_list:
-                    h_key = h.lower().strip()
-                    if h_key != artist_key:
-                        matching.extend(products_by_artist.get(h_key, []))
-
-            # Deduplicate products
-            seen_ids = set()
-            unique_products = []
-            for p in matching:
-                if p.id not in seen_ids:
-                    seen_ids.add(p.id)
-                    unique_products.append(p)
-
-            # Calculate marketplace averages for this event's products
-            if unique_products:
-                avg_price = sum(p.price for p in unique_products) / len(unique_products)
-                avg_sold = sum(p.sold_count for p in unique_products) / len(unique_products)
-                total_sold = sum(p.sold_count for p in unique_products)
-                best_seller = max(unique_products, key=lambda p: p.sold_count)
-            else:
-                avg_price = 0
-                avg_sold = 0
-                total_sold = 0
-                best_seller = None
+        version = current_data_version(self.db)
+        key = ("event_forecast", days_ahead, limit, cursor, params, now.replace(second=0, microsecond=0))
+        return _cached(key, version, lambda: self._event_forecast(days_ahead, limit, after, params, now))
 
-            # Conversion multipliers
-            status_mult = {"sold_out": 1.8, "selling_fast": 1.4, "available": 1.0}.get(event.ticket_status or "", 1.0)
-            festival_mult = 1.3 if event.is_festival else 1.0
-            hype_mult = 1.0 + (event.hype_score / 200)  # 0-100 hype adds 0-50% boost
-
-            conversion_rate = BASE_CONVERSION_RATE * status_mult * festival_mult * hype_mult
-
-            # Projected units for this event
-            projected_units = int(audience * conversion_rate)
-
-            # Use suggested price (10% below avg competitor or min 2.5x cost)
-            suggested_price = round(max(avg_price * 0.9, PRODUCTION_COST * 2.5), 2) if avg_price > 0 else 37.50
+    def _event_forecast(
+        self, days_ahead: int, limit: int | None, after: tuple | None, params: CostParameters, now: datetime
+    ) -> dict:
+        events, matches = self.forecast_inputs(days_ahead, now)
 
-            # Revenue & profit
-            projected_revenue = projected_units * suggested_price
-            net_per_unit = suggested_price - PRODUCTION_COST - (suggested_price * MARKETPLACE_FEE_PCT)
-            projected_profit = projected_units * net_per_unit
+        columns = event_columns(events, matches)
+        audience = columns["audience"]
+        projected = forecasting.project_events(**columns, params=params)
 
-            # Days until event
-            days_until = (event.event_date - now).days
+        units = projected["projected_units"]
+        revenue = py_round(projected["projected_revenue"], 2)
+        profit = py_round(projected["projected_profit"], 2)
 
-            total_projected_units += projected_units
-            total_projected_revenue += projected_revenue
-            total_projected_profit += projected_profit
+        # Weeks add up the per-event figures as reported (rounded); the
+        # Monday bucket of each event comes from the query
+        weekly_list = forecasting.weekly_rollup(
+            [row[7] for row in events], {"units": units, "revenue": revenue, "profit": profit}
+        )
+        for w in weekly_list:
+            w["revenue"] = round(w["revenue"], 2)
+            w["profit"] = round(w["profit"], 2)
 
+        # Running sums in event order, as the per-row loop added them up
+        total_audience = int(audience.sum())
+        total_projected_units = int(units.sum())
+        total_projected_revenue = sum(projected["projected_revenue"].tolist())
+        total_projected_profit = sum(projected["projected_profit"].tolist())
+
+        # Only the requested page is turned into dicts
+        start = 0
+        if after is not None:
+            start = bisect_right([(row[1], row[0]) for row in events], after)
+        end = len(events) if limit is None else min(start + limit, len(events))
+        next_cursor = None
+        if start < end < len(events):
+            next_cursor = encode_cursor("event_date", events[end - 1][1], events[end - 1][0])
+
+        page = slice(start, end)
+        details = self._forecast_details(events[page])
+        page_columns = {
+            "conversion_rate_pct": py_round(projected["conversion_rate"][page] * 100, 2).tolist(),
+            "hype_score": py_round([row[4] for row in events[page]], 1).tolist(),
+            "sales_potential": py_round([details[row[0]][1] for row in events[page]], 1).tolist(),
+            "projected_units": units[page].tolist(),
+            "suggested_price": projected["suggested_price"][page].tolist(),
+            "projected_revenue": revenue[page].tolist(),
+            "projected_profit": profit[page].tolist(),
+        }
+        event_forecasts = []
+        for i, (row, match) in enumerate(zip(events[page], matches[page])):
+            event_id, event_date, audience_i, ticket_status, _, is_festival, artist_name, _ = row
+            title, _, venue_name, city = details[event_id]
+            matching_products, avg_price, total_sold, best_seller = match
             event_forecasts.append({
-                "event_id": event.id,
-                "event_title": event.title,
+                "event_id": event_id,
+                "event_title": title,
                 "artist": artist_name,
-                "venue": venue_name,
-                "city": city,
-                "event_date": event.event_date.strftime("%Y-%m-%d"),
-                "days_until": max(days_until, 0),
-                "audience": audience,
-                "ticket_status": event.ticket_status,
-                "hype_score": round(event.hype_score, 1),
-                "sales_potential": round(event.sales_potential_score, 1),
-                "is_festival": event.is_festival,
-                "matching_products": len(unique_products),
+                "venue": venue_name or "",
+                "city": city or "",
+                "event_date": event_date.strftime("%Y-%m-%d"),
+                "days_until": max((event_date - now).days, 0),
+                "audience": audience_i,
+                "ticket_status": ticket_status,
+                "hype_score": page_columns["hype_score"][i],
+                "sales_potential": page_columns["sales_potential"][i],
+                "is_festival": is_festival,
+                "matching_products": matching_products,
                 "marketplace_avg_price": round(avg_price, 2),
                 "marketplace_total_sold": total_sold,
-                "best_seller_title": best_seller.title if best_seller else None,
-                "best_seller_sold": best_seller.sold_count if best_seller else 0,
-                "best_seller_url": best_seller.product_url if best_seller else None,
-                "conversion_rate_pct": round(conversion_rate * 100, 2),
-                "projected_units": projected_units,
-                "suggested_price": suggested_price,
-                "projected_revenue": round(projected_revenue, 2),
-                "projected_profit": round(projected_profit, 2),
+                "best_seller_title": best_seller["title"] if best_seller else None,
+                "best_seller_sold": best_seller["sold_count"] if best_seller else 0,
+                "best_seller_url": best_seller["product_url"] if best_seller else None,
+                "conversion_rate_pct": page_columns["conversion_rate_pct"][i],
+                "projected_units": page_columns["projected_units"][i],
+                "suggested_price": page_columns["suggested_price"][i],
+                "projected_revenue": page_columns["projected_revenue"][i],
+                "projected_profit": page_columns["projected_profit"][i],
             })
 
         # Overall conversion stats
-        total_audience = sum(ef["audience"] for ef in event_forecasts)
         avg_conversion = (total_projected_units / total_audience * 100) if total_audience > 0 else 0
 
-        # Timeline: group by week
-        weekly_forecast = {}
-        for ef in event_forecasts:
-            event_dt = datetime.strptime(ef["event_date"], "%Y-%m-%d")
-            week_start = event_dt - timedelta(days=event_dt.weekday())
-            week_key = week_start.strftime("%Y-%m-%d")
-            if week_key not in weekly_forecast:
-                weekly_forecast[week_key] = {"week": week_key, "events": 0, "units": 0, "revenue": 0, "profit": 0}
-            weekly_forecast[week_key]["events"] += 1
-            weekly_forecast[week_key]["units"] += ef["projected_units"]
-            weekly_forecast[week_key]["revenue"] += ef["projected_revenue"]
-            weekly_forecast[week_key]["profit"] += ef["projected_profit"]
-
-        weekly_list = sorted(weekly_forecast.values(), key=lambda w: w["week"])
-        for w in weekly_list:
-            w["revenue"] = round(w["revenue"], 2)
-            w["profit"] = round(w["profit"], 2)
-
         return {
             "period_days": days_ahead,
-            "total_events": len(event_forecasts),
+            "total_events": len(events),
             "total_audience": total_audience,
             "total_projected_units": total_projected_units,
             "total_projected_revenue": round(total_projected_revenue, 2),
@@ -438,4 +410,206 @@ class MarketplaceService:
             "avg_ticket": round(total_projected_revenue / total_projected_units, 2) if total_projected_units > 0 else 0,
             "events": event_forecasts,
             "weekly_forecast": weekly_list,
+            "next_cursor": next_cursor,
         }
+
+    def forecast_inputs(self, days_ahead: int, now: datetime | None = None) -> tuple[list[tuple], list[tuple]]:
+        """Active events in the next ``days_ahead`` days, in date order, with their products.
+
+        Returns parallel lists: event rows (id, event_date, audience,
+        ticket_status, hype_score, is_festival, artist, week) and the
+        matching product summary of each (matching products, avg price,
+        total sold, best seller).
+        """
+        now = now or datetime.utcnow()
+        cutoff = now + timedelta(days=days_ahead)
+        products_by_artist = self._artist_product_summaries()
+
+        in_horizon = (
+            Event.event_date >= now,
+            Event.event_date <= cutoff,
+            Event.is_active.is_(True),
+        )
+        # Festival headliners, the only JSON column the math needs
+        headliners_by_event = dict(
+            self.db.query(Event.id, Event.headliners).filter(*in_horizon, Event.is_festival.is_(True)).all()
+        )
+
+        # The numeric inputs of every upcoming event, streamed in date order;
+        # display columns are only loaded for the requested page
+        rows = self.db.connection().execute(
+            select(
+                Event.id,
+                _raw_datetime(Event.event_date),
+                Event.estimated_audience,
+                Event.ticket_status,
+                Event.hype_score,
+                Event.is_festival,
+                Artist.name,
+                _week_start(Event.event_date),
+            )
+            .join(Artist, Event.artist_id == Artist.id)
+            .where(*in_horizon)
+            .order_by(Event.event_date.asc(), Event.id.asc())
+            .execution_options(yield_per=FORECAST_BATCH_SIZE)
+        )
+
+        # Columnar inputs; the matching products depend only on the artist keys
+        events = []
+        matches = []
+        merged_by_keys: dict[tuple, tuple] = {}
+        for event_id, event_date, audience, ticket_status, hype_score, is_festival, artist_name, week in rows:
+            artist_key = (artist_name or "").lower().strip()
+
+            # Products of the artist, plus the headliners' for festivals
+            keys = [artist_key]
+            headliners = headliners_by_event.get(event_id)
+            if headliners:
+                headliner_list = headliners if isinstance(headliners, list) else []
+                for h in headliner_list:
+                    h_key = h.lower().strip()
+                    if h_key != artist_key and h_key not in keys:
+                        keys.append(h_key)
+            keys = tuple(keys)
+
+            merged = merged_by_keys.get(keys)
+            if merged is None:
+                merged = merged_by_keys[keys] = _merge_summaries(
+                    [products_by_artist[key] for key in keys if key in products_by_artist]
+                )
+            events.append((
+                event_id, _as_datetime(event_date), audience or 0, ticket_status, hype_score,
+                is_festival, artist_name or "", str(week),
+            ))
+            matches.append(merged)
+        return events, matches
+
+    def _forecast_details(self, page_events: list[tuple]) -> dict[int, tuple]:
+        """(title, sales potential, venue name, city) per event of one page.
+
+        One range read over the page's dates through the active-date index;
+        ``page_events`` are (id, event_date, ...) rows in date order.
+        """
+        if not page_events:
+            return {}
+        rows = (
+            self.db.query(Event.id, Event.title, Event.sales_potential_score, Venue.name, Venue.city)
+            .outerjoin(Venue, Event.venue_id == Venue.id)
+            .filter(
+                Event.is_active.is_(True),
+                Event.event_date >= page_events[0][1],
+                Event.event_date <= page_events[-1][1],
+            )
+        )
+        return {event_id: tuple(values) for event_id, *values in rows}
+
+    def _artist_product_summaries(self) -> dict[str, dict]:
+        """Product totals and best seller per artist name (lowercased, stripped).
+
+        Read from the artist summary rows, joined to each artist's best
+        seller through the (related_artist, sold_count) index; names that
+        fold to the same key are merged.
+        """
+        rows = (
+            self.db.query(
+                MarketplaceAggregate.key,
+                MarketplaceAggregate.products,
+                MarketplaceAggregate.price_sum,
+                MarketplaceAggregate.sold_sum,
+                MarketplaceProduct.id,
+                MarketplaceProduct.title,
+                MarketplaceProduct.sold_count,
+                MarketplaceProduct.product_url,
+            )
+            .outerjoin(
+                MarketplaceProduct,
+                (MarketplaceProduct.related_artist == MarketplaceAggregate.key)
+                & (MarketplaceProduct.sold_count == MarketplaceAggregate.sold_max),
+            )
+            .filter(MarketplaceAggregate.dimension == "artist", MarketplaceAggregate.key != "")
+            .all()
+        )
+
+        summaries: dict[str, dict] = {}
+        counted = set()
+        for key, products, price_sum, sold_sum, product_id, title, sold_count, url in rows:
+            summary = summaries.setdefault(
+                key.lower().strip(),
+                {"products": 0, "price_sum": 0.0, "sold_sum": 0, "best_sold": -1, "best_id": None, "best": None},
+            )
+            # Ties on the max produce one row per tied product
+            if key not in counted:
+                counted.add(key)
+                summary["products"] += products
+                summary["price_sum"] += price_sum
+                summary["sold_sum"] += sold_sum
+            if product_id is None:
+                continue
+            # Highest sold_count, lowest id among ties (the products table order)
+            if sold_count > summary["best_sold"] or (
+                sold_count == summary["best_sold"] and product_id < summary["best_id"]
+            ):
+                summary["best_sold"] = sold_count
+                summary["best_id"] = product_id
+                summary["best"] = {"title": title, "sold_count": sold_count, "product_url": url}
+        return summaries
+
+
+def _named(rows: list) -> list:
+    """Summary rows with a value: the "" row collects products without one."""
+    return [row for row in rows if row.key]
+
+
+def _cached(key: tuple, version: int, compute) -> dict:
+    """``forecast_cache`` lookup; concurrent misses of one key wait for a single ``compute``."""
+    result = forecast_cache.get(key, version)
+    if result is None:
+
+        def load() -> dict:
+            computed = compute()
+            forecast_cache.set(key, version, computed)
+            return computed
+
+        result = forecast_flight.do((key, version), load)
+    return result
+
+
+def event_columns(events: list[tuple], matches: list[tuple]) -> dict:
+    """``forecast_inputs`` rows as the columnar inputs of ``forecasting.project_events``."""
+    return {
+        "audience": np.array([row[2] for row in events], dtype=np.int64),
+        "hype_score": np.array([row[4] for row in events], dtype=np.float64),
+        "ticket_status": [row[3] for row in events],
+        "is_festival": np.array([bool(row[5]) for row in events], dtype=bool),
+        "avg_price": np.array([match[1] for match in matches], dtype=np.float64),
+    }
+
+
+def _merge_summaries(summaries: list[dict]) -> tuple:
+    """(matching products, avg price, total sold, best seller) over artist summaries."""
+    matching_products = sum(summary["products"] for summary in summaries)
+    if not matching_products:
+        return 0, 0, 0, None
+    avg_price = sum(summary["price_sum"] for summary in summaries) / matching_products
+    total_sold = sum(summary["sold_sum"] for summary in summaries)
+    # First maximum wins, as the artist's own products come first
+    best_seller = max(summaries, key=lambda summary: summary["best_sold"])["best"]
+    return matching_products, avg_price, total_sold, best_seller
+
+
+def _raw_datetime(column):
+    """SQLite DATETIME as its stored text, parsed by ``_as_datetime`` instead
+    of SQLAlchemy's per-row regex."""
+    return type_coerce(column, String) if IS_SQLITE else column
+
+
+def _as_datetime(value) -> datetime:
+    return value if isinstance(value, datetime) else datetime.fromisoformat(value)
+
+
+def _week_start(column):
+    """The Monday starting the week of ``column``, as a date."""
+    if IS_SQLITE:
+        # 'weekday 0' moves forward to Sunday (or stays), then back to Monday
+        return func.date(column, "weekday 0", "-6 days")
+    return func.date(func.date_trunc("week", column))
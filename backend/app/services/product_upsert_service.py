@@ -0,0 +1,182 @@
+"""Batched insert/update of marketplace products keyed on (platform, external_id)."""
+
+from datetime import datetime
+
+from sqlalchemy import and_, insert, or_, select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Session
+
+from app.models.marketplace_product import MarketplaceProduct
+from app.services.marketplace_aggregate_service import (
+    SOURCE_FIELDS,
+    MarketplaceAggregateService,
+    summary_keys,
+)
+
+UPSERT_BATCH_SIZE = 500
+
+# Columns copied from the scraped record when a product is first seen
+INSERT_FIELDS = (
+    "title",
+    "product_url",
+    "external_id",
+    "price",
+    "original_price",
+    "sold_count",
+    "rating",
+    "review_count",
+    "seller_name",
+    "seller_location",
+    "platform",
+    "category",
+    "related_artist",
+    "related_event",
+    "search_term",
+    "image_url",
+)
+
+# Metrics refreshed on every sighting - only overwritten when the scraper saw a value
+UPDATE_FIELDS = ("price", "original_price", "sold_count", "rating", "review_count", "image_url")
+POSITIVE_FIELDS = ("price", "sold_count")
+
+
+class ProductUpsertService:
+    """Write scraped products in batches: one prefetch SELECT, one executemany per batch.
+
+    The marketplace summary rows are updated in the same transaction from the
+    inserted rows and the before/after values of the updated ones.
+    """
+
+    def __init__(self, db: Session, batch_size: int = UPSERT_BATCH_SIZE):
+        self.db = db
+        self.batch_size = batch_size
+
+    def upsert(self, records: list[dict]) -> tuple[int, int]:
+        """Insert new products and refresh known ones. Returns (new, updated)."""
+        total_new = 0
+        total_updated = 0
+        for start in range(0, len(records), self.batch_size):
+            new, updated = self._upsert_batch(records[start:start + self.batch_size])
+            total_new += new
+            total_updated += updated
+        return total_new, total_updated
+
+    def _upsert_batch(self, records: list[dict]) -> tuple[int, int]:
+        batch = self._dedupe(records)
+        if not batch:
+            return 0, 0
+
+        by_key, by_url = self._prefetch(batch)
+        now = datetime.utcnow()
+        inserts = []
+        # Keyed by id: records with different keys can fall back to the same URL match
+        updates: dict[int, dict] = {}
+        replaced: dict[int, dict] = {}
+
+        for data in batch:
+            platform = data.get("platform") or "shopee"
+            external_id = data.get("external_id")
+            existing = by_key.get((platform, external_id)) if external_id else None
+            if existing is None:
+                existing = by_url.get(data["product_url"])
+
+            if existing is None:
+                row = {field: data.get(field) for field in INSERT_FIELDS}
+                row["platform"] = platform
+                row["price"] = data.get("price") or 0
+                row["sold_count"] = data.get("sold_count") or 0
+                row["review_count"] = data.get("review_count") or 0
+                inserts.append(row)
+                continue
+
+            row = {"id": existing["id"], "last_scraped_at": now}
+            for field in UPDATE_FIELDS:
+                value = data.get(field)
+                if value is None or (field in POSITIVE_FIELDS and value <= 0):
+                    value = existing[field]
+                row[field] = value
+            # URL-matched legacy rows pick up the external id so later runs hit the composite key
+            row["external_id"] = existing["external_id"] or external_id
+            updates[existing["id"]] = row
+            replaced[existing["id"]] = existing
+
+        inserted = len(inserts)
+        if inserts:
+            # Core execute: the ORM bulk path does not report a rowcount
+            inserted = self.db.connection().execute(self._insert_statement(), inserts).rowcount
+        if updates:
+            self.db.execute(update(MarketplaceProduct), list(updates.values()))
+
+        aggregates = MarketplaceAggregateService(self.db)
+        updated_rows = [{**replaced[id_], **row} for id_, row in updates.items()]
+        if inserted not in (-1, len(inserts)):
+            # Some inserts lost a race to another writer, so their deltas are unknown:
+            # recompute just the summary rows those products count towards
+            aggregates.apply(added=updated_rows, removed=replaced.values())
+            aggregates.rebuild(keys=summary_keys(inserts))
+        else:
+            aggregates.apply(added=inserts + updated_rows, removed=replaced.values())
+
+        return len(inserts), len(updates)
+
+    def _dedupe(self, records: list[dict]) -> list[dict]:
+        """Drop unusable records and keep the last sighting of each product in the batch."""
+        unique: dict[tuple, dict] = {}
+        for data in records:
+            if not data.get("product_url") or not data.get("title"):
+                continue
+            platform = data.get("platform") or "shopee"
+            external_id = data.get("external_id")
+            key = (platform, external_id) if external_id else ("url", data["product_url"])
+            unique[key] = data
+        return list(unique.values())
+
+    def _prefetch(self, batch: list[dict]) -> tuple[dict, dict]:
+        """Load every existing row the batch could match, by composite key or URL."""
+        ids_by_platform: dict[str, set[str]] = {}
+        urls = set()
+        for data in batch:
+            urls.add(data["product_url"])
+            if data.get("external_id"):
+                platform = data.get("platform") or "shopee"
+                ids_by_platform.setdefault(platform, set()).add(data["external_id"])
+
+        conditions = [MarketplaceProduct.product_url.in_(urls)]
+        for platform, external_ids in ids_by_platform.items():
+            conditions.append(
+                and_(
+                    MarketplaceProduct.platform == platform,
+                    MarketplaceProduct.external_id.in_(external_ids),
+                )
+            )
+
+        columns = [
+            MarketplaceProduct.id,
+            MarketplaceProduct.platform,
+            MarketplaceProduct.external_id,
+            MarketplaceProduct.product_url,
+            *(
+                getattr(MarketplaceProduct, field)
+                for field in dict.fromkeys(UPDATE_FIELDS + SOURCE_FIELDS)
+                if field != "platform"
+            ),
+        ]
+        rows = self.db.execute(select(*columns).where(or_(*conditions))).mappings().all()
+
+        by_key = {}
+        by_url = {}
+        for row in rows:
+            if row["external_id"]:
+                by_key[(row["platform"], row["external_id"])] = row
+            by_url[row["product_url"]] = row
+        return by_key, by_url
+
+    def _insert_statement(self):
+        """INSERT that skips rows a concurrent writer already stored."""
+        dialect = self.db.get_bind().dialect.name
+        if dialect == "sqlite":
+            return sqlite_insert(MarketplaceProduct).on_conflict_do_nothing()
+        if dialect == "postgresql":
+            return pg_insert(MarketplaceProduct).on_conflict_do_nothing()
+        return insert(MarketplaceProduct)
@@ -4,16 +4,19 @@ from datetime import datetime
 from sqlalchemy.orm import Session
 
 from app.analysis.genre_classifier import classify_genre
-from app.analysis.hype_calculator import HypeCalculator
-from app.analysis.production_window import ProductionWindowCalculator
-from app.analysis.sales_predictor import SalesPotentialCalculator
+from app.data_version import bump_data_version
+from app.db_writer import db_writer
 from app.models.artist import Artist
 from app.models.event import Event
 from app.models.event_snapshot import EventSnapshot
-from app.models.marketplace_product import MarketplaceProduct
 from app.models.scraping_log import ScrapingLog
 from app.models.venue import Venue
-from app.scrapers.eventbrite_scraper import EventbriteScraper
+from app.scrapers import load_scraper
+from app.services.analysis_service import AnalysisService
+from app.services.dashboard_stats_service import DashboardStatsService
+from app.services.ingest_pipeline import IngestPipeline
+from app.response_cache import schedule_warmup
+from app.services.product_upsert_service import ProductUpsertService
 from app.utils.date_utils import normalize_artist_name
 from app.utils.logger import setup_logger
 
@@ -22,7 +25,7 @@ logger = setup_logger("scraping_service")
 
 # Only Eventbrite works reliably (Sympla=SPA, Eventim=anti-bot, Shopee=403)
 EVENT_SCRAPERS = {
-    "eventbrite": EventbriteScraper,
+    "eventbrite": "app.scrapers.eventbrite_scraper:EventbriteScraper",
 }
 
 # Marketplace scrapers disabled — Shopee API returns 403 (anti-bot)
@@ -30,11 +33,11 @@ MARKETPLACE_SCRAPERS = {}
 
 
 class ScrapingService:
+    """Scrape orchestration. ``_write_*_batch`` run as units of work on the db_writer session."""
+
     def __init__(self, db: Session):
         self.db = db
-        self.hype_calc = HypeCalculator()
-        self.sales_calc = SalesPotentialCalculator()
-        self.production_calc = ProductionWindowCalculator()
+        self.analysis = AnalysisService(db)
 
     async def run_scraping(self, platforms: list[str] | None = None) -> dict:
         """Run scraping for events and/or marketplace products."""
@@ -65,207 +68,148 @@ class ScrapingService:
         }
 
     async def _scrape_events(self, platform: str) -> dict:
-        """Scrape events from a single platform."""
-        scraper_cls = EVENT_SCRAPERS[platform]
-        log = ScrapingLog(platform=platform, started_at=datetime.utcnow())
-        start_time = time.time()
+        """Stream events from a single platform into the database."""
+        scraper = load_scraper(EVENT_SCRAPERS[platform])()
+        return await self._run_pipeline(
+            platform, "events", platform, scraper.stream(),
+            lambda session, batch: ScrapingService(session)._write_event_batch(batch),
+        )
 
-        try:
-            scraper = scraper_cls()
-            raw_events = await scraper.scrape()
+    async def _scrape_marketplace(self, platform: str) -> dict:
+        """Stream marketplace products from a platform into the database."""
+        scraper = load_scraper(MARKETPLACE_SCRAPERS[platform])()
+        return await self._run_pipeline(
+            platform, "marketplace", f"{platform}_marketplace", scraper.stream(),
+            lambda session, batch: ScrapingService(session)._write_product_batch(batch),
+        )
 
-            new_count = 0
-            updated_count = 0
+    async def _run_pipeline(
+        self, platform: str, kind: str, log_platform: str, source, write_batch
+    ) -> dict:
+        log = ScrapingLog(platform=log_platform, started_at=datetime.utcnow())
+        start_time = time.time()
+        counts = {"new": 0, "updated": 0}
 
-            for event_data in raw_events:
-                if not event_data.get("event_date"):
-                    continue
-                created = self._process_event(event_data)
-                if created:
-                    new_count += 1
-                else:
-                    updated_count += 1
+        def count(result: tuple[int, int]):
+            counts["new"] += result[0]
+            counts["updated"] += result[1]
 
-            self.db.commit()
+        pipeline = IngestPipeline(
+            f"{kind}:{platform}", write_batch, on_written=count, events=kind == "events"
+        )
+
+        try:
+            stats = await pipeline.run([source])
+            found = stats.fetch.items
 
             log.status = "success"
-            log.events_found = len(raw_events)
-            log.events_new = new_count
-            log.events_updated = updated_count
+            log.events_found = found
+            log.events_new = counts["new"]
+            log.events_updated = counts["updated"]
 
             logger.info(
-                f"Events [{platform}]: {len(raw_events)} found, "
-                f"{new_count} new, {updated_count} updated"
+                f"{kind.capitalize()} [{platform}]: {found} found, "
+                f"{counts['new']} new, {counts['updated']} updated"
             )
 
             result = {
                 "platform": platform,
-                "type": "events",
+                "type": kind,
                 "status": "success",
-                "found": len(raw_events),
-                "new": new_count,
-                "updated": updated_count,
+                "found": found,
+                "new": counts["new"],
+                "updated": counts["updated"],
+                "pipeline": stats.to_dict(),
             }
 
         except Exception as e:
-            log.status = "failed"
+            # Batches committed before the failure are kept
+            log.status = "partial" if pipeline.stats.write.batches else "failed"
             log.error_message = str(e)
-            logger.error(f"Scraping events [{platform}] failed: {e}")
-            self.db.rollback()
+            log.events_found = pipeline.stats.fetch.items
+            log.events_new = counts["new"]
+            log.events_updated = counts["updated"]
+            logger.error(f"Scraping {kind} [{platform}] failed: {e}")
             result = {
                 "platform": platform,
-                "type": "events",
-                "status": "failed",
+                "type": kind,
+                "status": log.status,
                 "error": str(e),
-                "found": 0,
-                "new": 0,
+                "found": pipeline.stats.fetch.items,
+                "new": counts["new"],
+                "pipeline": pipeline.stats.to_dict(),
             }
 
         finally:
             log.duration_seconds = round(time.time() - start_time, 2)
             log.completed_at = datetime.utcnow()
-            self.db.add(log)
-            self.db.commit()
+            refresh_stats = kind == "events" and pipeline.stats.write.batches > 0
 
-        return result
+            def finish(session: Session):
+                session.add(log)
+                if refresh_stats:
+                    # Bump first, so the refreshed stats record the version they reflect;
+                    # cached dashboard responses must not outlive the old stats
+                    bump_data_version(session)
+                    DashboardStatsService(session).refresh()
 
-    async def _scrape_marketplace(self, platform: str) -> dict:
-        """Scrape marketplace products from a platform."""
-        scraper_cls = MARKETPLACE_SCRAPERS[platform]
-        log = ScrapingLog(platform=f"{platform}_marketplace", started_at=datetime.utcnow())
-        start_time = time.time()
-
-        try:
-            scraper = scraper_cls()
-            products = await scraper.scrape()
+            await db_writer.run(finish)
+            if pipeline.stats.write.batches:
+                schedule_warmup()
 
-            new_count = 0
-            updated_count = 0
-
-            for product_data in products:
-                if not product_data.get("title") or product_data.get("price", 0) <= 0:
-                    continue
-                created = self._process_marketplace_product(product_data)
-                if created:
-                    new_count += 1
-                else:
-                    updated_count += 1
-
-            self.db.commit()
-
-            log.status = "success"
-            log.events_found = len(products)
-            log.events_new = new_count
-            log.events_updated = updated_count
-
-            logger.info(
-                f"Marketplace [{platform}]: {len(products)} found, "
-                f"{new_count} new, {updated_count} updated"
-            )
-
-            result = {
-                "platform": platform,
-                "type": "marketplace",
-                "status": "success",
-                "found": len(products),
-                "new": new_count,
-                "updated": updated_count,
-            }
+        return result
 
-        except Exception as e:
-            log.status = "failed"
-            log.error_message = str(e)
-            logger.error(f"Scraping marketplace [{platform}] failed: {e}")
-            self.db.rollback()
-            result = {
-                "platform": platform,
-                "type": "marketplace",
-                "status": "failed",
-                "error": str(e),
-                "found": 0,
-                "new": 0,
+    def _write_product_batch(self, batch: list[dict]) -> tuple[int, int]:
+        valid = [
+            p for p in batch
+            if p.get("title") and p.get("price", 0) > 0
+        ]
+        return ProductUpsertService(self.db).upsert(valid)
+
+    def _write_event_batch(self, batch: list[dict]) -> tuple[int, int]:
+        """Upsert a batch of events, then rescore every touched event at once."""
+        batch = [e for e in batch if e.get("event_date")]
+        urls = [e["source_url"] for e in batch if e.get("source_url")]
+        existing_by_url = {}
+        if urls:
+            existing_by_url = {
+                event.source_url: event
+                for event in self.db.query(Event).filter(Event.source_url.in_(urls))
             }
+        snapshots_by_event = self.analysis.load_snapshots(
+            [event.id for event in existing_by_url.values()]
+        )
 
-        finally:
-            log.duration_seconds = round(time.time() - start_time, 2)
-            log.completed_at = datetime.utcnow()
-            self.db.add(log)
-            self.db.commit()
+        new_count = 0
+        updated_count = 0
+        touched: dict[int, Event] = {}
 
-        return result
+        for data in batch:
+            source_url = data.get("source_url")
+            existing = existing_by_url.get(source_url) if source_url else None
 
-    def _process_marketplace_product(self, data: dict) -> bool:
-        """Process a single marketplace product. Returns True if new."""
-        existing = None
-        external_id = data.get("external_id")
-        platform = data.get("platform", "shopee")
-
-        if external_id:
-            existing = (
-                self.db.query(MarketplaceProduct)
-                .filter(
-                    MarketplaceProduct.external_id == external_id,
-                    MarketplaceProduct.platform == platform,
+            if existing:
+                self._update_event(existing, data)
+                self._maybe_create_snapshot(
+                    existing, data, snapshots_by_event.setdefault(existing.id, [])
                 )
-                .first()
-            )
+                touched[existing.id] = existing
+                updated_count += 1
+                continue
 
-        if not existing:
-            product_url = data.get("product_url", "")
-            if product_url:
-                existing = (
-                    self.db.query(MarketplaceProduct)
-                    .filter(MarketplaceProduct.product_url == product_url)
-                    .first()
-                )
+            event, snapshot = self._create_event(data)
+            snapshots_by_event[event.id] = [snapshot]
+            touched[event.id] = event
+            if source_url:
+                existing_by_url[source_url] = event
+            new_count += 1
 
-        if existing:
-            existing.price = data.get("price", existing.price)
-            existing.sold_count = data.get("sold_count", existing.sold_count)
-            existing.rating = data.get("rating", existing.rating)
-            existing.review_count = data.get("review_count", existing.review_count)
-            existing.original_price = data.get("original_price", existing.original_price)
-            existing.last_scraped_at = datetime.utcnow()
-            return False
-
-        product = MarketplaceProduct(
-            title=data["title"],
-            product_url=data.get("product_url", ""),
-            price=data.get("price", 0),
-            original_price=data.get("original_price"),
-            sold_count=data.get("sold_count", 0),
-            rating=data.get("rating"),
-            review_count=data.get("review_count", 0),
-            seller_name=data.get("seller_name"),
-            seller_location=data.get("seller_location"),
-            platform=platform,
-            category=data.get("category"),
-            related_artist=data.get("related_artist"),
-            search_term=data.get("search_term"),
-            image_url=data.get("image_url"),
-            external_id=data.get("external_id"),
-        )
-        self.db.add(product)
-        return True
-
-    def _process_event(self, data: dict) -> bool:
-        """Process a single event dict. Returns True if new, False if updated."""
-        source_url = data.get("source_url")
-
-        existing = None
-        if source_url:
-            existing = (
-                self.db.query(Event)
-                .filter(Event.source_url == source_url)
-                .first()
-            )
-
-        if existing:
-            self._update_event(existing, data)
-            self._maybe_create_snapshot(existing, data)
-            self._recalculate_scores(existing)
-            return False
+        # Populate snapshot_at defaults before the hype calculator reads them
+        self.db.flush()
+        self.analysis.rescore_events(list(touched.values()), snapshots_by_event)
+        return new_count, updated_count
 
+    def _create_event(self, data: dict) -> tuple[Event, EventSnapshot]:
         # Find or create artist
         artist = self._find_or_create_artist(
             data.get("artist_name", ""), data.get("title", "")
@@ -282,7 +226,7 @@ class ScrapingService:
             venue_id=venue.id if venue else None,
             event_date=data["event_date"],
             source_platform=data.get("source_platform"),
-            source_url=source_url,
+            source_url=data.get("source_url"),
             external_id=data.get("external_id"),
             ticket_status=data.get("ticket_status", "available"),
             estimated_audience=data.get("estimated_audience"),
@@ -305,9 +249,7 @@ class ScrapingService:
             ticket_price_max=event.ticket_price_max,
         )
         self.db.add(snapshot)
-
-        self._recalculate_scores(event)
-        return True
+        return event, snapshot
 
     def _find_or_create_artist(self, artist_name: str, title: str = "") -> Artist | None:
         if not artist_name:
@@ -368,13 +310,10 @@ class ScrapingService:
             event.ticket_price_max = data["ticket_price_max"]
         event.last_scraped_at = datetime.utcnow()
 
-    def _maybe_create_snapshot(self, event: Event, data: dict):
-        last_snap = (
-            self.db.query(EventSnapshot)
-            .filter(EventSnapshot.event_id == event.id)
-            .order_by(EventSnapshot.snapshot_at.desc())
-            .first()
-        )
+    def _maybe_create_snapshot(
+        self, event: Event, data: dict, snapshots: list[EventSnapshot]
+    ):
+        last_snap = snapshots[-1] if snapshots else None
         new_status = data.get("ticket_status")
         if last_snap and new_status and last_snap.ticket_status != new_status:
             snapshot = EventSnapshot(
@@ -385,24 +324,7 @@ class ScrapingService:
                 ticket_price_max=data.get("ticket_price_max"),
             )
             self.db.add(snapshot)
-
-    def _recalculate_scores(self, event: Event):
-        snapshots = (
-            self.db.query(EventSnapshot)
-            .filter(EventSnapshot.event_id == event.id)
-            .order_by(EventSnapshot.snapshot_at.asc())
-            .all()
-        )
-
-        hype = self.hype_calc.calculate(event, snapshots)
-        event.hype_score = hype
-
-        sales = self.sales_calc.calculate(event, hype)
-        event.sales_potential_score = sales
-
-        start, deadline = self.production_calc.calculate(event, hype, sales)
-        event.production_start_date = start
-        event.production_deadline = deadline
+            snapshots.append(snapshot)
 
     def get_logs(self, platform: str | None = None, limit: int = 20) -> list[ScrapingLog]:
         query = self.db.query(ScrapingLog)
@@ -0,0 +1,142 @@
+"""Bulk loading of the seed catalogue (venues, artists, events, products).
+
+Rows are built as transient ORM objects, so validators fill the lookup keys
+and the calculators can score events through their relationships, then
+inserted with one multi-row INSERT per table instead of a flush per row.
+"""
+
+from datetime import datetime
+
+from sqlalchemy import insert
+from sqlalchemy.orm import Session
+
+from app.analysis.genre_classifier import classify_genre
+from app.analysis.hype_calculator import HypeCalculator
+from app.analysis.production_window import ProductionWindowCalculator
+from app.analysis.sales_predictor import SalesPotentialCalculator
+from app.data_version import bump_data_version
+from app.models.artist import Artist
+from app.models.event import Event
+from app.models.event_snapshot import EventSnapshot
+from app.models.marketplace_product import MarketplaceProduct
+from app.models.venue import Venue
+from app.services.dashboard_stats_service import DashboardStatsService
+from app.services.marketplace_aggregate_service import MarketplaceAggregateService
+from app.utils.date_utils import normalize_artist_name
+
+
+class SeedService:
+    def __init__(self, db: Session):
+        self.db = db
+
+    def is_empty(self) -> bool:
+        return self.db.query(Event.id).first() is None
+
+    def seed_events(self, venues_data: list[tuple], events_data: list[dict]) -> dict:
+        """Insert venues, artists, scored events and their first snapshots."""
+        hype_calc = HypeCalculator()
+        sales_calc = SalesPotentialCalculator()
+        prod_calc = ProductionWindowCalculator()
+
+        venue_map = {
+            name: Venue(name=name, city=city, state=state, capacity=capacity, venue_type=vtype)
+            for name, city, state, capacity, vtype in venues_data
+        }
+        artist_map: dict[str, Artist] = {}
+        events = []
+        for data in events_data:
+            artist_name = data["artist"]
+            normalized = normalize_artist_name(artist_name)
+            if normalized not in artist_map:
+                artist_map[normalized] = Artist(
+                    name=artist_name,
+                    normalized_name=normalized,
+                    genre=classify_genre(data["title"], artist_name),
+                    popularity_score=70.0 if data["status"] == "sold_out" else 50.0,
+                )
+            event = Event(
+                title=data["title"],
+                event_date=datetime.strptime(data["date"], "%Y-%m-%d"),
+                source_platform="seed",
+                source_url=f"seed://{normalized}/{data['date']}",
+                ticket_status=data["status"],
+                estimated_audience=data.get("audience"),
+                ticket_price_min=data.get("price_min"),
+                ticket_price_max=data.get("price_max"),
+                event_type=data.get("type", "concert"),
+                is_festival=data.get("is_festival", False),
+                headliners=data.get("headliners"),
+            )
+            # Transient objects: the calculators read these without a session
+            event.artist = artist_map[normalized]
+            event.venue = venue_map.get(data["venue"])
+
+            hype = hype_calc.calculate(event, [])
+            event.hype_score = hype
+            sales = sales_calc.calculate(event, hype)
+            event.sales_potential_score = sales
+            event.production_start_date, event.production_deadline = prod_calc.calculate(event, hype, sales)
+            events.append(event)
+
+        self._insert_returning_ids(Venue, list(venue_map.values()))
+        self._insert_returning_ids(Artist, list(artist_map.values()))
+        for event in events:
+            event.artist_id = event.artist.id
+            event.venue_id = event.venue.id if event.venue else None
+        self._insert_returning_ids(Event, events)
+        self.db.execute(insert(EventSnapshot), [
+            {
+                "event_id": event.id,
+                "ticket_status": event.ticket_status,
+                "estimated_audience": event.estimated_audience,
+                "ticket_price_min": event.ticket_price_min,
+                "ticket_price_max": event.ticket_price_max,
+            }
+            for event in events
+        ])
+
+        bump_data_version(self.db)
+        DashboardStatsService(self.db).refresh()
+        return {"events": len(events), "artists": len(artist_map), "venues": len(venue_map)}
+
+    def seed_products(self, products_data: list[dict], platform: str = "shopee") -> int:
+        """Insert marketplace products and rebuild their aggregates."""
+        if products_data:
+            self.db.execute(insert(MarketplaceProduct), [
+                {
+                    "title": data["title"],
+                    "price": data["price"],
+                    "original_price": data.get("original_price"),
+                    "sold_count": data.get("sold_count", 0),
+                    "rating": data.get("rating"),
+                    "review_count": data.get("review_count", 0),
+                    "seller_name": data.get("seller_name"),
+                    "seller_location": data.get("seller_location"),
+                    "platform": platform,
+                    "category": data.get("category"),
+                    "related_artist": data.get("related_artist"),
+                    "related_event": data.get("related_event"),
+                    "search_term": data.get("search_term"),
+                    "product_url": data["product_url"],
+                    "image_url": None,
+                }
+                for data in products_data
+            ])
+        MarketplaceAggregateService(self.db).rebuild()
+        bump_data_version(self.db, events=False)
+        return len(products_data)
+
+    def _insert_returning_ids(self, model, objects: list):
+        """One INSERT for ``objects`` (transient), setting their ids from RETURNING."""
+        if not objects:
+            return
+        columns = [attr.key for attr in model.__mapper__.column_attrs if attr.key != "id"]
+        rows = []
+        for obj in objects:
+            # Unset attributes are left out, so column defaults still apply
+            rows.append({key: value for key in columns if (value := getattr(obj, key)) is not None})
+        ids = self.db.scalars(
+            insert(model).returning(model.id, sort_by_parameter_order=True), rows
+        ).all()
+        for obj, new_id in zip(objects, ids):
+            obj.id = new_id
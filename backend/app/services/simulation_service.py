@@ -0,0 +1,26 @@
+from sqlalchemy.orm import Session
+
+from app import simulation
+from app.forecasting import CostParameters
+from app.schemas.marketplace import SimulationRequest
+from app.services.marketplace_service import MarketplaceService, event_columns
+from app.simulation import simulation_pool
+
+
+class SimulationService:
+    def __init__(self, db: Session):
+        self.db = db
+
+    async def run(self, request: SimulationRequest) -> dict:
+        """Run a scenario simulation on the worker pool; raises SimulationBusy when it is full."""
+        return await simulation_pool.run(self.simulate, request)
+
+    def simulate(self, request: SimulationRequest) -> dict:
+        events, matches = MarketplaceService(self.db).forecast_inputs(request.days)
+        return simulation.simulate(
+            event_ids=[row[0] for row in events],
+            weeks=[row[7] for row in events],
+            columns=event_columns(events, matches),
+            request=request,
+            defaults=CostParameters.from_settings(),
+        )
@@ -0,0 +1,222 @@
+"""Monte Carlo scenarios over the event forecast.
+
+Each draw samples one scenario - base conversion rate, price factor,
+production cost and marketplace fee - and projects every upcoming event
+under it with the same formulas as ``forecasting.project_events``, as one
+draws x events array operation. A scenario with every input fixed at the
+configured defaults reproduces the deterministic forecast.
+
+Simulations are CPU-bound, so they run on a small thread pool (NumPy
+releases the GIL in the array kernels) instead of the event loop. Requests
+beyond the pool's queue capacity are refused with ``SimulationBusy``, and
+each run is bounded by a cell budget (draws x events) and a time budget.
+"""
+
+import asyncio
+import secrets
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+
+import numpy as np
+
+from app import forecasting
+from app.config import settings
+from app.forecasting import CostParameters, py_round
+from app.schemas.marketplace import Distribution, SimulationRequest
+from app.utils.logger import setup_logger
+
+logger = setup_logger("simulation")
+
+# Draws computed per array pass; the time budget is checked between passes
+CHUNK_CELLS = 250_000
+# Valid range of each scenario input; draws outside are clipped
+INPUT_BOUNDS = {
+    "conversion_rate": (0.0, 1.0),
+    "price_factor": (0.0, None),
+    "production_cost": (0.0, None),
+    "marketplace_fee_pct": (0.0, 1.0),
+}
+
+
+class SimulationBusy(RuntimeError):
+    """Every worker is busy and the queue is full."""
+
+
+class SimulationPool:
+    def __init__(self, workers: int | None = None):
+        self.workers = workers or settings.SIMULATION_WORKERS
+        self._executor: ThreadPoolExecutor | None = None
+        self._lock = threading.Lock()
+        # Running plus queued runs; one queued run per worker
+        self._slots = threading.BoundedSemaphore(self.workers * 2)
+
+    def submit(self, fn, *args, **kwargs) -> Future:
+        if not self._slots.acquire(blocking=False):
+            raise SimulationBusy("Too many simulations running, try again shortly")
+        try:
+            future = self._ensure_started().submit(fn, *args, **kwargs)
+        except BaseException:
+            self._slots.release()
+            raise
+        future.add_done_callback(lambda _: self._slots.release())
+        return future
+
+    async def run(self, fn, *args, **kwargs):
+        return await asyncio.wrap_future(self.submit(fn, *args, **kwargs))
+
+    def stop(self):
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _ensure_started(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.workers, thread_name_prefix="simulation"
+                )
+            return self._executor
+
+
+simulation_pool = SimulationPool()
+
+
+def draw(
+    distribution: Distribution | None, default: float, rng: np.random.Generator, size: int, bounds: tuple
+) -> np.ndarray:
+    """``size`` samples of a scenario input, clipped to ``bounds``."""
+    if distribution is None:
+        return np.full(size, default, dtype=np.float64)
+    if distribution.kind == "fixed":
+        values = np.full(size, distribution.value, dtype=np.float64)
+    elif distribution.kind == "uniform":
+        values = rng.uniform(distribution.low, distribution.high, size)
+    elif distribution.kind == "normal":
+        values = rng.normal(distribution.mean, distribution.std, size)
+    elif distribution.low == distribution.high:
+        values = np.full(size, distribution.low, dtype=np.float64)
+    else:
+        values = rng.triangular(distribution.low, distribution.mode, distribution.high, size)
+    low, high = bounds
+    return np.clip(values, low, high)
+
+
+def simulate(
+    event_ids: list[int],
+    weeks: list[str],
+    columns: dict,
+    request: SimulationRequest,
+    defaults: CostParameters | None = None,
+) -> dict:
+    """Revenue and profit percentiles per event, per week and in total.
+
+    ``columns`` are the ``project_events`` inputs of the events (date
+    order, so each week is a contiguous run). The number of draws is capped
+    by ``SIMULATION_MAX_DRAWS`` and ``SIMULATION_MAX_CELLS``, and drawing
+    stops early once ``SIMULATION_TIME_BUDGET_SECONDS`` is spent; the
+    response reports how many draws were actually run.
+    """
+    started = time.perf_counter()
+    defaults = defaults or CostParameters.from_settings()
+    seed = request.seed if request.seed is not None else secrets.randbits(63)
+    rng = np.random.default_rng(seed)
+    n_events = len(event_ids)
+
+    draws = min(request.draws, settings.SIMULATION_MAX_DRAWS)
+    if n_events:
+        draws = min(draws, max(settings.SIMULATION_MAX_CELLS // n_events, 1))
+
+    # Every scenario is drawn up front, so a seed gives the same scenarios
+    # however many of them the time budget lets through
+    scenarios = {
+        name: draw(getattr(request, name), default, rng, draws, INPUT_BOUNDS[name])
+        for name, default in (
+            ("conversion_rate", defaults.base_conversion_rate),
+            ("price_factor", 1.0),
+            ("production_cost", defaults.production_cost),
+            ("marketplace_fee_pct", defaults.marketplace_fee_pct),
+        )
+    }
+
+    audience = columns["audience"].astype(np.float64)
+    status_mult, festival_mult, hype_mult = forecasting.conversion_multipliers(
+        columns["hype_score"], columns["ticket_status"], columns["is_festival"]
+    )
+    competitor_price = py_round(columns["avg_price"] * forecasting.COMPETITOR_DISCOUNT, 2)
+
+    revenue = np.empty((draws, n_events))
+    profit = np.empty((draws, n_events))
+    chunk = max(CHUNK_CELLS // max(n_events, 1), 1)
+    deadline = started + settings.SIMULATION_TIME_BUDGET_SECONDS
+    done = 0
+    while done < draws:
+        part = slice(done, min(done + chunk, draws))
+        base = scenarios["conversion_rate"][part, None]
+        cost = scenarios["production_cost"][part, None]
+        fee = scenarios["marketplace_fee_pct"][part, None]
+
+        conversion = base * status_mult * festival_mult * hype_mult
+        units = np.trunc(audience * conversion)
+        # Rounding is monotonic, so rounding each side of the max() equals
+        # rounding the max, as suggested_prices() does
+        floor = py_round(cost[:, 0] * forecasting.MIN_MARKUP, 2)[:, None]
+        price = np.maximum(competitor_price, floor) * scenarios["price_factor"][part, None]
+        revenue[part] = units * price
+        profit[part] = units * (price - cost - (price * fee))
+
+        done = part.stop
+        if time.perf_counter() > deadline:
+            break
+
+    revenue, profit = revenue[:done], profit[:done]
+    percentiles = request.percentiles
+    labels = [f"p{value:g}" for value in percentiles]
+
+    def summarize(values: np.ndarray) -> list[dict]:
+        """Percentiles over draws (axis 0) of each column, rounded for display."""
+        table = py_round(np.percentile(values, percentiles, axis=0), 2).T.tolist()
+        return [dict(zip(labels, row)) for row in table]
+
+    # Week boundaries over the date-ordered events
+    starts = [i for i in range(n_events) if i == 0 or weeks[i] != weeks[i - 1]]
+    if starts:
+        weekly_revenue = np.add.reduceat(revenue, starts, axis=1)
+        weekly_profit = np.add.reduceat(profit, starts, axis=1)
+    else:
+        weekly_revenue = weekly_profit = np.empty((done, 0))
+    counts = np.diff(starts + [n_events]).tolist()
+
+    total_revenue = revenue.sum(axis=1, keepdims=True) if n_events else np.zeros((done, 1))
+    total_profit = profit.sum(axis=1, keepdims=True) if n_events else np.zeros((done, 1))
+
+    elapsed = time.perf_counter() - started
+    budget_limited = done < request.draws
+    if budget_limited:
+        logger.info(f"Simulation ran {done}/{request.draws} draws over {n_events} events in {elapsed:.2f}s")
+
+    return {
+        "seed": seed,
+        "draws_requested": request.draws,
+        "draws_run": done,
+        "budget_limited": budget_limited,
+        "days": request.days,
+        "events_count": n_events,
+        "percentiles": percentiles,
+        "totals": {
+            "revenue": summarize(total_revenue)[0],
+            "profit": summarize(total_profit)[0],
+        },
+        "weekly": [
+            {"week": weeks[start], "events": count, "revenue": rev, "profit": prof}
+            for start, count, rev, prof in zip(
+                starts, counts, summarize(weekly_revenue), summarize(weekly_profit)
+            )
+        ],
+        "events": [
+            {"event_id": event_id, "revenue": rev, "profit": prof}
+            for event_id, rev, prof in zip(event_ids, summarize(revenue), summarize(profit))
+        ],
+        "elapsed_seconds": round(elapsed, 3),
+    }
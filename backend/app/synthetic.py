@@ -0,0 +1,439 @@
+"""Deterministic synthetic dataset at production scale, for benchmarks and load tests.
+
+``generate(path, scale, seed)`` writes a fresh SQLite database. Row counts
+grow linearly with ``scale``; at 1.0 there are 400 venues, 2,000 artists,
+20,000 events with about 140,000 snapshots, and 1,000,000 marketplace
+products. Every value comes from one ``numpy`` generator seeded with
+``seed``, and every date is relative to ``anchor``, so the same arguments
+give the same rows. The scores are computed with the app's calculators,
+which read the current date like the app does.
+
+Distributions follow the shape of the real data:
+- artist popularity and the choice of artist are Zipf-like;
+- cities are weighted towards São Paulo and Rio;
+- venue capacity is log-normal per venue type;
+- sell-outs follow demand against capacity;
+- products' sold counts are heavy-tailed, and prices end in ,90.
+
+Rows are bulk-inserted in batches, with the full-text index and the
+materialized stats built once at the end.
+"""
+
+import os
+from datetime import date, datetime, time, timedelta
+from types import SimpleNamespace
+
+import numpy as np
+from sqlalchemy import insert, text
+from sqlalchemy.orm import sessionmaker
+
+from app.analysis.genre_classifier import GENRE_KEYWORDS
+from app.analysis.hype_calculator import HypeCalculator
+from app.analysis.production_window import ProductionWindowCalculator
+from app.analysis.sales_predictor import SalesPotentialCalculator
+from app.data_version import bump_data_version
+from app.database import SQLITE_PROFILES, Base, create_db_engine
+from app.models import Artist, Event, EventSnapshot, MarketplaceProduct, ScrapingLog, Venue
+from app.utils.date_utils import canonical_key, normalize_artist_name
+from app.utils.logger import setup_logger
+
+logger = setup_logger("synthetic")
+
+BATCH_SIZE = 20_000
+
+# Rows at scale 1.0
+BASE_COUNTS = {
+    "venues": 400,
+    "artists": 2_000,
+    "events": 20_000,
+    "sellers": 20_000,
+    "products": 1_000_000,
+    "scraping_logs": 2_000,
+}
+SNAPSHOTS_PER_EVENT = 6  # mean extra snapshots after the first
+
+# (city, state, weight)
+CITIES = [
+    ("São Paulo", "SP", 30), ("Rio de Janeiro", "RJ", 16), ("Belo Horizonte", "MG", 7),
+    ("Porto Alegre", "RS", 6), ("Curitiba", "PR", 6), ("Brasília", "DF", 5),
+    ("Salvador", "BA", 4), ("Recife", "PE", 4), ("Fortaleza", "CE", 3),
+    ("Goiânia", "GO", 3), ("Florianópolis", "SC", 3), ("Campinas", "SP", 2),
+    ("Belém", "PA", 2), ("Manaus", "AM", 2), ("Vitória", "ES", 1),
+    ("Natal", "RN", 1), ("São Luís", "MA", 1), ("Ribeirão Preto", "SP", 1),
+]
+# type -> (share, median capacity, log-normal sigma, median ticket price)
+VENUE_TYPES = {
+    "club": (0.35, 1_500, 0.5, 120.0),
+    "arena": (0.40, 8_000, 0.5, 250.0),
+    "outdoor": (0.15, 25_000, 0.6, 300.0),
+    "stadium": (0.10, 50_000, 0.3, 450.0),
+}
+GENRES = list(GENRE_KEYWORDS)
+NAME_WORDS = (
+    "Black", "Silver", "Velvet", "Electric", "Crimson", "Midnight", "Golden", "Wild", "Neon", "Iron",
+    "Lunar", "Savage", "Paper", "Glass", "Northern", "Hollow", "Burning", "Broken", "Solar", "Cosmic",
+    "Rosa", "Noite", "Fogo", "Vento", "Mar", "Selva", "Sol", "Lua", "Estrada", "Tempestade",
+)
+NAME_NOUNS = (
+    "Wolves", "Parade", "Kings", "Machine", "Rebels", "Hearts", "Ghosts", "Tigers", "Echoes", "Saints",
+    "Riders", "Dreamers", "Shadows", "Engines", "Prophets", "Lovers", "Giants", "Foxes", "Crows", "Pilots",
+    "Banda", "Trio", "Coletivo", "Orquestra", "Sistema", "Quinteto", "Projeto", "Bloco", "Conexão", "Tribo",
+)
+TOUR_NAMES = ("World Tour", "Tour Brasil", "Live", "Ao Vivo", "Farewell Tour", "Anniversary Tour", "Acústico")
+PRODUCT_STYLES = (
+    "Preta", "Branca", "Oversized", "Unissex", "Vintage", "Tour", "Logo", "Premium", "Algodão", "Plus Size",
+)
+GENERIC_TITLES = ("Camiseta Banda de Rock", "Camiseta Festival", "Camiseta Música", "Camiseta Show")
+SELLER_PREFIXES = ("Rock", "Metal", "Pop", "Street", "Urban", "Music", "Merch", "Estampa", "Loja", "Camisetas")
+SELLER_SUFFIXES = ("Store", "Shop", "Merch", "Brasil", "BR", "Outlet", "Club", "House", "Place", "Center")
+PLATFORMS = (("shopee", 0.65), ("mercadolivre", 0.35))
+LOG_PLATFORMS = ("eventbrite", "shopee_marketplace")
+STATUSES = ("available", "selling_fast", "sold_out")
+
+
+def counts_for(scale: float) -> dict:
+    return {name: max(1, round(count * scale)) for name, count in BASE_COUNTS.items()}
+
+
+def generate(path: str, scale: float = 1.0, seed: int = 0, anchor: date | None = None) -> dict:
+    """Write a new synthetic database to ``path`` and return its row counts."""
+    if os.path.exists(path):
+        raise FileExistsError(f"{path} already exists")
+    anchor_at = datetime.combine(anchor or datetime.utcnow().date(), time())
+    counts = counts_for(scale)
+    rng = np.random.default_rng(seed)
+
+    # A scratch file: skip fsyncs while loading
+    engine = create_db_engine(f"sqlite:///{path}", {**SQLITE_PROFILES["tuned"], "synchronous": "OFF"})
+    try:
+        Base.metadata.create_all(bind=engine)
+        generator = _Generator(rng, counts, anchor_at)
+        with engine.begin() as conn:
+            venues = generator.venues()
+            conn.execute(insert(Venue), venues)
+            artists = generator.artists()
+            conn.execute(insert(Artist), artists)
+            events, snapshots = generator.events(venues, artists)
+            _insert_batches(conn, Event, events)
+            _insert_batches(conn, EventSnapshot, snapshots)
+            conn.execute(insert(ScrapingLog), generator.scraping_logs())
+        logger.info(f"Loaded {len(events)} events and {len(snapshots)} snapshots")
+
+        products = 0
+        for batch in generator.products(artists, events):
+            with engine.begin() as conn:
+                conn.execute(insert(MarketplaceProduct), batch)
+            products += len(batch)
+            logger.info(f"Loaded {products}/{counts['products']} products")
+
+        # Built once over the loaded rows instead of by trigger per row
+        from app.search_index import ensure_search_index
+        from app.services.dashboard_stats_service import DashboardStatsService
+        from app.services.marketplace_aggregate_service import MarketplaceAggregateService
+
+        ensure_search_index(engine)
+        session = sessionmaker(bind=engine, autoflush=False)()
+        try:
+            bump_data_version(session)
+            DashboardStatsService(session).refresh()
+            MarketplaceAggregateService(session).rebuild()
+            session.commit()
+            session.execute(text("ANALYZE"))
+            session.commit()
+        finally:
+            session.close()
+    finally:
+        engine.dispose()
+
+    return {
+        "venues": len(venues),
+        "artists": len(artists),
+        "events": len(events),
+        "event_snapshots": len(snapshots),
+        "marketplace_products": products,
+        "scraping_logs": counts["scraping_logs"],
+    }
+
+
+def _insert_batches(conn, model, rows: list[dict]):
+    for start in range(0, len(rows), BATCH_SIZE):
+        conn.execute(insert(model), rows[start:start + BATCH_SIZE])
+
+
+def _zipf_weights(n: int, exponent: float = 1.1) -> np.ndarray:
+    weights = 1.0 / np.arange(1, n + 1) ** exponent
+    return weights / weights.sum()
+
+
+def _price(value: np.ndarray) -> np.ndarray:
+    """Retail prices ending in ,90."""
+    return np.floor(value) + 0.9
+
+
+class _Generator:
+    def __init__(self, rng: np.random.Generator, counts: dict, anchor: datetime):
+        self.rng = rng
+        self.counts = counts
+        self.anchor = anchor
+
+    def _days_ago(self, days) -> datetime:
+        return self.anchor - timedelta(days=float(days))
+
+    def venues(self) -> list[dict]:
+        rng = self.rng
+        n = self.counts["venues"]
+        weights = np.array([weight for _, _, weight in CITIES], dtype=float)
+        city_index = rng.choice(len(CITIES), size=n, p=weights / weights.sum())
+        types = list(VENUE_TYPES)
+        type_index = rng.choice(len(types), size=n, p=[VENUE_TYPES[t][0] for t in types])
+        rows = []
+        for i in range(n):
+            city, state, _ = CITIES[city_index[i]]
+            venue_type = types[type_index[i]]
+            _, median, sigma, _ = VENUE_TYPES[venue_type]
+            rows.append({
+                "id": i + 1,
+                "name": f"{rng.choice(NAME_WORDS)} {venue_type.title()} {city} {i + 1}",
+                "city": city,
+                "state": state,
+                "city_key": canonical_key(city),
+                "state_key": canonical_key(state),
+                "capacity": int(rng.lognormal(np.log(median), sigma)),
+                "venue_type": venue_type,
+                "created_at": self.anchor,
+                "updated_at": self.anchor,
+            })
+        return rows
+
+    def artists(self) -> list[dict]:
+        rng = self.rng
+        n = self.counts["artists"]
+        # Unique names: word pairs in a seeded order, numbered once they run out
+        pairs = [(a, b) for a in NAME_WORDS for b in NAME_NOUNS]
+        order = rng.permutation(len(pairs))
+        # Rank 1 is the most popular; popularity decays with rank
+        popularity = np.clip(100 * (1.0 / np.arange(1, n + 1)) ** 0.35 + rng.normal(0, 4, n), 1, 100)
+        genre_index = rng.choice(len(GENRES), size=n)
+        rows = []
+        for i in range(n):
+            first, second = pairs[order[i % len(pairs)]]
+            name = f"{first} {second}" if i < len(pairs) else f"{first} {second} {i // len(pairs) + 1}"
+            genre = GENRES[genre_index[i]]
+            rows.append({
+                "id": i + 1,
+                "name": name,
+                "normalized_name": normalize_artist_name(name),
+                "genre": genre,
+                "genre_key": canonical_key(genre),
+                "popularity_score": round(float(popularity[i]), 1),
+                "created_at": self.anchor,
+                "updated_at": self.anchor,
+            })
+        return rows
+
+    def events(self, venues: list[dict], artists: list[dict]) -> tuple[list[dict], list[dict]]:
+        rng = self.rng
+        n = self.counts["events"]
+        hype_calc = HypeCalculator()
+        sales_calc = SalesPotentialCalculator()
+        prod_calc = ProductionWindowCalculator()
+
+        artist_index = rng.choice(len(artists), size=n, p=_zipf_weights(len(artists)))
+        # Venues in big cities host more shows
+        venue_weights = np.array([1.0 + (v["city"] in ("São Paulo", "Rio de Janeiro")) for v in venues])
+        venue_index = rng.choice(len(venues), size=n, p=venue_weights / venue_weights.sum())
+        # A quarter already happened, the rest spreads over the next year
+        offset_days = np.where(rng.random(n) < 0.25, -rng.uniform(1, 365, n), rng.uniform(0, 365, n))
+        lead_days = rng.uniform(20, 200, n)
+        festival = rng.random(n) < 0.05
+        demand_noise = rng.normal(0, 0.25, n)
+        fill = rng.beta(6, 2, n)
+        snapshot_counts = 1 + rng.poisson(SNAPSHOTS_PER_EVENT, n)
+
+        events, snapshots = [], []
+        for i in range(n):
+            artist = artists[artist_index[i]]
+            venue = venues[venue_index[i]]
+            event_date = (self.anchor + timedelta(days=float(offset_days[i]))).replace(
+                hour=int(rng.choice([16, 19, 20, 21])), minute=0
+            )
+            first_seen = min(event_date - timedelta(days=float(lead_days[i])), self.anchor)
+            # Demand: popular artists in small rooms sell out
+            demand = artist["popularity_score"] / 100 - np.log10(venue["capacity"]) / 10 + demand_noise[i]
+            final = 2 if demand > 0.35 else 1 if demand > 0.1 else 0
+            price_median = VENUE_TYPES[venue["venue_type"]][3]
+            price_min = float(_price(rng.lognormal(np.log(price_median), 0.3)))
+            price_max = float(_price(price_min * rng.uniform(1.5, 4.0)))
+            audience = int(venue["capacity"] * (1.0 if final == 2 else fill[i]))
+            headliners = None
+            if festival[i]:
+                picks = rng.choice(len(artists), size=4, replace=False, p=_zipf_weights(len(artists)))
+                headliners = [artists[j]["name"] for j in picks]
+            event_id = i + 1
+            event = {
+                "id": event_id,
+                "title": (
+                    f"{rng.choice(NAME_WORDS)} Festival {event_date.year}" if festival[i]
+                    else f"{artist['name']} - {rng.choice(TOUR_NAMES)}"
+                ),
+                "artist_id": artist["id"],
+                "venue_id": venue["id"],
+                "event_date": event_date,
+                "source_platform": "synthetic",
+                "source_url": f"synthetic://event/{event_id}",
+                "external_id": str(event_id),
+                "ticket_status": STATUSES[final],
+                "estimated_audience": audience,
+                "ticket_price_min": price_min,
+                "ticket_price_max": price_max,
+                "event_type": "festival" if festival[i] else str(rng.choice(["concert", "tour_stop"])),
+                "is_festival": bool(festival[i]),
+                "headliners": headliners,
+                "is_active": bool(rng.random() > 0.03),
+                "first_seen_at": first_seen,
+                "last_scraped_at": min(event_date, self.anchor),
+                "created_at": first_seen,
+                "updated_at": min(event_date, self.anchor),
+            }
+
+            # Ticket history: status only moves towards the final one
+            history = []
+            last_seen = min(event_date, self.anchor)
+            count = int(snapshot_counts[i])
+            span = max((last_seen - first_seen).total_seconds(), 0)
+            times = np.sort(rng.uniform(0, span, count - 1)) if count > 1 else []
+            steps = np.sort(rng.integers(0, final + 1, count))
+            for k, seconds in enumerate([0.0, *times]):
+                status = STATUSES[int(steps[k])]
+                history.append({
+                    "event_id": event_id,
+                    "snapshot_at": first_seen + timedelta(seconds=float(seconds)),
+                    "ticket_status": status,
+                    "estimated_audience": int(audience * (k + 1) / count),
+                    "ticket_price_min": price_min,
+                    "ticket_price_max": price_max,
+                })
+            history[-1]["ticket_status"] = event["ticket_status"]
+            snapshots.extend(history)
+
+            # Scores from the app's calculators, on lightweight stand-ins
+            subject = SimpleNamespace(
+                **{key: event[key] for key in ("event_date", "ticket_status", "estimated_audience", "is_festival", "event_type")},
+                venue=SimpleNamespace(capacity=venue["capacity"], city=venue["city"]),
+                artist=SimpleNamespace(popularity_score=artist["popularity_score"], genre=artist["genre"]),
+            )
+            hype = hype_calc.calculate(subject, [SimpleNamespace(**s) for s in history])
+            sales = sales_calc.calculate(subject, hype)
+            start, deadline = prod_calc.calculate(subject, hype, sales)
+            event.update(
+                hype_score=hype, sales_potential_score=sales,
+                production_start_date=start, production_deadline=deadline,
+            )
+            events.append(event)
+        return events, snapshots
+
+    def scraping_logs(self) -> list[dict]:
+        rng = self.rng
+        rows = []
+        for i in range(self.counts["scraping_logs"]):
+            # Every 12 hours per platform, newest first
+            started = self.anchor - timedelta(hours=12 * (i // len(LOG_PLATFORMS)))
+            status = rng.choice(["success", "partial", "failed"], p=[0.9, 0.06, 0.04])
+            found = int(rng.poisson(120)) if status != "failed" else 0
+            new = int(rng.binomial(found, 0.1))
+            duration = float(round(rng.uniform(5, 120), 2))
+            rows.append({
+                "id": i + 1,
+                "platform": LOG_PLATFORMS[i % len(LOG_PLATFORMS)],
+                "status": str(status),
+                "events_found": found,
+                "events_new": new,
+                "events_updated": found - new,
+                "error_message": "synthetic failure" if status == "failed" else None,
+                "duration_seconds": duration,
+                "started_at": started,
+                "completed_at": started + timedelta(seconds=duration),
+            })
+        return rows
+
+    def products(self, artists: list[dict], events: list[dict]):
+        """Product rows in batches of ``BATCH_SIZE``."""
+        rng = self.rng
+        total = self.counts["products"]
+        n_sellers = self.counts["sellers"]
+        city_weights = np.array([weight for _, _, weight in CITIES], dtype=float)
+        seller_city = rng.choice(len(CITIES), size=n_sellers, p=city_weights / city_weights.sum())
+        sellers = [
+            (
+                f"{SELLER_PREFIXES[i % 10]} {SELLER_SUFFIXES[(i // 10) % 10]} {i + 1}",
+                f"{CITIES[seller_city[i]][0]}/{CITIES[seller_city[i]][1]}",
+            )
+            for i in range(n_sellers)
+        ]
+        festivals = [e["title"] for e in events if e["is_festival"]] or ["Festival"]
+        artist_weights = _zipf_weights(len(artists))
+        seller_weights = _zipf_weights(n_sellers, 0.9)
+        platform_names = [name for name, _ in PLATFORMS]
+        platform_weights = [weight for _, weight in PLATFORMS]
+
+        for start in range(0, total, BATCH_SIZE):
+            size = min(BATCH_SIZE, total - start)
+            kind = rng.random(size)  # < 0.75 artist merch, < 0.8 festival, else generic
+            artist_index = rng.choice(len(artists), size=size, p=artist_weights)
+            seller_index = rng.choice(n_sellers, size=size, p=seller_weights)
+            platform_index = rng.choice(len(platform_names), size=size, p=platform_weights)
+            price = _price(np.clip(rng.lognormal(np.log(45), 0.35, size), 19, 249))
+            discounted = rng.random(size) < 0.55
+            original = _price(price * rng.uniform(1.15, 1.6, size))
+            popularity = np.array([artists[j]["popularity_score"] for j in artist_index]) / 100
+            sold = np.minimum((rng.pareto(1.2, size) * 25 * (0.3 + popularity)).astype(int), 250_000)
+            rated = rng.random(size) > 0.08
+            rating = np.round(np.clip(rng.normal(4.6, 0.25, size), 3.0, 5.0), 1)
+            reviews = rng.binomial(sold, 0.12)
+            style = rng.integers(0, len(PRODUCT_STYLES), size)
+            generic = rng.integers(0, len(GENERIC_TITLES), size)
+            festival_index = rng.integers(0, len(festivals), size)
+            seen_days = rng.uniform(0, 365, size)
+            scraped_days = seen_days * rng.random(size)
+
+            batch = []
+            for k in range(size):
+                product_id = start + k + 1
+                artist = artists[artist_index[k]]["name"] if kind[k] < 0.75 else None
+                related_event = festivals[festival_index[k]] if 0.75 <= kind[k] < 0.8 else None
+                if artist:
+                    title = f"Camiseta {artist} {PRODUCT_STYLES[style[k]]}"
+                    category = "camiseta_banda"
+                elif related_event:
+                    title = f"Camiseta {related_event} {PRODUCT_STYLES[style[k]]}"
+                    category = "camiseta_festival"
+                else:
+                    title = f"{GENERIC_TITLES[generic[k]]} {PRODUCT_STYLES[style[k]]}"
+                    category = "camiseta_generica"
+                platform = platform_names[platform_index[k]]
+                seller_name, seller_location = sellers[seller_index[k]]
+                first_seen = self._days_ago(seen_days[k])
+                scraped = self._days_ago(scraped_days[k])
+                batch.append({
+                    "id": product_id,
+                    "title": title,
+                    "product_url": f"https://{platform}.synthetic/p/{product_id}",
+                    "external_id": str(product_id),
+                    "price": float(price[k]),
+                    "original_price": float(original[k]) if discounted[k] else None,
+                    "sold_count": int(sold[k]),
+                    "rating": float(rating[k]) if rated[k] else None,
+                    "review_count": int(reviews[k]),
+                    "seller_name": seller_name,
+                    "seller_location": seller_location,
+                    "platform": platform,
+                    "category": category,
+                    "related_artist": artist,
+                    "related_event": related_event,
+                    "search_term": f"camiseta {(artist or related_event or 'banda').lower()}",
+                    "first_seen_at": first_seen,
+                    "last_scraped_at": scraped,
+                    "created_at": first_seen,
+                    "updated_at": scraped,
+                })
+            yield batch
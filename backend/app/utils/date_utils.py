@@ -74,3 +74,13 @@ def normalize_artist_name(name: str) -> str:
     name = re.sub(r"\([^)]*\)", "", name)
     name = re.sub(r"[^a-z0-9]", "", name)
     return name.strip()
+
+
+def canonical_key(value: str | None) -> str | None:
+    """Accent-folded, lowercased lookup key: "São  Paulo" -> "sao paulo"."""
+    if not value:
+        return None
+    value = unicodedata.normalize("NFKD", value)
+    value = value.encode("ascii", "ignore").decode("ascii").lower()
+    value = re.sub(r"[^a-z0-9]+", " ", value).strip()
+    return value or None
@@ -0,0 +1,97 @@
+"""Keyset (cursor) pagination.
+
+A cursor records the sort order and the sort value plus id of the last row
+on a page; the next page starts strictly after that row. Unlike OFFSET the
+database seeks straight to the position through the sort index, so page 500
+costs the same as page 1.
+"""
+
+import base64
+import json
+from dataclasses import dataclass
+from datetime import datetime
+
+from sqlalchemy import and_, tuple_
+from sqlalchemy.orm import Query
+from sqlalchemy.sql.elements import ColumnElement
+
+
+@dataclass
+class Keyset:
+    """A sort order over ``column`` with ``id_column`` as the tiebreaker.
+
+    The id runs in the same direction as the sort column so a single-column
+    index (which stores the rowid after the key) serves the whole ordering.
+    A ``nullable`` column must be descending; its NULLs come last, which is
+    SQLite's native order for DESC.
+    """
+
+    name: str
+    column: ColumnElement
+    id_column: ColumnElement
+    descending: bool = False
+    nullable: bool = False
+
+    def order_by(self) -> list:
+        if self.descending:
+            column = self.column.desc()
+            if self.nullable:
+                column = column.nullslast()
+            return [column, self.id_column.desc()]
+        return [self.column.asc(), self.id_column.asc()]
+
+    def after(self, value, last_id: int) -> ColumnElement:
+        """Predicate selecting non-NULL rows (or, after a NULL, NULL rows) past (value, last_id)."""
+        if value is None:
+            return and_(self.column.is_(None), self.id_column < last_id)
+        pair, bound = tuple_(self.column, self.id_column), tuple_(value, last_id)
+        return pair < bound if self.descending else pair > bound
+
+    def paginate(
+        self, query: Query, cursor: str | None, limit: int, offset: int = 0
+    ) -> tuple[list, str | None]:
+        """One page of ``query`` after ``cursor`` (or at ``offset``), plus the next cursor.
+
+        ``query`` must select the entity first and the sort column second,
+        e.g. ``db.query(Event, Event.event_date)``.
+        """
+        if cursor:
+            value, last_id = decode_cursor(cursor, self.name)
+            rows = self._fetch(query.filter(self.after(value, last_id)), limit + 1)
+            if self.nullable and value is not None and len(rows) <= limit:
+                # The NULL tail is a separate seek: OR-ing it into the range
+                # predicate would stop SQLite from seeking the index at all
+                rows += self._fetch(query.filter(self.column.is_(None)), limit + 1 - len(rows))
+        else:
+            rows = self._fetch(query, limit + 1, offset)
+
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            entity, value = rows[-1][0], rows[-1][1]
+            next_cursor = encode_cursor(self.name, value, entity.id)
+        return [row[0] for row in rows], next_cursor
+
+    def _fetch(self, query: Query, limit: int, offset: int = 0) -> list:
+        return query.order_by(*self.order_by()).offset(offset).limit(limit).all()
+
+
+def encode_cursor(sort: str, value, last_id: int) -> str:
+    if isinstance(value, datetime):
+        value = {"dt": value.isoformat()}
+    payload = json.dumps([sort, value, last_id], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, sort: str) -> tuple:
+    """(value, last_id) from ``cursor``; ValueError when malformed or from another sort."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        cursor_sort, value, last_id = json.loads(base64.urlsafe_b64decode(padded))
+        if isinstance(value, dict):
+            value = datetime.fromisoformat(value["dt"])
+    except (ValueError, TypeError, KeyError) as e:
+        raise ValueError("Invalid cursor") from e
+    if cursor_sort != sort or not isinstance(last_id, int):
+        raise ValueError(f"Cursor does not belong to sort order '{sort}'")
+    return value, last_id
@@ -0,0 +1,71 @@
+"""Scraping jobs of the ``worker`` and ``scheduler`` roles (see ``run.py``).
+
+Nothing here imports the FastAPI app or its routes: a worker process loads
+the database layer, the services and the scrapers it runs, and no more.
+"""
+
+import asyncio
+from datetime import datetime
+
+from app.config import settings
+from app.database import ReadSessionLocal, init_db
+from app.db_writer import db_writer
+from app.utils.logger import setup_logger
+
+logger = setup_logger("worker")
+
+
+async def scrape_once(platforms: list[str] | None = None) -> dict:
+    """One scraping pass over the enabled platforms, then a rescore for today."""
+    from app.services.analysis_service import AnalysisService
+    from app.services.scraping_service import ScrapingService
+
+    db = ReadSessionLocal()
+    try:
+        result = await ScrapingService(db).run_scraping(platforms=platforms)
+    finally:
+        db.close()
+    # Hype and production windows move with the calendar, not only with new data
+    await db_writer.run(lambda session: AnalysisService(session).recalculate_all())
+    logger.info(result["message"])
+    return result
+
+
+def run_worker(platforms: list[str] | None = None) -> dict:
+    """The ``worker`` role: one pass, then exit."""
+    init_db()
+    try:
+        return asyncio.run(scrape_once(platforms))
+    finally:
+        db_writer.stop(timeout=30)
+
+
+def run_scheduler():
+    """The ``scheduler`` role: a pass now and every SCRAPING_INTERVAL_HOURS."""
+    from apscheduler.schedulers.asyncio import AsyncIOScheduler
+
+    init_db()
+
+    async def main():
+        scheduler = AsyncIOScheduler()
+        scheduler.add_job(
+            scrape_once,
+            "interval",
+            hours=settings.SCRAPING_INTERVAL_HOURS,
+            next_run_time=datetime.now(),
+            max_instances=1,
+            coalesce=True,
+        )
+        scheduler.start()
+        logger.info(f"Scraping every {settings.SCRAPING_INTERVAL_HOURS}h")
+        try:
+            await asyncio.Event().wait()
+        finally:
+            scheduler.shutdown(wait=False)
+
+    try:
+        asyncio.run(main())
+    except KeyboardInterrupt:
+        pass
+    finally:
+        db_writer.stop(timeout=30)
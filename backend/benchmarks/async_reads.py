@@ -0,0 +1,130 @@
+"""Load test of the read routes: threadpool Sessions vs. ASYNC_READS.
+
+Usage (from backend/):
+    python -m benchmarks.async_reads [--requests 2000] [--concurrency 128] [--database PATH]
+
+Builds a scratch SQLite database (or uses ``--database``), then for each
+mode starts a fresh interpreter with ``ASYNC_READS`` set accordingly and
+drives the app in-process through httpx's ASGI transport: ``--concurrency``
+clients issue ``--requests`` GETs over the list, detail, rankings and stats
+routes. The response cache is disabled so every request reaches the
+database. Prints one JSON line per mode (throughput, p50/p95/p99 latency).
+So far ASYNC_READS comes out slower on SQLite, which is why it is off by
+default and marked experimental.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+PATHS = [
+    "/api/v1/events/?page_size=50",
+    "/api/v1/events/?city=sao%20paulo&page_size=20",
+    "/api/v1/events/1",
+    "/api/v1/rankings/?limit=20",
+    "/api/v1/dashboard/stats",
+    "/api/v1/marketplace/products?page_size=30",
+    "/api/v1/marketplace/products?sort_by=price_asc&platform=shopee",
+    "/api/v1/marketplace/stats",
+]
+
+
+def _build_database(path: str):
+    from sqlalchemy.orm import sessionmaker
+
+    from app.database import SQLITE_PROFILES, Base, create_db_engine
+    from app.search_index import ensure_search_index
+    from benchmarks.query_plans import _populate
+
+    engine = create_db_engine(f"sqlite:///{path}", SQLITE_PROFILES["tuned"])
+    Base.metadata.create_all(bind=engine)
+    ensure_search_index(engine)
+    _populate(sessionmaker(bind=engine, autoflush=False))
+    engine.dispose()
+
+
+async def _drive(requests: int, concurrency: int) -> dict:
+    import httpx
+
+    from app.main import app
+
+    latencies: list[float] = []
+    errors = 0
+    counter = iter(range(requests))
+
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://bench") as client:
+        # Warm the connection pools and the planner
+        for path in PATHS:
+            await client.get(path)
+
+        async def worker():
+            nonlocal errors
+            for i in counter:
+                start = time.perf_counter()
+                response = await client.get(PATHS[i % len(PATHS)])
+                latencies.append(time.perf_counter() - start)
+                if response.status_code != 200:
+                    errors += 1
+
+        start = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        elapsed = time.perf_counter() - start
+
+    latencies.sort()
+
+    def pct(p: float) -> float:
+        return round(latencies[min(int(p / 100 * len(latencies)), len(latencies) - 1)] * 1000, 2)
+
+    return {
+        "requests": requests,
+        "concurrency": concurrency,
+        "errors": errors,
+        "seconds": round(elapsed, 3),
+        "throughput_rps": round(requests / elapsed, 1),
+        "p50_ms": pct(50),
+        "p95_ms": pct(95),
+        "p99_ms": pct(99),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare the sync and async read paths under load")
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=128)
+    parser.add_argument("--database", help="existing SQLite file (default: a scratch one)")
+    parser.add_argument("--child", choices=["sync", "async"], help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        result = asyncio.run(_drive(args.requests, args.concurrency))
+        print(json.dumps({"mode": args.child, **result}))
+        return
+
+    database = args.database
+    if database is None:
+        database = os.path.join(tempfile.mkdtemp(prefix="async_reads_"), "bench.db")
+        _build_database(database)
+
+    for mode in ("sync", "async"):
+        env = {
+            **os.environ,
+            "DATABASE_URL": f"sqlite:///{database}",
+            "ASYNC_READS": "true" if mode == "async" else "false",
+            "RESPONSE_CACHE_SIZE": "0",
+            "LOG_LEVEL": "WARNING",
+        }
+        subprocess.run(
+            [sys.executable, "-m", "benchmarks.async_reads", "--child", mode,
+             "--requests", str(args.requests), "--concurrency", str(args.concurrency)],
+            env=env,
+            check=True,
+        )
+
+
+if __name__ == "__main__":
+    main()
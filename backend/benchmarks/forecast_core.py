@@ -0,0 +1,165 @@
+"""Vectorized forecast core vs. the per-row formulas.
+
+Usage (from backend/):
+    python -m benchmarks.forecast_core [--events 100000] [--seed 7]
+
+Generates columnar event and artist inputs, runs ``app.forecasting`` and
+the row-by-row reference formulas (as ``MarketplaceService`` computed them
+before vectorization), and exits non-zero unless every output, rounded
+display values included, is bit-for-bit equal. Prints both timings.
+"""
+
+import argparse
+import random
+import sys
+import time
+
+import numpy as np
+
+from app import forecasting
+from app.forecasting import CostParameters, py_round
+
+STATUSES = [None, "available", "selling_fast", "sold_out", "cancelled"]
+
+
+def _reference_event(audience, hype_score, ticket_status, is_festival, avg_price, params):
+    PRODUCTION_COST = params.production_cost
+    MARKETPLACE_FEE_PCT = params.marketplace_fee_pct
+    BASE_CONVERSION_RATE = params.base_conversion_rate
+
+    status_mult = {"sold_out": 1.8, "selling_fast": 1.4, "available": 1.0}.get(ticket_status or "", 1.0)
+    festival_mult = 1.3 if is_festival else 1.0
+    hype_mult = 1.0 + (hype_score / 200)
+    conversion_rate = BASE_CONVERSION_RATE * status_mult * festival_mult * hype_mult
+    projected_units = int(audience * conversion_rate)
+    suggested_price = round(max(avg_price * 0.9, PRODUCTION_COST * 2.5), 2) if avg_price > 0 else 37.50
+    projected_revenue = projected_units * suggested_price
+    net_per_unit = suggested_price - PRODUCTION_COST - (suggested_price * MARKETPLACE_FEE_PCT)
+    projected_profit = projected_units * net_per_unit
+    return (
+        round(conversion_rate * 100, 2),
+        projected_units,
+        suggested_price,
+        round(projected_revenue, 2),
+        round(projected_profit, 2),
+    )
+
+
+def _reference_artist(products_count, price_sum, total_sold, grand_total_sold, params):
+    PRODUCTION_COST = params.production_cost
+    MARKETPLACE_FEE_PCT = params.marketplace_fee_pct
+
+    avg_price = round(price_sum / products_count, 2)
+    market_share = (total_sold / grand_total_sold * 100) if grand_total_sold > 0 else 0
+    est_monthly_units = int(total_sold / 3)
+    est_monthly_revenue = est_monthly_units * avg_price
+    suggested_price = round(max(avg_price * 0.9, PRODUCTION_COST * 2.5), 2)
+    net_per_unit = suggested_price - PRODUCTION_COST - (suggested_price * MARKETPLACE_FEE_PCT)
+    profit_margin = (net_per_unit / suggested_price * 100) if suggested_price > 0 else 0
+    if total_sold > 10000 and products_count >= 3:
+        growth = "alto"
+    elif total_sold > 5000 or products_count >= 3:
+        growth = "medio"
+    else:
+        growth = "baixo"
+    return (
+        avg_price,
+        round(est_monthly_revenue, 2),
+        est_monthly_units,
+        round(market_share, 1),
+        growth,
+        suggested_price,
+        round(profit_margin, 1),
+    )
+
+
+def _bits(values) -> list:
+    """Exact comparison keys: floats by their bit pattern, everything else as is."""
+    return [np.float64(v).view(np.int64).item() if isinstance(v, float) else v for v in values]
+
+
+def check(n_events: int, seed: int) -> list[str]:
+    rng = random.Random(seed)
+    params = CostParameters.from_settings()
+    failures = []
+
+    # Prices on a cent grid, like scraped prices, so rounding ties do occur
+    audience = [rng.choice([0, rng.randint(50, 90000)]) for _ in range(n_events)]
+    hype = [rng.choice([0.0, 50.0, rng.uniform(0, 100)]) for _ in range(n_events)]
+    status = [rng.choice(STATUSES) for _ in range(n_events)]
+    festival = [rng.random() < 0.1 for _ in range(n_events)]
+    avg_price = [rng.choice([0, rng.randint(500, 15000) / 100, rng.uniform(5, 150)]) for _ in range(n_events)]
+
+    start = time.perf_counter()
+    expected = [
+        _reference_event(*row, params) for row in zip(audience, hype, status, festival, avg_price)
+    ]
+    reference_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    projected = forecasting.project_events(
+        np.array(audience, dtype=np.int64),
+        np.array(hype, dtype=np.float64),
+        status,
+        np.array(festival, dtype=bool),
+        np.array(avg_price, dtype=np.float64),
+        params,
+    )
+    got_columns = [
+        py_round(projected["conversion_rate"] * 100, 2).tolist(),
+        projected["projected_units"].tolist(),
+        projected["suggested_price"].tolist(),
+        py_round(projected["projected_revenue"], 2).tolist(),
+        py_round(projected["projected_profit"], 2).tolist(),
+    ]
+    vector_seconds = time.perf_counter() - start
+
+    names = ("conversion_rate_pct", "projected_units", "suggested_price", "projected_revenue", "projected_profit")
+    for i, name in enumerate(names):
+        want = [row[i] for row in expected]
+        if _bits(want) != _bits(got_columns[i]):
+            mismatches = sum(a != b for a, b in zip(_bits(want), _bits(got_columns[i])))
+            failures.append(f"events.{name}: {mismatches} rows differ")
+    print(f"events   n={n_events}: per-row {reference_seconds:.3f}s, vectorized {vector_seconds:.3f}s")
+
+    n_artists = max(n_events // 100, 10)
+    products = [rng.randint(1, 40) for _ in range(n_artists)]
+    price_sum = [sum(rng.randint(1000, 12000) / 100 for _ in range(count)) for count in products]
+    sold = [rng.randint(0, 30000) for _ in range(n_artists)]
+    grand = sum(sold)
+    expected = [_reference_artist(*row, grand, params) for row in zip(products, price_sum, sold)]
+    projected = forecasting.project_artists(
+        np.array(products), np.array(price_sum), np.array(sold), params
+    )
+    got_columns = [
+        projected["avg_price"].tolist(),
+        py_round(projected["estimated_monthly_revenue"], 2).tolist(),
+        projected["estimated_units_per_month"].tolist(),
+        py_round(projected["market_share_pct"], 1).tolist(),
+        projected["growth_potential"].tolist(),
+        projected["suggested_price"].tolist(),
+        py_round(projected["profit_margin_pct"], 1).tolist(),
+    ]
+    for i in range(len(got_columns)):
+        want = [row[i] for row in expected]
+        if _bits(want) != _bits(got_columns[i]):
+            failures.append(f"artists.column{i}: differs")
+    return failures
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Check the vectorized forecast core against the per-row formulas")
+    parser.add_argument("--events", type=int, default=100_000)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    failures = check(args.events, args.seed)
+    for failure in failures:
+        print(f"MISMATCH  {failure}")
+    if failures:
+        sys.exit(1)
+    print("OK: vectorized results are bit-for-bit equal")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,141 @@
+"""/health latency while a large scrape is ingested.
+
+Usage (from backend/):
+    python -m benchmarks.ingest_latency [--records 5000] [--max-p99-ms 50] [--max-ms 250]
+
+Runs the app in-process against a scratch SQLite database, registers a
+fake event scraper whose ``stream()`` yields ``--records`` events in pages,
+and POSTs /api/v1/scraping/trigger for it while another task polls /health
+every ``--interval-ms``. Writes, rescoring and the stats refresh all run on
+the db_writer thread, so the event loop must keep answering. Prints one JSON
+line and exits non-zero if the /health p99 or max latency during the ingest
+exceeds its bound.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+PAGE_SIZE = 50
+
+
+class FakeScraper:
+    """Event scraper that yields ``records`` synthetic events, one page per loop turn."""
+
+    records = 5000
+
+    async def stream(self):
+        start = datetime(2027, 1, 1, 20, 0)
+        for i in range(self.records):
+            if i % PAGE_SIZE == 0:
+                # Stand-in for a page download: hand the loop back
+                await asyncio.sleep(0.001)
+            yield {
+                "title": f"Artist {i % 700} - Tour {i}",
+                "artist_name": f"Artist {i % 700}",
+                "venue_name": f"Venue {i % 90}",
+                "city": ("Sao Paulo", "Rio de Janeiro", "Curitiba", "Recife")[i % 4],
+                "state": ("SP", "RJ", "PR", "PE")[i % 4],
+                "event_date": start + timedelta(hours=7 * i),
+                "source_platform": "fake",
+                "source_url": f"https://example.test/events/{i}",
+                "external_id": str(i),
+                "ticket_status": ("available", "few_left", "sold_out")[i % 3],
+                "estimated_audience": 500 + (i * 37) % 20000,
+                "ticket_price_min": 80.0 + i % 200,
+                "ticket_price_max": 200.0 + i % 400,
+                "event_type": "concert",
+                "is_festival": False,
+            }
+
+
+def _percentile(values: list[float], p: float) -> float:
+    ordered = sorted(values)
+    return round(ordered[min(int(p / 100 * len(ordered)), len(ordered) - 1)] * 1000, 2)
+
+
+async def _run(records: int, interval: float) -> dict:
+    import httpx
+
+    from app.main import app
+    from app.services.scraping_service import EVENT_SCRAPERS
+    from benchmarks import ingest_latency
+
+    # load_scraper imports by path, so configure the importable copy of this module
+    ingest_latency.FakeScraper.records = records
+    EVENT_SCRAPERS["fake"] = "benchmarks.ingest_latency:FakeScraper"
+
+    async with app.router.lifespan_context(app):
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=600) as client:
+            while (ready := await client.get("/ready")).status_code != 200:
+                if ready.json()["status"] == "failed":
+                    raise RuntimeError(f"Startup seeding failed: {ready.json()['error']}")
+                await asyncio.sleep(0.05)
+            await client.get("/health")
+
+            latencies: list[float] = []
+            done = asyncio.Event()
+
+            async def poll():
+                while not done.is_set():
+                    start = time.perf_counter()
+                    response = await client.get("/health")
+                    latencies.append(time.perf_counter() - start)
+                    response.raise_for_status()
+                    await asyncio.sleep(interval)
+
+            poller = asyncio.create_task(poll())
+            start = time.perf_counter()
+            response = await client.post("/api/v1/scraping/trigger", json={"platforms": ["fake"]})
+            ingest_seconds = time.perf_counter() - start
+            done.set()
+            await poller
+
+    response.raise_for_status()
+    detail = response.json()["details"][0]
+    return {
+        "records": records,
+        "new": detail.get("new"),
+        "status": detail.get("status"),
+        "ingest_seconds": round(ingest_seconds, 2),
+        "health_requests": len(latencies),
+        "health_p50_ms": _percentile(latencies, 50),
+        "health_p99_ms": _percentile(latencies, 99),
+        "health_max_ms": round(max(latencies) * 1000, 2),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Check /health latency during a large ingest")
+    parser.add_argument("--records", type=int, default=5000)
+    parser.add_argument("--interval-ms", type=float, default=10.0, help="pause between /health polls")
+    parser.add_argument("--max-p99-ms", type=float, default=50.0)
+    parser.add_argument("--max-ms", type=float, default=250.0)
+    args = parser.parse_args()
+
+    # Settings are read at import, so point the app at a scratch database first
+    os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(tempfile.mkdtemp(prefix='ingest_latency_'), 'bench.db')}"
+    os.environ.setdefault("LOG_LEVEL", "WARNING")
+    os.environ.setdefault("RESPONSE_CACHE_WARMUP", "false")
+
+    result = asyncio.run(_run(args.records, args.interval_ms / 1000))
+    failures = []
+    if result["status"] != "success" or result["new"] != args.records:
+        failures.append(f"ingest {result['status']} with {result['new']} of {args.records} new")
+    if result["health_p99_ms"] > args.max_p99_ms:
+        failures.append(f"p99 {result['health_p99_ms']} ms > {args.max_p99_ms} ms")
+    if result["health_max_ms"] > args.max_ms:
+        failures.append(f"max {result['health_max_ms']} ms > {args.max_ms} ms")
+    print(json.dumps({**result, "ok": not failures}))
+    if failures:
+        sys.exit("FAIL: " + "; ".join(failures))
+
+
+if __name__ == "__main__":
+    main()
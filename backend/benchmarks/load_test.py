@@ -0,0 +1,355 @@
+"""Load test of every /api/v1 endpoint at several dataset scales.
+
+Usage (from backend/):
+    python -m benchmarks.load_test [--scales 0.01,0.1,1] [--requests 200] [--concurrency 16]
+        [--cache app] [--endpoint events.list ...] [--data-dir DIR] [-o results.json]
+
+For each scale a synthetic database is generated with ``app.synthetic``
+(kept in ``--data-dir`` and reused by later runs). A fresh interpreter
+then serves the app on it in-process through httpx's ASGI transport.
+Each endpoint gets ``--requests`` calls from ``--concurrency`` clients,
+drawing query parameters from a realistic mix (filters, sorts, deep pages,
+search terms, forecast horizons and cost overrides). New calls stop after
+``--max-seconds`` per endpoint.
+
+Reported per endpoint:
+- latency p50/p95/p99/max;
+- throughput;
+- SQL statements per request (all engines);
+- peak RSS while it ran (VmHWM, reset between endpoints on Linux). Each
+  read connection maps up to SQLITE_MMAP_SIZE of the file, and those pages
+  count as RSS, so ``rss_anon_mb`` (heap only, at the end) is also given.
+
+``--cache`` sets what stays on:
+- ``app`` (default): the service caches, without the whole-response cache;
+- ``all``: the response cache too;
+- ``none``: nothing.
+
+Scraping triggers and the remote test fetch are left out. The output is
+one JSON document (stdout or ``-o``).
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import date, timedelta
+
+EXCLUDED = {
+    ("post", "/api/v1/scraping/trigger"): "scrapes remote sites",
+    ("post", "/api/v1/marketplace/scrape"): "scrapes remote sites",
+    ("get", "/api/v1/scraping/test-fetch"): "fetches a remote site",
+}
+
+CACHE_MODES = {
+    "none": {"RESPONSE_CACHE_SIZE": "0", "FORECAST_CACHE_SIZE": "0", "COUNT_CACHE_SIZE": "0"},
+    "app": {"RESPONSE_CACHE_SIZE": "0"},
+    "all": {},
+}
+
+
+def _scenarios(ctx: dict) -> dict:
+    """name -> (method, path, draw(rng) -> (query params, JSON body))."""
+    today = date.today()
+
+    def pick(rng, values):
+        return values[int(rng.integers(len(values)))]
+
+    def event_id(rng):
+        return int(rng.integers(1, ctx["events"] + 1))
+
+    def events_list(rng):
+        return pick(rng, [
+            {"page_size": 50},
+            {"page_size": 20, "city": pick(rng, ctx["cities"])},
+            {"genre": pick(rng, ctx["genres"]), "min_hype": 40},
+            {"date_from": today.isoformat(), "date_to": (today + timedelta(days=90)).isoformat()},
+            {"state": "SP", "min_sales_potential": 50, "page": 3},
+            {"q": pick(rng, ctx["artists"]).split()[0].lower()},
+            {"page": int(rng.integers(1, 40)), "page_size": 50},
+            {"city": pick(rng, ctx["cities"]), "count_mode": "estimated"},
+        ]), None
+
+    def products(rng):
+        return pick(rng, [
+            {"page_size": 30},
+            {"platform": pick(rng, ["shopee", "mercadolivre"]), "sort_by": pick(rng, ["price_asc", "price_desc", "rating"])},
+            {"related_artist": pick(rng, ctx["artists"])},
+            {"search": pick(rng, ctx["artists"]).lower()},
+            {"min_price": 30, "max_price": 60, "min_sold": 100},
+            {"category": "camiseta_festival", "page": int(rng.integers(1, 20))},
+            {"page": int(rng.integers(1, 200)), "page_size": 30},
+            {"platform": "shopee", "count_mode": "estimated"},
+        ]), None
+
+    def costs(rng):
+        return pick(rng, [
+            {},
+            {"production_cost": pick(rng, [12.0, 15.0, 18.0])},
+            {"marketplace_fee_pct": pick(rng, [0.1, 0.12, 0.16]), "conversion_rate": pick(rng, [0.01, 0.02, 0.03])},
+        ])
+
+    def forecast(rng):
+        params = {"days": pick(rng, [30, 90, 180, 365]), **costs(rng)}
+        if rng.random() < 0.5:
+            params["limit"] = 50
+        return params, None
+
+    def simulate(rng):
+        return {}, {
+            "days": pick(rng, [30, 90]),
+            "draws": 500,
+            "conversion_rate": {"kind": "uniform", "low": 0.01, "high": 0.03},
+            "price_factor": {"kind": "normal", "mean": 1.0, "std": 0.1},
+        }
+
+    return {
+        "events.list": ("get", "/api/v1/events/", events_list),
+        "events.detail": ("get", "/api/v1/events/{event_id}", lambda rng: ({}, None)),
+        "rankings": ("get", "/api/v1/rankings/", lambda rng: (
+            {"metric": pick(rng, ["sales_potential_score", "hype_score"]), "limit": pick(rng, [10, 20, 100])}, None)),
+        "dashboard.stats": ("get", "/api/v1/dashboard/stats", lambda rng: ({}, None)),
+        "dashboard.months": ("get", "/api/v1/dashboard/months", lambda rng: ({"months": pick(rng, [3, 6, 12])}, None)),
+        "scraping.logs": ("get", "/api/v1/scraping/logs", lambda rng: ({"limit": pick(rng, [20, 100])}, None)),
+        "scraping.pipelines": ("get", "/api/v1/scraping/pipelines", lambda rng: ({}, None)),
+        "marketplace.products": ("get", "/api/v1/marketplace/products", products),
+        "marketplace.stats": ("get", "/api/v1/marketplace/stats", lambda rng: ({}, None)),
+        "marketplace.projection": ("get", "/api/v1/marketplace/projection", lambda rng: (costs(rng), None)),
+        "marketplace.event-forecast": ("get", "/api/v1/marketplace/event-forecast", forecast),
+        "marketplace.forecast-stats": ("get", "/api/v1/marketplace/forecast-stats", lambda rng: ({}, None)),
+        "marketplace.simulate": ("post", "/api/v1/marketplace/simulate", simulate),
+        "export.events": ("get", "/api/v1/export/events", lambda rng: (
+            {"city": pick(rng, ctx["cities"]), "min_hype": 60}, None)),
+        "export.snapshots": ("get", "/api/v1/export/snapshots", lambda rng: ({"event_id": event_id(rng)}, None)),
+        "export.products": ("get", "/api/v1/export/products", lambda rng: (
+            {"related_artist": pick(rng, ctx["artists"]), "format": "csv"}, None)),
+    }, event_id
+
+
+def _context(database: str) -> dict:
+    import sqlite3
+
+    conn = sqlite3.connect(f"file:{database}?mode=ro", uri=True)
+    try:
+        return {
+            "events": conn.execute("SELECT max(id) FROM events").fetchone()[0] or 1,
+            "cities": [row[0] for row in conn.execute("SELECT DISTINCT city FROM venues ORDER BY city")],
+            "genres": [row[0] for row in conn.execute("SELECT DISTINCT genre FROM artists WHERE genre IS NOT NULL ORDER BY genre")],
+            # The most popular artists, which most filters and searches are about
+            "artists": [row[0] for row in conn.execute("SELECT name FROM artists ORDER BY popularity_score DESC LIMIT 50")],
+            "rows": {
+                table: conn.execute(f"SELECT count(*) FROM {table}").fetchone()[0]
+                for table in ("events", "event_snapshots", "marketplace_products", "artists", "venues")
+            },
+        }
+    finally:
+        conn.close()
+
+
+def _memory_mb() -> dict:
+    """Peak RSS, and the current anonymous part of it (without SQLite's mmap'd pages)."""
+    memory = {"peak_rss_mb": round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1), "rss_anon_mb": None}
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith("VmHWM:"):
+                    memory["peak_rss_mb"] = round(int(line.split()[1]) / 1024, 1)
+                elif line.startswith("RssAnon:"):
+                    memory["rss_anon_mb"] = round(int(line.split()[1]) / 1024, 1)
+    except OSError:
+        pass
+    return memory
+
+
+def _reset_peak_rss():
+    try:
+        with open("/proc/self/clear_refs", "w") as f:
+            f.write("5")
+    except OSError:
+        pass  # Not Linux: the peak stays the process-wide one
+
+
+async def _run_endpoint(client, method, path, draw, event_id, rng, requests, concurrency, max_seconds, counter) -> dict:
+    latencies: list[float] = []
+    statuses: dict[int, int] = {}
+    remaining = iter(range(requests))
+    deadline = time.perf_counter() + max_seconds
+    budget_limited = False
+
+    async def worker():
+        nonlocal budget_limited
+        for _ in remaining:
+            if time.perf_counter() > deadline:
+                budget_limited = True
+                return
+            params, body = draw(rng)
+            url = path.replace("{event_id}", str(event_id(rng)))
+            start = time.perf_counter()
+            response = await client.request(method.upper(), url, params=params, json=body)
+            latencies.append(time.perf_counter() - start)
+            statuses[response.status_code] = statuses.get(response.status_code, 0) + 1
+
+    _reset_peak_rss()
+    queries_before = counter["statements"]
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - start
+    done = len(latencies)
+    latencies.sort()
+
+    def pct(p: float) -> float | None:
+        if not latencies:
+            return None
+        return round(latencies[min(int(p / 100 * done), done - 1)] * 1000, 2)
+
+    return {
+        "requests": done,
+        "errors": sum(count for status, count in statuses.items() if status >= 400),
+        "status_counts": {str(status): count for status, count in sorted(statuses.items())},
+        "budget_limited": budget_limited,
+        "seconds": round(elapsed, 3),
+        "throughput_rps": round(done / elapsed, 1) if elapsed else None,
+        "p50_ms": pct(50),
+        "p95_ms": pct(95),
+        "p99_ms": pct(99),
+        "max_ms": round(latencies[-1] * 1000, 2) if latencies else None,
+        "queries_per_request": round((counter["statements"] - queries_before) / done, 2) if done else None,
+        **_memory_mb(),
+    }
+
+
+async def _child(args) -> dict:
+    import httpx
+    import numpy as np
+    from sqlalchemy import event
+    from sqlalchemy.engine import Engine
+
+    from app.main import app
+
+    counter = {"statements": 0}
+
+    @event.listens_for(Engine, "before_cursor_execute")
+    def _count(conn, cursor, statement, parameters, context, executemany):
+        counter["statements"] += 1
+
+    ctx = _context(args.database)
+    scenarios, event_id = _scenarios(ctx)
+    names = args.endpoint or list(scenarios)
+    rng = np.random.default_rng(args.seed)
+
+    results = []
+    transport = httpx.ASGITransport(app=app)
+    async with app.router.lifespan_context(app):
+        async with httpx.AsyncClient(transport=transport, base_url="http://load-test") as client:
+            for name in names:
+                method, path, draw = scenarios[name]
+                # Warm the pools, the planner and the imports this endpoint needs
+                params, body = draw(rng)
+                await client.request(method.upper(), path.replace("{event_id}", str(event_id(rng))), params=params, json=body)
+                result = await _run_endpoint(
+                    client, method, path, draw, event_id, rng,
+                    args.requests, args.concurrency, args.max_seconds, counter,
+                )
+                results.append({"endpoint": name, "method": method.upper(), "path": path, **result})
+    return {"rows": ctx["rows"], "peak_rss_mb_process": round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1), "endpoints": results}
+
+
+def _uncovered() -> list[str]:
+    """API routes with neither a scenario nor an exclusion."""
+    from app.main import app
+
+    covered = {(method, path) for method, path, _ in _scenarios({"events": 1, "cities": [""], "genres": [""], "artists": [""]})[0].values()}
+    missing = []
+    for path, operations in app.openapi()["paths"].items():
+        if not path.startswith("/api/v1"):
+            continue
+        for method in operations:
+            if (method, path) not in covered and (method, path) not in EXCLUDED:
+                missing.append(f"{method.upper()} {path}")
+    return missing
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load-test the API at several dataset scales")
+    parser.add_argument("--scales", default="0.01,0.1", help="comma-separated app.synthetic scale factors")
+    parser.add_argument("--requests", type=int, default=200, help="calls per endpoint")
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--max-seconds", type=float, default=30.0, help="stop starting calls to an endpoint after this")
+    parser.add_argument("--cache", choices=list(CACHE_MODES), default="app")
+    parser.add_argument("--endpoint", action="append", help="only these scenarios; repeatable")
+    parser.add_argument("--seed", type=int, default=0, help="dataset and parameter-mix seed")
+    parser.add_argument("--data-dir", default=os.path.join(tempfile.gettempdir(), "load_test_data"))
+    parser.add_argument("-o", "--output", help="write the JSON here instead of stdout")
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    parser.add_argument("--database", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        print(json.dumps(asyncio.run(_child(args))))
+        return
+
+    from app.synthetic import generate
+
+    scenario_names = list(_scenarios({"events": 1, "cities": [""], "genres": [""], "artists": [""]})[0])
+    unknown = set(args.endpoint or ()) - set(scenario_names)
+    if unknown:
+        parser.error(f"unknown endpoint(s): {', '.join(sorted(unknown))}; choose from {', '.join(scenario_names)}")
+
+    os.makedirs(args.data_dir, exist_ok=True)
+    runs = []
+    for scale in [float(value) for value in args.scales.split(",")]:
+        database = os.path.join(args.data_dir, f"synthetic-s{scale:g}-seed{args.seed}.db")
+        if not os.path.exists(database):
+            print(f"Generating scale {scale:g} into {database}", file=sys.stderr)
+            generate(database, scale=scale, seed=args.seed)
+        env = {
+            **os.environ,
+            "DATABASE_URL": f"sqlite:///{database}",
+            "LOG_LEVEL": "WARNING",
+            "RESPONSE_CACHE_WARMUP": "false",
+            **CACHE_MODES[args.cache],
+        }
+        command = [
+            sys.executable, "-m", "benchmarks.load_test", "--child", "--database", database,
+            "--requests", str(args.requests), "--concurrency", str(args.concurrency),
+            "--max-seconds", str(args.max_seconds), "--seed", str(args.seed),
+        ]
+        for name in args.endpoint or ():
+            command += ["--endpoint", name]
+        print(f"Running scale {scale:g}", file=sys.stderr)
+        done = subprocess.run(command, env=env, capture_output=True, text=True)
+        if done.returncode != 0:
+            sys.stderr.write(done.stderr)
+            raise SystemExit(f"load test at scale {scale:g} failed")
+        runs.append({"scale": scale, **json.loads(done.stdout.strip().splitlines()[-1])})
+
+    report = {
+        "meta": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "requests": args.requests,
+            "concurrency": args.concurrency,
+            "max_seconds": args.max_seconds,
+            "cache": args.cache,
+            "seed": args.seed,
+            "excluded": {f"{method.upper()} {path}": reason for (method, path), reason in EXCLUDED.items()},
+            "uncovered": _uncovered(),
+        },
+        "runs": runs,
+    }
+    output = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(output + "\n")
+    else:
+        print(output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,207 @@
+"""Query-plan regression check for the service layer.
+
+Usage (from backend/):
+    python -m benchmarks.query_plans [--verbose]
+
+Runs every read query of EventService, MarketplaceService and
+ScrapingService against a scratch SQLite database, captures the SQL, and
+asks SQLite for its ``EXPLAIN QUERY PLAN``. Exits non-zero when a query
+over a fact table (events, snapshots, products, logs) falls back to a full
+table scan that is not listed in ``ALLOWED_SCANS``, or when a paged list
+query sorts its whole result in a temp B-tree.
+"""
+
+import argparse
+import os
+import re
+import sys
+import tempfile
+from datetime import date, datetime, timedelta
+
+from sqlalchemy import event, text
+from sqlalchemy.orm import sessionmaker
+
+from app.database import SQLITE_PROFILES, Base, create_db_engine
+from app.models import Artist, Event, EventSnapshot, MarketplaceProduct, ScrapingLog, Venue
+from app.search_index import ensure_search_index
+from app.services.dashboard_stats_service import DashboardStatsService
+from app.services.event_service import EventService
+from app.services.marketplace_aggregate_service import MarketplaceAggregateService
+from app.services.marketplace_service import MarketplaceService
+from app.services.scraping_service import ScrapingService
+
+# Tables large enough that a full scan on the request path is a regression
+FACT_TABLES = ("events", "event_snapshots", "marketplace_products", "scraping_logs")
+
+# (case name, table) pairs whose full scan is inherent to the query
+ALLOWED_SCANS: set[tuple[str, str]] = set()
+
+# Paged list queries must read rows in index order instead of sorting everything;
+# search.* cases only sort the rows the FTS index matched
+SORTED_CASE_PREFIXES = ("events.list", "events.rankings", "marketplace.list", "scraping.logs")
+
+SCAN_RE = re.compile(r"\bSCAN (\w+)(?: AS \w+)?(.*)")
+
+
+def _cases(db) -> list[tuple[str, callable]]:
+    events = EventService(db)
+    market = MarketplaceService(db)
+    scraping = ScrapingService(db)
+    today = date.today()
+    return [
+        ("events.list", lambda: events.list_events()),
+        ("events.list_city", lambda: events.list_events(city="sao paulo")),
+        ("events.list_genre", lambda: events.list_events(genre=["rock", "pop"])),
+        ("events.list_city_genre", lambda: events.list_events(city="São Paulo,Curitiba", genre="rock")),
+        ("events.list_range", lambda: events.list_events(
+            date_from=today, date_to=today + timedelta(days=30))),
+        ("events.list_scores", lambda: events.list_events(min_hype=50, min_sales_potential=50)),
+        ("search.events", lambda: events.list_events(q="show artist")),
+        ("events.list_cursor", lambda: events.list_events(
+            cursor=events.list_events(include_total=False)["next_cursor"])),
+        ("events.detail", lambda: events.get_event_detail(1)),
+        ("events.rankings_sales", lambda: events.get_rankings("sales_potential_score")),
+        ("events.rankings_hype", lambda: events.get_rankings("hype_score")),
+        ("dashboard.stats", lambda: events.get_dashboard_stats()),
+        ("dashboard.months", lambda: DashboardStatsService(db).get_month_windows(today, 3)),
+        ("dashboard.compute", lambda: DashboardStatsService(db).compute(today)),
+        ("marketplace.list", lambda: market.list_products()),
+        ("marketplace.list_platform", lambda: market.list_products(platform="shopee")),
+        ("marketplace.list_price_asc", lambda: market.list_products(
+            platform="shopee", min_price=30, max_price=60, sort_by="price_asc")),
+        ("marketplace.list_price_desc", lambda: market.list_products(sort_by="price_desc")),
+        ("marketplace.list_rating", lambda: market.list_products(sort_by="rating")),
+        ("marketplace.list_cursor", lambda: market.list_products(
+            cursor=market.list_products(include_total=False)["next_cursor"])),
+        ("marketplace.list_price_cursor", lambda: market.list_products(
+            sort_by="price_desc",
+            cursor=market.list_products(sort_by="price_desc", include_total=False)["next_cursor"])),
+        ("marketplace.list_rating_cursor", lambda: market.list_products(
+            sort_by="rating",
+            cursor=market.list_products(sort_by="rating", include_total=False)["next_cursor"])),
+        ("marketplace.list_min_sold", lambda: market.list_products(min_sold=1000)),
+        ("search.products", lambda: market.list_products(search="camiseta artist")),
+        ("search.products_sorted", lambda: market.list_products(search="artist", sort_by="price_asc")),
+        ("marketplace.stats", lambda: market.get_stats()),
+        ("marketplace.projection", lambda: market.get_sales_projection()),
+        ("marketplace.event_forecast", lambda: market.get_event_forecast(365)),
+        ("marketplace.event_forecast_page", lambda: market.get_event_forecast(365, limit=50)),
+        ("scraping.logs", lambda: scraping.get_logs()),
+        ("scraping.logs_platform", lambda: scraping.get_logs(platform="eventbrite")),
+    ]
+
+
+def _populate(session_factory):
+    """Enough rows for the planner to prefer indexes, plus ANALYZE statistics."""
+    db = session_factory()
+    now = datetime.utcnow()
+    venues = [Venue(name=f"Venue {i}", city=["São Paulo", "Curitiba"][i % 2]) for i in range(20)]
+    artists = [
+        Artist(name=f"Artist {i}", normalized_name=f"artist{i}", genre=["rock", "pop"][i % 2])
+        for i in range(50)
+    ]
+    db.add_all(venues + artists)
+    db.flush()
+    for i in range(2000):
+        db.add(Event(
+            title=f"Show {i}",
+            artist_id=artists[i % 50].id,
+            venue_id=venues[i % 20].id,
+            event_date=now + timedelta(days=i % 400 - 30),
+            source_url=f"bench://{i}",
+            is_active=i % 10 != 0,
+            hype_score=i % 100,
+            sales_potential_score=(i * 7) % 100,
+        ))
+    for i in range(5000):
+        db.add(MarketplaceProduct(
+            title=f"Camiseta {i}",
+            product_url=f"bench://p/{i}",
+            external_id=str(i),
+            price=20 + i % 100,
+            sold_count=i * 3 % 10000,
+            rating=(i % 50) / 10,
+            platform=["shopee", "mercadolivre"][i % 2],
+            related_artist=f"Artist {i % 50}",
+            seller_name=f"Seller {i % 100}",
+        ))
+    for i in range(500):
+        db.add(ScrapingLog(platform=["eventbrite", "shopee_marketplace"][i % 2]))
+    db.flush()
+    db.add_all(EventSnapshot(event_id=i + 1, ticket_status="available") for i in range(2000))
+    db.flush()
+    # Materialized dashboard and marketplace rows, so those cases read them
+    DashboardStatsService(db).refresh()
+    MarketplaceAggregateService(db).rebuild()
+    db.commit()
+    db.execute(text("ANALYZE"))
+    db.commit()
+    db.close()
+
+
+def check(verbose: bool = False) -> list[str]:
+    workdir = tempfile.mkdtemp(prefix="query_plans_")
+    engine = create_db_engine(
+        f"sqlite:///{os.path.join(workdir, 'plans.db')}", SQLITE_PROFILES["tuned"]
+    )
+    Base.metadata.create_all(bind=engine)
+    ensure_search_index(engine)
+    Session = sessionmaker(bind=engine, autoflush=False)
+    _populate(Session)
+
+    captured: list[tuple[str, object]] = []
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _capture(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT"):
+            captured.append((statement, parameters))
+
+    failures = []
+    db = Session()
+    for name, run in _cases(db):
+        captured.clear()
+        run()
+        statements = list(captured)
+        for statement, parameters in statements:
+            rows = db.connection().exec_driver_sql(
+                f"EXPLAIN QUERY PLAN {statement}", parameters
+            ).fetchall()
+            plan = [row[-1] for row in rows]
+            if verbose:
+                print(f"-- {name}\n{statement}\n  " + "\n  ".join(plan) + "\n")
+            for detail in plan:
+                if (
+                    "TEMP B-TREE FOR ORDER BY" in detail
+                    and "LIMIT" in statement
+                    and name.startswith(SORTED_CASE_PREFIXES)
+                ):
+                    failures.append(f"{name}: sorts the full result in a temp B-tree")
+                match = SCAN_RE.search(detail)
+                if not match:
+                    continue
+                table, rest = match.group(1), match.group(2)
+                if table not in FACT_TABLES or "INDEX" in rest:
+                    continue
+                if (name, table) in ALLOWED_SCANS:
+                    continue
+                failures.append(f"{name}: full scan of {table} ({detail})")
+    db.close()
+    engine.dispose()
+    return failures
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Fail on full scans or sorts in service queries")
+    parser.add_argument("--verbose", action="store_true", help="print every statement and plan")
+    args = parser.parse_args()
+
+    failures = check(verbose=args.verbose)
+    for failure in failures:
+        print(f"PLAN REGRESSION  {failure}")
+    if failures:
+        sys.exit(1)
+    print("OK: no unexpected full scans or sorts")
+
+
+if __name__ == "__main__":
+    main()
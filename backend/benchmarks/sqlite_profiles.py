@@ -0,0 +1,120 @@
+"""Read/write throughput of each SQLite profile.
+
+Usage (from backend/):
+    python -m benchmarks.sqlite_profiles --rows 50000 --profiles default tuned
+
+Each profile gets a fresh database file. Prints one JSON object per profile.
+"""
+
+import argparse
+import json
+import os
+import random
+import tempfile
+import time
+
+from sqlalchemy import text
+from sqlalchemy.orm import sessionmaker
+
+from app.database import SQLITE_PROFILES, Base, create_db_engine
+from app.models import MarketplaceProduct, ScrapingLog  # noqa: F401
+from app.services.marketplace_service import MarketplaceService
+from app.services.product_upsert_service import ProductUpsertService
+
+ARTISTS = ["AC/DC", "Metallica", "Bad Bunny", "The Weeknd", "Doja Cat", "Interpol", None]
+
+
+def _products(count: int, rng: random.Random) -> list[dict]:
+    return [
+        {
+            "title": f"Camiseta {rng.choice(ARTISTS) or 'Rock'} modelo {i}",
+            "product_url": f"https://shopee.com.br/bench-i.{i}",
+            "external_id": str(i),
+            "platform": rng.choice(["shopee", "mercadolivre"]),
+            "price": round(rng.uniform(25, 120), 2),
+            "sold_count": rng.randint(0, 20000),
+            "rating": round(rng.uniform(3, 5), 1),
+            "seller_name": f"Loja {rng.randint(1, 300)}",
+            "related_artist": rng.choice(ARTISTS),
+            "category": "camiseta_banda",
+        }
+        for i in range(count)
+    ]
+
+
+def run_profile(profile: str, rows: int, reads: int, seed: int) -> dict:
+    rng = random.Random(seed)
+    workdir = tempfile.mkdtemp(prefix=f"bench_{profile}_")
+    url = f"sqlite:///{os.path.join(workdir, 'bench.db')}"
+    pragmas = SQLITE_PROFILES[profile]
+
+    write_engine = create_db_engine(url, pragmas)
+    Base.metadata.create_all(bind=write_engine)
+    read_engine = create_db_engine(url, pragmas, read_only=True)
+    WriteSession = sessionmaker(bind=write_engine, autoflush=False)
+    ReadSession = sessionmaker(bind=read_engine, autoflush=False)
+
+    # Bulk ingest: one commit per upsert batch
+    records = _products(rows, rng)
+    session = WriteSession()
+    start = time.perf_counter()
+    upserter = ProductUpsertService(session)
+    for i in range(0, rows, upserter.batch_size):
+        upserter.upsert(records[i:i + upserter.batch_size])
+        session.commit()
+    bulk_seconds = time.perf_counter() - start
+
+    # Small transactions: one row per commit, where synchronous/journal mode dominate
+    commits = 500
+    start = time.perf_counter()
+    for _ in range(commits):
+        session.execute(
+            text(
+                "INSERT INTO scraping_logs (platform, events_found, events_new, "
+                "events_updated, started_at) VALUES ('bench', 0, 0, 0, CURRENT_TIMESTAMP)"
+            )
+        )
+        session.commit()
+    commit_seconds = time.perf_counter() - start
+    session.close()
+
+    # Mixed reads through the service layer
+    read_session = ReadSession()
+    service = MarketplaceService(read_session)
+    start = time.perf_counter()
+    for _ in range(reads):
+        service.list_products(
+            platform=rng.choice([None, "shopee"]),
+            min_price=rng.choice([None, 40.0]),
+            sort_by=rng.choice([None, "price_asc", "rating"]),
+            page=rng.randint(1, 20),
+        )
+    read_seconds = time.perf_counter() - start
+    read_session.close()
+
+    write_engine.dispose()
+    read_engine.dispose()
+
+    return {
+        "profile": profile,
+        "rows": rows,
+        "bulk_rows_per_second": round(rows / bulk_seconds, 1),
+        "single_commits_per_second": round(commits / commit_seconds, 1),
+        "list_queries_per_second": round(reads / read_seconds, 1),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--profiles", nargs="+", default=list(SQLITE_PROFILES))
+    parser.add_argument("--rows", type=int, default=20000)
+    parser.add_argument("--reads", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    for profile in args.profiles:
+        print(json.dumps(run_profile(profile, args.rows, args.reads, args.seed)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""Import time and memory of each process role.
+
+Usage (from backend/):
+    python -m benchmarks.startup [--repeat 5] [--top 8]
+
+For each role a fresh interpreter imports what that role loads before it
+can do work: ``app.main`` for the API, the worker module and the enabled
+scrapers for a worker, plus APScheduler for the scheduler. ``monolith`` is
+everything in one process, as before the split. Wall time and peak RSS are
+medians over ``--repeat`` runs; one extra run under ``-X importtime`` gives
+the heaviest third-party packages. Prints one JSON line per role.
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+
+WORKER = (
+    "import app.worker\n"
+    "from app.scrapers import load_scraper\n"
+    "from app.services.scraping_service import EVENT_SCRAPERS, MARKETPLACE_SCRAPERS\n"
+    "for path in [*EVENT_SCRAPERS.values(), *MARKETPLACE_SCRAPERS.values()]: load_scraper(path)\n"
+)
+SCHEDULER = WORKER + "import apscheduler.schedulers.asyncio\n"
+
+ROLES = {
+    "api": "import app.main\n",
+    "worker": WORKER,
+    "scheduler": SCHEDULER,
+    "monolith": "import app.main\n" + SCHEDULER + "load_scraper('app.scrapers.shopee_scraper:ShopeeScraper')\n",
+}
+
+MEASURE = """
+import resource, sys, time, json
+start = time.perf_counter()
+exec(compile({code!r}, "<role>", "exec"))
+elapsed = time.perf_counter() - start
+print(json.dumps({{
+    "import_ms": round(elapsed * 1000, 1),
+    "rss_mb": round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1),
+    "modules": len(sys.modules),
+    "heavy": sorted(m for m in ("httpx", "bs4", "lxml", "fastapi", "numpy", "apscheduler") if m in sys.modules),
+}}))
+"""
+
+
+def _measure(code: str, importtime: bool = False) -> tuple[dict, str]:
+    command = [sys.executable] + (["-X", "importtime"] if importtime else []) + ["-c", MEASURE.format(code=code)]
+    done = subprocess.run(command, capture_output=True, text=True, check=True)
+    return json.loads(done.stdout.strip().splitlines()[-1]), done.stderr
+
+
+def _top_imports(stderr: str, top: int) -> list[list]:
+    """Heaviest packages outside ``app`` (cumulative ms) from ``-X importtime`` output."""
+    packages: dict[str, int] = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        package = name.strip().split(".")[0]
+        if package != "app":
+            # A package's first import includes its submodules; keep the largest
+            packages[package] = max(packages.get(package, 0), int(cumulative))
+    ranked = sorted(packages.items(), key=lambda item: -item[1])[:top]
+    return [[package, round(us / 1000, 1)] for package, us in ranked]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure import time and RSS per process role")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--top", type=int, default=8)
+    parser.add_argument("--role", action="append", choices=list(ROLES))
+    args = parser.parse_args()
+
+    for role in args.role or list(ROLES):
+        runs = [_measure(ROLES[role])[0] for _ in range(args.repeat)]
+        _, stderr = _measure(ROLES[role], importtime=True)
+        print(json.dumps({
+            "role": role,
+            "import_ms": statistics.median(run["import_ms"] for run in runs),
+            "rss_mb": statistics.median(run["rss_mb"] for run in runs),
+            "modules": runs[-1]["modules"],
+            "heavy_modules": runs[-1]["heavy"],
+            "top_imports_ms": _top_imports(stderr, args.top),
+        }))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""Check that the db_writer commits a coalesced group as one transaction.
+
+Usage (from backend/):
+    python -m benchmarks.writer_transactions [--units 20]
+
+Queues ``--units`` units behind a blocking one so they form a single group
+on a scratch SQLite database. Every unit inserts a row and one of them
+raises; midway through, a unit looks at the table from a separate sqlite3
+connection. Nothing may be visible there until the group commits, and
+afterwards every row but the failed unit's must be. Prints one JSON line
+and exits non-zero on a violation.
+"""
+
+import argparse
+import json
+import os
+import sqlite3
+import sys
+import tempfile
+import threading
+
+from sqlalchemy import text
+from sqlalchemy.orm import sessionmaker
+
+from app.database import create_db_engine, sqlite_pragmas
+from app.db_writer import DatabaseWriter
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Check db_writer transaction grouping")
+    parser.add_argument("--units", type=int, default=20)
+    args = parser.parse_args()
+
+    path = os.path.join(tempfile.mkdtemp(prefix="writer_transactions_"), "check.db")
+    engine = create_db_engine(f"sqlite:///{path}", sqlite_pragmas("tuned"))
+    with engine.begin() as conn:
+        conn.execute(text("CREATE TABLE probe (unit INTEGER PRIMARY KEY)"))
+
+    writer = DatabaseWriter(sessionmaker(bind=engine, autoflush=False), max_coalesce=args.units + 1)
+    blocking, release = threading.Event(), threading.Event()
+    failing = args.units // 3
+    observed = {}
+
+    def insert(unit):
+        def work(session):
+            session.execute(text("INSERT INTO probe (unit) VALUES (:unit)"), {"unit": unit})
+            if unit == failing:
+                raise RuntimeError("unit failed on purpose")
+            if unit == args.units // 2:
+                with sqlite3.connect(path) as other:
+                    observed["visible_during_group"] = other.execute("SELECT count(*) FROM probe").fetchone()[0]
+            return unit
+        return work
+
+    def block(session):
+        blocking.set()
+        release.wait()
+
+    # The blocker holds the writer so the units below queue up into one group
+    blocker = writer.submit(block)
+    blocking.wait()
+    futures = [writer.submit(insert(unit)) for unit in range(args.units)]
+    release.set()
+    blocker.result()
+
+    failed = [unit for unit, future in enumerate(futures) if future.exception() is not None]
+    writer.stop()
+    with sqlite3.connect(path) as other:
+        committed = {row[0] for row in other.execute("SELECT unit FROM probe")}
+    engine.dispose()
+
+    expected = set(range(args.units)) - {failing}
+    result = {
+        "units": args.units,
+        "transactions": writer.transactions,
+        "visible_during_group": observed.get("visible_during_group"),
+        "committed": len(committed),
+        "failed_units": failed,
+    }
+    failures = []
+    if result["visible_during_group"] != 0:
+        failures.append(f"{result['visible_during_group']} rows visible before the group committed")
+    if committed != expected:
+        failures.append(f"committed {sorted(committed)} instead of every unit but {failing}")
+    if failed != [failing]:
+        failures.append(f"units {failed} reported failed instead of [{failing}]")
+    if writer.transactions != 2:
+        failures.append(f"{writer.transactions} transactions instead of 2 (blocker + group)")
+    print(json.dumps({**result, "ok": not failures}))
+    if failures:
+        sys.exit("FAIL: " + "; ".join(failures))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""
+Stream events, snapshots or marketplace products to NDJSON or CSV.
+
+    python export_data.py events --format csv -o events.csv --city "São Paulo"
+    python export_data.py products --platform shopee --min-sold 100 > products.ndjson
+    python export_data.py snapshots --date-from 2026-01-01
+
+Filters are those of the list endpoints; rows are streamed in batches, so
+memory stays flat on any table size.
+"""
+
+import argparse
+import sys
+from datetime import date
+
+from app.services.export_service import DATASETS, FORMATS, stream_export
+
+FILTERS = {
+    "events": ("city", "date_from", "date_to", "min_hype", "min_sales_potential", "genre", "state", "q"),
+    "snapshots": ("event_id", "date_from", "date_to", "ticket_status"),
+    "products": ("platform", "related_artist", "category", "min_price", "max_price", "min_sold", "search"),
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Export a table as NDJSON or CSV")
+    parser.add_argument("dataset", choices=DATASETS)
+    parser.add_argument("--format", choices=list(FORMATS), default="ndjson")
+    parser.add_argument("-o", "--output", help="output file (default: stdout)")
+    parser.add_argument("--city", action="append", help="events; repeatable")
+    parser.add_argument("--state", action="append", help="events; repeatable")
+    parser.add_argument("--genre", action="append", help="events; repeatable")
+    parser.add_argument("--date-from", type=date.fromisoformat)
+    parser.add_argument("--date-to", type=date.fromisoformat)
+    parser.add_argument("--min-hype", type=float)
+    parser.add_argument("--min-sales-potential", type=float)
+    parser.add_argument("--q", help="events: full-text search")
+    parser.add_argument("--event-id", type=int, help="snapshots")
+    parser.add_argument("--ticket-status", help="snapshots")
+    parser.add_argument("--platform")
+    parser.add_argument("--related-artist")
+    parser.add_argument("--category")
+    parser.add_argument("--min-price", type=float)
+    parser.add_argument("--max-price", type=float)
+    parser.add_argument("--min-sold", type=int)
+    parser.add_argument("--search", help="products: full-text search")
+    args = parser.parse_args()
+
+    options = vars(args)
+    filters = {name: options[name] for name in FILTERS[args.dataset] if options[name] is not None}
+    out = open(args.output, "wb") if args.output else sys.stdout.buffer
+    try:
+        for chunk in stream_export(args.dataset, args.format, filters):
+            out.write(chunk)
+    finally:
+        if args.output:
+            out.close()
+
+
+if __name__ == "__main__":
+    main()
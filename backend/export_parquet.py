@@ -0,0 +1,37 @@
+"""
+Export events, snapshots, products and scraping logs to partitioned Parquet.
+
+    python export_parquet.py exports/parquet            # append changes since the last run
+    python export_parquet.py exports/parquet --full     # rewrite everything
+    python export_parquet.py exports/parquet --table events --table event_snapshots
+
+Needs pyarrow (in requirements.txt). See manifest.json in the output
+directory for the files and watermarks.
+"""
+
+import argparse
+
+from app.database import ReadSessionLocal
+from app.services.columnar_export_service import TABLES, ColumnarExportService
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Incremental Parquet export of the fact tables")
+    parser.add_argument("root", help="output directory")
+    parser.add_argument("--table", action="append", choices=list(TABLES), help="repeatable (default: all)")
+    parser.add_argument("--full", action="store_true", help="discard the previous export of these tables")
+    parser.add_argument("--compression", default="zstd", choices=["zstd", "snappy", "gzip", "none"])
+    args = parser.parse_args()
+
+    db = ReadSessionLocal()
+    try:
+        service = ColumnarExportService(db, args.root, compression=args.compression)
+        written = service.export(tables=args.table, full=args.full)
+    finally:
+        db.close()
+    for table, rows in written.items():
+        print(f"{table}: {rows} rows")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,38 @@
+"""
+Generate a deterministic synthetic database for benchmarks and load tests.
+
+    python generate_data.py -o perf.db                      # scale 1: 20k events, 1M products
+    python generate_data.py -o small.db --scale 0.05 --seed 7
+    python generate_data.py -o big.db --scale 5 --anchor 2026-06-01
+
+The same --seed, --scale and --anchor give the same rows. Serve the result
+with DATABASE_URL=sqlite:///perf.db (see app.synthetic for the shapes).
+"""
+
+import argparse
+import json
+import time
+from datetime import date
+
+from app.synthetic import counts_for, generate
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Write a synthetic SQLite database")
+    parser.add_argument("-o", "--output", required=True, help="new database file")
+    parser.add_argument("--scale", type=float, default=1.0, help="row counts relative to scale 1")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--anchor", type=date.fromisoformat, help="the generated 'today' (default: today)")
+    parser.add_argument("--dry-run", action="store_true", help="print the row counts only")
+    args = parser.parse_args()
+
+    if args.dry_run:
+        print(json.dumps(counts_for(args.scale)))
+        return
+    start = time.perf_counter()
+    counts = generate(args.output, scale=args.scale, seed=args.seed, anchor=args.anchor)
+    print(json.dumps({**counts, "seconds": round(time.perf_counter() - start, 1)}))
+
+
+if __name__ == "__main__":
+    main()
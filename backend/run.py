@@ -0,0 +1,44 @@
+"""
+Start the process for one role; each role imports only what it runs.
+
+    python run.py                     # APP_ROLE, "api" by default
+    python run.py --role worker       # one scraping pass, then exit (cron)
+    python run.py --role scheduler    # scrape every SCRAPING_INTERVAL_HOURS
+
+The api role serves HTTP and never imports the scraper stack unless a
+scrape is triggered through it. Run several api replicas and a single
+scheduler (or a cron'd worker) against the same database.
+"""
+
+import argparse
+import os
+
+from app.config import settings
+
+ROLES = ("api", "worker", "scheduler")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run the API or a scraping process")
+    parser.add_argument("--role", choices=ROLES, default=settings.APP_ROLE)
+    parser.add_argument("--platform", action="append", help="worker: platforms to scrape; repeatable")
+    args = parser.parse_args()
+
+    if args.role == "api":
+        import uvicorn
+
+        uvicorn.run("app.main:app", host=settings.API_HOST, port=int(os.environ.get("PORT", settings.API_PORT)))
+    elif args.role == "worker":
+        from app.worker import run_worker
+
+        run_worker(args.platform)
+    elif args.role == "scheduler":
+        from app.worker import run_scheduler
+
+        run_scheduler()
+    else:
+        parser.error(f"unknown APP_ROLE {args.role!r} (choose from {', '.join(ROLES)})")
+
+
+if __name__ == "__main__":
+    main()
@@ -11,10 +11,12 @@ from urllib.parse import quote
 import httpx
 
 from app.config import settings
+from app.data_version import bump_data_version
 from app.database import SessionLocal, init_db
 from app.models.artist import Artist
 from app.models.event import Event
 from app.models.marketplace_product import MarketplaceProduct
+from app.services.marketplace_aggregate_service import MarketplaceAggregateService
 
 SHOPEE_API_URL = "https://shopee.com.br/api/v4/search/search_items"
 
@@ -169,6 +171,9 @@ async def main():
 
     # Clear old products
     db.query(MarketplaceProduct).delete()
+    db.flush()
+    MarketplaceAggregateService(db).rebuild()
+    bump_data_version(db, events=False)
     db.commit()
 
     total_saved = 0
@@ -216,6 +221,9 @@ async def main():
             new_in_batch += 1
 
         if new_in_batch > 0:
+            db.flush()
+            MarketplaceAggregateService(db).rebuild()
+            bump_data_version(db, events=False)
             db.commit()
             total_saved += new_in_batch
             print(f"  -> Saved {new_in_batch} products")
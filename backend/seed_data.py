@@ -1,17 +1,9 @@
 """Seed database with real Brazilian show/festival data for 2026."""
 
-from datetime import datetime
+import argparse
 
-from app.analysis.genre_classifier import classify_genre
-from app.analysis.hype_calculator import HypeCalculator
-from app.analysis.production_window import ProductionWindowCalculator
-from app.analysis.sales_predictor import SalesPotentialCalculator
 from app.database import SessionLocal, init_db
-from app.models.artist import Artist
-from app.models.event import Event
-from app.models.event_snapshot import EventSnapshot
-from app.models.venue import Venue
-from app.utils.date_utils import normalize_artist_name
+from app.services.seed_service import SeedService
 
 VENUES_DATA = [
     ("Allianz Parque", "São Paulo", "SP", 45000, "stadium"),
@@ -327,81 +319,10 @@ EVENTS_DATA = [
 def seed():
     init_db()
     db = SessionLocal()
-    hype_calc = HypeCalculator()
-    sales_calc = SalesPotentialCalculator()
-    prod_calc = ProductionWindowCalculator()
-
     try:
-        # Create venues
-        venue_map = {}
-        for name, city, state, capacity, vtype in VENUES_DATA:
-            venue = Venue(
-                name=name, city=city, state=state, capacity=capacity, venue_type=vtype
-            )
-            db.add(venue)
-            db.flush()
-            venue_map[name] = venue
-
-        # Create events
-        artist_map = {}
-        for data in EVENTS_DATA:
-            # Artist
-            artist_name = data["artist"]
-            normalized = normalize_artist_name(artist_name)
-            if normalized not in artist_map:
-                genre = classify_genre(data["title"], artist_name)
-                artist = Artist(
-                    name=artist_name,
-                    normalized_name=normalized,
-                    genre=genre,
-                    popularity_score=70.0 if data["status"] == "sold_out" else 50.0,
-                )
-                db.add(artist)
-                db.flush()
-                artist_map[normalized] = artist
-            else:
-                artist = artist_map[normalized]
-
-            venue = venue_map.get(data["venue"])
-            event = Event(
-                title=data["title"],
-                artist_id=artist.id,
-                venue_id=venue.id if venue else None,
-                event_date=datetime.strptime(data["date"], "%Y-%m-%d"),
-                source_platform="seed",
-                source_url=f"seed://{normalized}/{data['date']}",
-                ticket_status=data["status"],
-                estimated_audience=data.get("audience"),
-                ticket_price_min=data.get("price_min"),
-                ticket_price_max=data.get("price_max"),
-                event_type=data.get("type", "concert"),
-                is_festival=data.get("is_festival", False),
-                headliners=data.get("headliners"),
-            )
-            db.add(event)
-            db.flush()
-
-            # Initial snapshot
-            snapshot = EventSnapshot(
-                event_id=event.id,
-                ticket_status=event.ticket_status,
-                estimated_audience=event.estimated_audience,
-                ticket_price_min=event.ticket_price_min,
-                ticket_price_max=event.ticket_price_max,
-            )
-            db.add(snapshot)
-
-            # Calculate scores
-            hype = hype_calc.calculate(event, [])
-            event.hype_score = hype
-            sales = sales_calc.calculate(event, hype)
-            event.sales_potential_score = sales
-            start, deadline = prod_calc.calculate(event, hype, sales)
-            event.production_start_date = start
-            event.production_deadline = deadline
-
+        counts = SeedService(db).seed_events(VENUES_DATA, EVENTS_DATA)
         db.commit()
-        print(f"Seeded {len(EVENTS_DATA)} events, {len(artist_map)} artists, {len(venue_map)} venues")
+        print(f"Seeded {counts['events']} events, {counts['artists']} artists, {counts['venues']} venues")
 
     except Exception as e:
         db.rollback()
@@ -412,4 +333,16 @@ def seed():
 
 
 if __name__ == "__main__":
-    seed()
+    parser = argparse.ArgumentParser(description="Seed the database with the bundled shows")
+    parser.add_argument(
+        "--output",
+        help="write a prebuilt seed database (shows and marketplace products) here instead; see SEED_DATABASE",
+    )
+    args = parser.parse_args()
+    if args.output:
+        from app.seeding import build_seed_database
+
+        counts = build_seed_database(args.output)
+        print(f"Wrote {args.output}: {counts}")
+    else:
+        seed()
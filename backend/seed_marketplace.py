@@ -1,9 +1,8 @@
 """Seed marketplace_products with realistic Shopee t-shirt data."""
 
-from datetime import datetime
-
 from app.database import SessionLocal, init_db
 from app.models.marketplace_product import MarketplaceProduct
+from app.services.seed_service import SeedService
 
 PRODUCTS = [
     # AC/DC - URLs reais da Shopee
@@ -119,28 +118,8 @@ def seed_marketplace():
     try:
         # Clear existing marketplace data
         db.query(MarketplaceProduct).delete()
-        db.commit()
-
-        for data in PRODUCTS:
-            product = MarketplaceProduct(
-                title=data["title"],
-                price=data["price"],
-                original_price=data.get("original_price"),
-                sold_count=data.get("sold_count", 0),
-                rating=data.get("rating"),
-                review_count=data.get("review_count", 0),
-                seller_name=data.get("seller_name"),
-                seller_location=data.get("seller_location"),
-                platform="shopee",
-                category=data.get("category"),
-                related_artist=data.get("related_artist"),
-                related_event=data.get("related_event"),
-                search_term=data.get("search_term"),
-                product_url=data["product_url"],
-                image_url=None,
-            )
-            db.add(product)
-
+        db.flush()
+        SeedService(db).seed_products(PRODUCTS)
         db.commit()
         print(f"Seeded {len(PRODUCTS)} marketplace products")
 